@@ -0,0 +1,193 @@
+from __future__ import annotations
+import math
+import time
+from typing import Iterable, NamedTuple, Sequence
+import numpy as np
+import random as rnd
+from tarots import Card, Game, Hand, Player, Strategy, _CARDS
+from vector_engine import CALLABLE_MASK, MAGICIAN_INDEX, VectorEngine, make_generator
+
+
+class CallEstimate(NamedTuple):
+    """
+    The estimate of the score of calling a card.
+    Attributes:
+        card (Card): The called card.
+        score (float): The mean points the asking player makes in the simulated games.
+        error (float): The standard error of the mean.
+        playouts (int): The number of simulated games.
+    """
+
+    card: Card
+    score: float
+    error: float
+    playouts: int
+
+
+def callable_cards(hand: Hand | Iterable[Card]) -> list[Card]:
+    """
+    The cards an asking player with a hand can call, as in Game.asking_player_card_request: the cards worth 13
+    not in the hand, the magician only if nothing else is left.
+    Args:
+        hand (Hand | Iterable[Card]): The hand of the asking player, before the prize.
+    Returns:
+        list[Card]: The cards that can be called, empty if the hand holds every card worth 13.
+    Example:
+        >>> len(callable_cards([]))
+        5
+    """
+
+    held = {card.index for card in hand}
+    cards = [card for card in _CARDS if CALLABLE_MASK[card.index] and card.index not in held]
+    if len(cards) > 1:
+        cards = [card for card in cards if card.index != MAGICIAN_INDEX]
+    return cards
+
+
+class CallEvaluator:
+    """
+    An evaluator of the called card: for a hand of the asking player and its seat it plays the same simulated
+    deals once for every card that can be called and ranks the cards by the points the asking player makes.
+    The games of a batch are played in lockstep on a VectorEngine: the hand is given to the seat, the other
+    cards are dealt at random to the other hands and the prize, the seat asks and calls the card, takes the
+    prize as Game.assign_prize does, so a card in the prize means playing alone, exchanges a card with the
+    owner of the called card, discards and plays the deal out. Every card is played on the same deals with the
+    same random choices, so the differences between the cards are not drowned in the luck of the deals.
+    The batches go round the cards until every card has its playouts or the time budget is over.
+    Attributes:
+        playouts (int): The largest number of simulated games of every card.
+        batch_size (int): The number of games played in lockstep at a time.
+        time_budget (float | None): The seconds a ranking may take, at least one batch of every card is played;
+            None for no limit.
+        policy (np.ndarray | None): The card preferences of the play, see VectorEngine.play_tricks.
+        rng (np.random.Generator): The generator of the simulated deals.
+        seconds (float): The time the last ranking took.
+    Methods:
+        __init__(playouts: int = 2000, batch_size: int = 500, time_budget: float | None = 1.0,
+                 policy: np.ndarray | None = None, rng: np.random.Generator | int | None = None):
+            Initializes the evaluator.
+        rank(hand: Hand | Iterable[Card], seat: int, num_players: int, candidates: Sequence[Card] | None = None)
+            -> list[CallEstimate]:
+            Rank the cards that can be called, the best first.
+    """
+
+    def __init__(self, playouts: int = 2000, batch_size: int = 500, time_budget: float | None = 1.0,
+                 policy: np.ndarray | None = None, rng: np.random.Generator | int | None = None):
+        if playouts < 1 or batch_size < 1:
+            raise ValueError("The number of playouts and the batch size must be positive")
+        if time_budget is not None and time_budget <= 0:
+            raise ValueError("The time budget must be positive")
+        self.playouts = playouts
+        self.batch_size = batch_size
+        self.time_budget = time_budget
+        self.policy = policy
+        self.rng = make_generator(rng)
+        self.seconds = 0.0
+        self._engines: dict[int, VectorEngine] = {} #one engine per number of players
+
+    def __repr__(self) -> str:
+        return f"CallEvaluator(playouts={self.playouts}, time_budget={self.time_budget})"
+
+    def rank(self, hand: Hand | Iterable[Card], seat: int, num_players: int,
+             candidates: Sequence[Card] | None = None) -> list[CallEstimate]:
+        """
+        Rank the cards the asking player can call by the mean points they make in the simulated games.
+        Args:
+            hand (Hand | Iterable[Card]): The hand of the asking player, before the prize.
+            seat (int): The seat of the asking player, 0 leads every trick.
+            num_players (int): The number of players.
+            candidates (Sequence[Card] | None): The cards to rank, None for every card that can be called.
+        Returns:
+            list[CallEstimate]: The estimate of every card, the best first; empty if no card can be called.
+        Raises:
+            ValueError: If a candidate is not worth 13 or is in the hand, or the hand does not have the size of
+                the hands dealt.
+        Example:
+            >>> evaluator = CallEvaluator(playouts=500, rng=1)
+            >>> game = Game([Player("Alice"), Player("Bob"), Player("Charlie")], 1)
+            >>> game.setup_deck()
+            >>> ranking = evaluator.rank(game.players[0].hand, 0, 3)
+            >>> best = ranking[0].card
+        """
+
+        start = time.perf_counter()
+        cards = list(hand)
+        indices = np.array([card.index for card in cards], dtype=np.intp)
+        candidates = list(candidates) if candidates is not None else callable_cards(cards)
+        held = set(indices.tolist())
+        for card in candidates:
+            if not CALLABLE_MASK[card.index] or card.index in held:
+                raise ValueError(f"{card} cannot be called")
+        if not candidates:
+            return []
+
+        engine = self._engines.get(num_players)
+        if engine is None:
+            engine = self._engines[num_players] = VectorEngine(num_players)
+        totals = [0.0]*len(candidates)
+        squares = [0.0]*len(candidates)
+        played = 0
+        while played < self.playouts:
+            if self.time_budget is not None and played and time.perf_counter() - start >= self.time_budget:
+                break
+            batch = min(self.batch_size, self.playouts - played)
+            seed = int(self.rng.integers(2**63))
+            for number, card in enumerate(candidates):
+                engine.rng = np.random.default_rng(seed) #the same deals and choices for every card
+                engine.setup(batch, seat, indices, seat, card.index)
+                engine.play_tricks(self.policy)
+                engine.score()
+                scores = engine.score_changes[:, seat].astype(np.float64)
+                totals[number] += scores.sum()
+                squares[number] += (scores*scores).sum()
+            played += batch
+
+        ranking = []
+        for card, total, square in zip(candidates, totals, squares):
+            mean = total/played
+            variance = max(square/played - mean*mean, 0.0)
+            ranking.append(CallEstimate(card, float(mean), math.sqrt(variance/played), played))
+        ranking.sort(key=lambda estimate: estimate.score, reverse=True)
+        self.seconds = time.perf_counter() - start
+        return ranking
+
+
+class CallStrategy(Strategy):
+    """
+    A strategy calling the card the evaluator ranks first instead of a random one. The other decisions are
+    left to the base strategy.
+    Attributes:
+        evaluator (CallEvaluator): The evaluator of the calls.
+        ranking (list[CallEstimate]): The ranking of the last call.
+    Methods:
+        __init__(evaluator: CallEvaluator | None = None, rng: rnd.Random | int | None = None):
+            Initializes the strategy.
+        choose_card(player: Player, available_cards: list[Card], game: Game | None = None) -> Card:
+            Call the card the evaluator ranks first.
+    """
+
+    def __init__(self, evaluator: CallEvaluator | None = None, rng: rnd.Random | int | None = None):
+        super().__init__(rng)
+        self.evaluator = evaluator if evaluator is not None else CallEvaluator()
+        self.ranking: list[CallEstimate] = []
+
+    def __repr__(self) -> str:
+        return f"CallStrategy({self.evaluator!r})"
+
+    def choose_card(self, player: Player, available_cards: list[Card], game: Game | None = None) -> Card:
+        """
+        Call the card the evaluator ranks first among the available cards. Without a game the seat is unknown
+        and the base strategy chooses.
+        Args:
+            player (Player): The player choosing.
+            available_cards (list[Card]): The cards that can be called.
+            game (Game | None): The game being played, if any.
+        Returns:
+            Card: The chosen card.
+        """
+
+        if game is None or len(available_cards) == 1:
+            return super().choose_card(player, available_cards, game)
+        seat = game.players.index(player)
+        self.ranking = self.evaluator.rank(player.hand, seat, game.num_players, available_cards)
+        return self.ranking[0].card
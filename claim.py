@@ -0,0 +1,231 @@
+from __future__ import annotations
+import math
+import time
+from typing import Iterable, NamedTuple
+import numpy as np
+import random as rnd
+from tarots import Card, Game, Hand, Player, Seed, Strategy, SEED_MASKS, _CARDS_BY_RANK
+from vector_engine import VectorEngine, make_generator
+
+
+SUIT_SIZE = 14 #the cards of every seed but the tarots, contiguous in rank space
+NUM_SUITS = 4
+_SUIT_BITS = (1 << SUIT_SIZE) - 1
+_TAROT_MASK = SEED_MASKS[Seed.tarots]
+
+
+def canonical_hand(mask: int) -> int:
+    """
+    The canonical form of a hand for the prize claim: the four seeds other than the tarots have the same points
+    and the same order in a trick, so hands that differ by a permutation of those seeds are worth the same. The
+    seeds are compared in rank space, where the numbered cards of cups and coins are reversed, sorted by their
+    cards, the largest first, and the tarots are kept as they are.
+    Args:
+        mask (int): The hand, as a bitset of card ranks.
+    Returns:
+        int: The canonical hand, as a bitset of card ranks.
+    Example:
+        >>> canonical_hand(Hand([Card(Seed.cups, 14)]).mask) == canonical_hand(Hand([Card(Seed.spades, 14)]).mask)
+        True
+    """
+
+    suits = sorted(((mask >> (SUIT_SIZE*suit)) & _SUIT_BITS for suit in range(NUM_SUITS)), reverse=True)
+    canonical = mask & _TAROT_MASK
+    for suit, bits in enumerate(suits):
+        canonical |= bits << (SUIT_SIZE*suit)
+    return canonical
+
+
+class ClaimEstimate(NamedTuple):
+    """
+    The estimate of the score of claiming the prize.
+    Attributes:
+        score (float): The mean points the asking player makes in the simulated games.
+        error (float): The standard error of the mean.
+        playouts (int): The number of simulated games.
+    """
+
+    score: float
+    error: float
+    playouts: int
+
+
+class ClaimEvaluator:
+    """
+    An evaluator of the prize claim: it estimates the points a player makes by claiming the prize with a hand
+    from a seat, playing out batches of games on a VectorEngine in which the hand is given to the seat, the
+    other cards are dealt at random and the seat asks. The call, the exchange, the discards and the card play
+    follow the engine, at random or by a table-driven policy.
+    The estimates are memoised on the canonical form of the hand (see canonical_hand), so a hand met again, or
+    the same hand with its seeds permuted, is answered without playing. The memo assumes a policy that treats the
+    seeds alike, as the random play does.
+    The claim of an average hand loses points in the simulated play, so the estimate is meant to be compared
+    with the baseline of the seat, the estimate of the claim of a random hand from it.
+    Attributes:
+        playouts (int): The number of simulated games of an estimate.
+        batch_size (int): The number of games played in lockstep at a time.
+        time_budget (float | None): The seconds an estimate may take, at least one batch is played; None for
+            no limit.
+        policy (np.ndarray | None): The card preferences of the play, see VectorEngine.play_tricks.
+        rng (np.random.Generator): The generator of the simulated games.
+        memo (dict[tuple[int, int, int], ClaimEstimate]): The estimates, by number of players, seat and
+            canonical hand, -1 for the baseline.
+        hits (int): The number of estimates answered from the memo.
+    Methods:
+        __init__(playouts: int = 2000, batch_size: int = 500, time_budget: float | None = None,
+                 policy: np.ndarray | None = None, rng: np.random.Generator | int | None = None):
+            Initializes the evaluator.
+        estimate(hand: Hand | Iterable[Card], seat: int, num_players: int) -> ClaimEstimate:
+            Estimate the score of claiming the prize with a hand from a seat.
+        baseline(seat: int, num_players: int) -> ClaimEstimate:
+            Estimate the score of claiming the prize with a random hand from a seat.
+        clear():
+            Forget the memoised estimates.
+    """
+
+    def __init__(self, playouts: int = 2000, batch_size: int = 500, time_budget: float | None = None,
+                 policy: np.ndarray | None = None, rng: np.random.Generator | int | None = None):
+        if playouts < 1 or batch_size < 1:
+            raise ValueError("The number of playouts and the batch size must be positive")
+        if time_budget is not None and time_budget <= 0:
+            raise ValueError("The time budget must be positive")
+        self.playouts = playouts
+        self.batch_size = batch_size
+        self.time_budget = time_budget
+        self.policy = policy
+        self.rng = make_generator(rng)
+        self.memo: dict[tuple[int, int, int], ClaimEstimate] = {}
+        self.hits = 0
+        self._engines: dict[int, VectorEngine] = {} #one engine per number of players, sharing the generator
+
+    def __repr__(self) -> str:
+        return f"ClaimEvaluator(playouts={self.playouts}, {len(self.memo)} estimates)"
+
+    def _simulate(self, num_players: int, seat: int, hand: np.ndarray | None) -> ClaimEstimate:
+        """
+        Play batches of games in which the seat asks, with the hand if one is given, and average its points.
+        """
+
+        engine = self._engines.get(num_players)
+        if engine is None:
+            engine = self._engines[num_players] = VectorEngine(num_players, self.rng)
+        start = time.perf_counter()
+        played = 0
+        total = 0.0
+        squares = 0.0
+        while played < self.playouts:
+            if self.time_budget is not None and played and time.perf_counter() - start >= self.time_budget:
+                break
+            batch = min(self.batch_size, self.playouts - played)
+            engine.setup(batch, seat if hand is not None else None, hand, seat)
+            engine.play_tricks(self.policy)
+            engine.score()
+            scores = engine.score_changes[:, seat].astype(np.float64)
+            total += scores.sum()
+            squares += (scores*scores).sum()
+            played += batch
+        mean = total/played
+        variance = max(squares/played - mean*mean, 0.0)
+        return ClaimEstimate(float(mean), math.sqrt(variance/played), played)
+
+    def estimate(self, hand: Hand | Iterable[Card], seat: int, num_players: int) -> ClaimEstimate:
+        """
+        Estimate the points a player makes by claiming the prize with a hand from a seat.
+        Args:
+            hand (Hand | Iterable[Card]): The hand dealt to the player, before the prize.
+            seat (int): The seat of the player, 0 leads every trick.
+            num_players (int): The number of players.
+        Returns:
+            ClaimEstimate: The estimate, from the memo if the hand or an equivalent one was evaluated.
+        Raises:
+            ValueError: If the hand does not have the size of the hands dealt.
+        Example:
+            >>> evaluator = ClaimEvaluator(playouts=1000, rng=1)
+            >>> game = Game([Player("Alice"), Player("Bob"), Player("Charlie")], 1)
+            >>> game.setup_deck()
+            >>> evaluator.estimate(game.players[0].hand, 0, 3).playouts
+            1000
+        """
+
+        mask = hand.mask if isinstance(hand, Hand) else Hand(list(hand)).mask
+        canonical = canonical_hand(mask)
+        key = (num_players, seat, canonical)
+        estimate = self.memo.get(key)
+        if estimate is not None:
+            self.hits += 1
+            return estimate
+        cards = []
+        while canonical:
+            bit = canonical & -canonical
+            cards.append(_CARDS_BY_RANK[bit.bit_length() - 1].index)
+            canonical ^= bit
+        estimate = self.memo[key] = self._simulate(num_players, seat, np.array(cards, dtype=np.intp))
+        return estimate
+
+    def baseline(self, seat: int, num_players: int) -> ClaimEstimate:
+        """
+        Estimate the points a player makes by claiming the prize with a random hand from a seat.
+        Args:
+            seat (int): The seat of the player.
+            num_players (int): The number of players.
+        Returns:
+            ClaimEstimate: The estimate, memoised for the seat.
+        """
+
+        key = (num_players, seat, -1)
+        estimate = self.memo.get(key)
+        if estimate is None:
+            estimate = self.memo[key] = self._simulate(num_players, seat, None)
+        return estimate
+
+    def clear(self) -> None:
+        """
+        Forget the memoised estimates.
+        """
+
+        self.memo.clear()
+        self.hits = 0
+        return None
+
+
+class ClaimStrategy(Strategy):
+    """
+    A strategy claiming the prize when the evaluator expects the hand to do better from its seat than a random
+    hand by a margin, instead of flipping a coin. The claims go in seat order and stop at the first one, so a
+    strong hand takes the prize and deals are dealt again only when every hand is weak. The other decisions are
+    left to the base strategy.
+    Attributes:
+        evaluator (ClaimEvaluator): The evaluator of the claims.
+        margin (float): The points over the baseline of the seat a hand must be expected to make to claim.
+    Methods:
+        __init__(evaluator: ClaimEvaluator | None = None, margin: float = 0.0, rng: rnd.Random | int | None = None):
+            Initializes the strategy.
+        choice_bool(player: Player, rng: rnd.Random | int | None = None, game: Game | None = None) -> bool:
+            Claim the prize if the hand is expected to beat the baseline of its seat.
+    """
+
+    def __init__(self, evaluator: ClaimEvaluator | None = None, margin: float = 0.0, rng: rnd.Random | int | None = None):
+        super().__init__(rng)
+        self.evaluator = evaluator if evaluator is not None else ClaimEvaluator()
+        self.margin = margin
+
+    def __repr__(self) -> str:
+        return f"ClaimStrategy(margin={self.margin})"
+
+    def choice_bool(self, player: Player, rng: rnd.Random | int | None = None, game: Game | None = None) -> bool:
+        """
+        Claim the prize if the hand of the player is expected to make at least the margin over the baseline of
+        its seat. Without a game the seat is unknown and the base strategy flips a coin.
+        Args:
+            player (Player): The player deciding.
+            rng (rnd.Random | int | None): The generator of the game, used if the strategy has none.
+            game (Game | None): The game being played, if any.
+        Returns:
+            bool: True to claim the prize, False otherwise.
+        """
+
+        if game is None:
+            return super().choice_bool(player, rng, game)
+        seat = game.players.index(player)
+        estimate = self.evaluator.estimate(player.hand, seat, game.num_players)
+        return estimate.score >= self.evaluator.baseline(seat, game.num_players).score + self.margin
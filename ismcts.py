@@ -0,0 +1,330 @@
+from __future__ import annotations
+from array import array
+import math
+import random as rnd
+import time
+from tarots import Beliefs, Card, CardRound, Game, Player, Strategy, CARD_RANKS
+from solver import _POINTS_BY_RANK
+from pimc import Observation, _trick_state, observe, rollout, sample_hands
+
+
+class SearchTree:
+    """
+    The tree of an information-set Monte Carlo tree search, stored as parallel arrays instead of node objects:
+    a node is an index and costs 26 bytes, so a tree of a million nodes fits in a few tens of megabytes.
+    The children of a node form a linked list through first_child and next_sibling. Node 0 is the root.
+    Attributes:
+        action (array): The rank of the card played to reach every node, -1 for the root.
+        seat (array): The seat that played the card of every node.
+        first_child (array): The first child of every node, -1 for none.
+        next_sibling (array): The next child of the parent of every node, -1 for none.
+        visits (array): The number of iterations through every node.
+        available (array): The number of iterations in which the card of every node was legal.
+        reward (array): The total reward of every node, for the side of the seat that played its card.
+    Methods:
+        add(parent: int, action: int, seat: int) -> int:
+            Add a child to a node and return it.
+        child(node: int, action: int) -> int:
+            Find the child of a node reached by a card.
+        subtree(node: int) -> SearchTree:
+            Copy the subtree of a node into a new tree rooted at it.
+    """
+
+    def __init__(self):
+        self.action = array("b", [-1])
+        self.seat = array("b", [-1])
+        self.first_child = array("i", [-1])
+        self.next_sibling = array("i", [-1])
+        self.visits = array("i", [0])
+        self.available = array("i", [0])
+        self.reward = array("d", [0.0])
+
+    def __len__(self) -> int:
+        return len(self.action)
+
+    def __repr__(self) -> str:
+        return f"SearchTree({len(self)} nodes)"
+
+    def add(self, parent: int, action: int, seat: int) -> int:
+        """
+        Add a child to a node.
+        Args:
+            parent (int): The node.
+            action (int): The rank of the card of the child.
+            seat (int): The seat playing the card.
+        Returns:
+            int: The new node.
+        """
+
+        node = len(self.action)
+        self.action.append(action)
+        self.seat.append(seat)
+        self.first_child.append(-1)
+        self.next_sibling.append(self.first_child[parent])
+        self.first_child[parent] = node
+        self.visits.append(0)
+        self.available.append(0)
+        self.reward.append(0.0)
+        return node
+
+    def child(self, node: int, action: int) -> int:
+        """
+        Find the child of a node reached by a card.
+        Args:
+            node (int): The node.
+            action (int): The rank of the card.
+        Returns:
+            int: The child, -1 if the card was never tried.
+        """
+
+        child = self.first_child[node]
+        while child >= 0 and self.action[child] != action:
+            child = self.next_sibling[child]
+        return child
+
+    def subtree(self, node: int) -> SearchTree:
+        """
+        Copy the subtree of a node into a new tree rooted at it, dropping the rest of the tree.
+        Args:
+            node (int): The new root.
+        Returns:
+            SearchTree: The subtree.
+        """
+
+        tree = SearchTree()
+        tree.visits[0] = self.visits[node]
+        tree.available[0] = self.available[node]
+        tree.reward[0] = self.reward[node]
+        stack = [(node, 0)]
+        while stack:
+            old, new = stack.pop()
+            child = self.first_child[old]
+            while child >= 0:
+                copy = tree.add(new, self.action[child], self.seat[child])
+                tree.visits[copy] = self.visits[child]
+                tree.available[copy] = self.available[child]
+                tree.reward[copy] = self.reward[child]
+                stack.append((child, copy))
+                child = self.next_sibling[child]
+        return tree
+
+
+class ISMCTSStrategy(Strategy):
+    """
+    An information-set Monte Carlo tree search strategy for the card play. Every iteration deals the cards the
+    player has not seen again within its Beliefs (a determinisation), walks down one tree shared by all deals
+    choosing among the cards legal in that deal by UCB, where a card is scored for the side of the seat playing
+    it and explored relative to the number of iterations it was legal, adds one node, plays the deal out
+    greedily and backs the points of the team of the player up the path.
+    The tree is kept between the decisions of a deal: at the next card the cards played since are followed down
+    the tree and their subtree becomes the new root. Only the visits below the cards actually played carry over,
+    and since every iteration adds one node and the replies of the others are spread over many deals, that is
+    little in the middle of a deal: at a tenth of a second per card, a handful of visits out of a few hundred.
+    The reuse grows over the last tricks, where the replies are few. One strategy should be used by one player
+    for the reuse to apply. The other decisions are left to the base strategy.
+    Attributes:
+        time_budget (float): The seconds of search for every card.
+        max_iterations (int | None): The largest number of iterations for every card, None for no limit.
+        max_nodes (int): The size of the tree beyond which no node is added.
+        exploration (float): The exploration constant of UCB.
+        tree (SearchTree | None): The tree of the current deal.
+        iterations (int): The number of iterations of the last decision.
+        iterations_per_second (float): The iterations per second of the last decision.
+        reused_visits (int): The visits of the root reused from the previous decisions at the last decision,
+            small until the last tricks of a deal.
+        beliefs (Beliefs | None): What the player deduces of the hidden hands in the current deal, brought up to
+            date card by card at every decision.
+    Methods:
+        __init__(time_budget: float = 1.0, max_iterations: int | None = None, max_nodes: int = 1_000_000,
+                 exploration: float = 0.7, rng: rnd.Random | int | None = None):
+            Initializes the strategy.
+        search(player: Player, available_cards: list[Card], game: Game) -> dict[Card, int]:
+            Search the current decision and return the visits of every card.
+        choose_own_card(player: Player, available_cards: list[Card], game: Game | None = None) -> Card:
+            Choose the most visited card, or a card to give with the base strategy.
+    """
+
+    def __init__(self, time_budget: float = 1.0, max_iterations: int | None = None, max_nodes: int = 1_000_000,
+                 exploration: float = 0.7, rng: rnd.Random | int | None = None):
+        super().__init__(rng)
+        if time_budget <= 0:
+            raise ValueError("The time budget must be positive")
+        self.time_budget = time_budget
+        self.max_iterations = max_iterations
+        self.max_nodes = max_nodes
+        self.exploration = exploration
+        self.tree: SearchTree | None = None
+        self.iterations = 0
+        self.iterations_per_second = 0.0
+        self.reused_visits = 0
+        self.beliefs: Beliefs | None = None
+        self._deal: tuple | None = None #the deal the tree belongs to
+        self._history: list[int] = [] #the ranks of the cards played in the deal when the tree was rooted
+
+    def __repr__(self) -> str:
+        return f"ISMCTSStrategy(time_budget={self.time_budget}, max_iterations={self.max_iterations})"
+
+    @staticmethod
+    def _played(game: Game) -> list[int]:
+        """
+        The ranks of the cards played in the deal so far, in order.
+        """
+
+        history = [CARD_RANKS[played.index] for card_round in game.rounds for played in card_round.played_cards]
+        current = game.current_round
+        if current is not None and len(current.played_cards) < game.num_players:
+            history.extend(CARD_RANKS[played.index] for played in current.played_cards)
+        return history
+
+    def _root(self, player: Player, game: Game) -> SearchTree:
+        """
+        The tree rooted at the current decision: the subtree of the cards played since the last decision if the
+        tree belongs to this deal and holds them, a new tree otherwise.
+        """
+
+        history = self._played(game)
+        seat = game.players.index(player)
+        start_hand = player.hand.mask #the starting hand tells apart the deals of a game reused by reset
+        for rank in history[seat::game.num_players]:
+            start_hand |= 1 << rank
+        deal = (id(game), seat, start_hand, game.players.index(game.asking_player), game.called_card)
+        tree = self.tree
+        same_deal = self._deal == deal and history[:len(self._history)] == self._history
+        if not same_deal or self.beliefs is None:
+            self.beliefs = Beliefs.from_game(player, game)
+        if tree is not None and same_deal:
+            node = 0
+            for rank in history[len(self._history):]:
+                node = tree.child(node, rank)
+                if node < 0:
+                    break
+            if node > 0:
+                tree = tree.subtree(node)
+            elif node < 0:
+                tree = None
+        else:
+            tree = None
+        if tree is None:
+            tree = SearchTree()
+        self.tree = tree
+        self._deal = deal
+        self._history = history
+        return tree
+
+    def _iterate(self, tree: SearchTree, observation: Observation, rng: rnd.Random, total: int) -> None:
+        """
+        Run one iteration: deal, select, expand, play out and back the reward up.
+        """
+
+        hands = sample_hands(observation, rng)
+        trick = list(observation.trick)
+        sides = observation.sides
+        num_seats = len(hands)
+        points = 0
+        node = 0
+        path = []
+        expanded = False
+        exploration = self.exploration
+        visits, available, reward = tree.visits, tree.available, tree.reward
+        while hands[0] or trick:
+            if len(trick) == num_seats:
+                _, _, winner = _trick_state(trick)
+                if sides[winner]:
+                    points += sum(_POINTS_BY_RANK[rank] for rank in trick)
+                trick.clear()
+                continue
+            if expanded:
+                break
+            seat = len(trick)
+            lead, _, _ = _trick_state(trick)
+            legal = CardRound.legal_mask(hands[seat], lead)
+
+            best, best_score = -1, -1.0
+            child = tree.first_child[node]
+            while child >= 0: #the children of the cards legal in this deal
+                bit = 1 << tree.action[child]
+                if legal & bit:
+                    legal ^= bit
+                    available[child] += 1
+                    score = reward[child]/visits[child] + exploration*math.sqrt(math.log(available[child])/visits[child])
+                    if score > best_score:
+                        best, best_score = child, score
+                child = tree.next_sibling[child]
+            if legal and len(tree) < self.max_nodes: #a legal card never tried: add it
+                ranks = []
+                while legal:
+                    bit = legal & -legal
+                    ranks.append(bit.bit_length() - 1)
+                    legal ^= bit
+                best = tree.add(node, rng.choice(ranks), seat)
+                available[best] += 1
+                expanded = True
+            elif best < 0: #the tree is full
+                break
+            rank = tree.action[best]
+            hands[seat] ^= 1 << rank
+            trick.append(rank)
+            path.append(best)
+            node = best
+
+        points += rollout(hands, sides, trick, rng)
+        value = points/total if total else 0.5
+        visits[0] += 1
+        for node in path:
+            visits[node] += 1
+            reward[node] += value if sides[tree.seat[node]] else 1.0 - value
+
+    def search(self, player: Player, available_cards: list[Card], game: Game) -> dict[Card, int]:
+        """
+        Search the current decision until the time budget or the iteration limit, reusing the tree of the deal.
+        Args:
+            player (Player): The player to move.
+            available_cards (list[Card]): The legal cards.
+            game (Game): The game being played.
+        Returns:
+            dict[Card, int]: The visits of the root to every card.
+        Example:
+            >>> game = Game([Player("Alice"), Player("Bob"), Player("Charlie")], 1)
+            >>> game.setup_game()
+            >>> strategy = ISMCTSStrategy(time_budget=0.2)
+            >>> visits = strategy.search(game.to_move, game.legal_moves(), game)
+        """
+
+        start = time.perf_counter()
+        tree = self._root(player, game)
+        self.reused_visits = tree.visits[0]
+        observation = observe(player, game, self.beliefs)
+        total = sum(_POINTS_BY_RANK[rank] for rank in observation.trick)
+        total += sum(other.hand.value for other in game.players)
+        rng = self._rng(game.rng)
+        iterations = 0
+        while time.perf_counter() - start < self.time_budget:
+            if self.max_iterations is not None and iterations >= self.max_iterations:
+                break
+            self._iterate(tree, observation, rng, total)
+            iterations += 1
+        elapsed = time.perf_counter() - start
+        self.iterations = iterations
+        self.iterations_per_second = iterations/elapsed if elapsed > 0 else 0.0
+        visits = {}
+        for card in available_cards:
+            child = tree.child(0, CARD_RANKS[card.index])
+            visits[card] = tree.visits[child] if child >= 0 else 0
+        return visits
+
+    def choose_own_card(self, player: Player, available_cards: list[Card], game: Game | None = None) -> Card:
+        """
+        Choose the card the search visited most. The card given to the partner in the exchange is chosen by the
+        base strategy.
+        Args:
+            player (Player): The player choosing.
+            available_cards (list[Card]): The legal cards.
+            game (Game | None): The game being played, if any.
+        Returns:
+            Card: The chosen card.
+        """
+
+        if game is None or game.current_round is None or len(available_cards) == 1:
+            return super().choose_own_card(player, available_cards, game)
+        visits = self.search(player, available_cards, game)
+        return max(available_cards, key=visits.__getitem__)
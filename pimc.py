@@ -0,0 +1,435 @@
+from __future__ import annotations
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from functools import lru_cache
+from typing import NamedTuple, Sequence
+import random as rnd
+import time
+from tarots import Beliefs, Card, CardRound, Game, Player, Seed, Strategy, CARD_RANKS, _ALL_CARDS_MASK, _CARDS_BY_RANK
+from solver import DoubleDummySolver, _FOOL_RANK, _POINTS_BY_RANK, _SEED_BY_RANK, _STRENGTH_BY_RANK
+from sampler import DealSampler
+
+
+class Observation(NamedTuple):
+    """
+    What a player knows of a game at a card decision, as rank bitsets like Hand.mask: enough to deal the hidden
+    cards again and to play the deal out, and small enough to be sent to the processes of a pool.
+    Attributes:
+        seat (int): The seat of the player.
+        hand (int): The hand of the player.
+        unseen (int): The cards the player has not seen, in the hands of the others or among the discards.
+        fixed (tuple[int, ...]): The cards known to be in the hand of every seat, like the called card held by
+            the asking player.
+        excluded (tuple[int, ...]): The cards every seat cannot hold: the seeds it has shown it lacks and the
+            cards it is known not to hold, like a called tarot the asking player may have discarded.
+        sizes (tuple[int, ...]): The number of cards in the hand of every seat.
+        trick (tuple[int, ...]): The ranks of the cards of the trick in progress.
+        sides (tuple[bool, ...]): True for the seats of the team of the player.
+    """
+
+    seat: int
+    hand: int
+    unseen: int
+    fixed: tuple[int, ...]
+    excluded: tuple[int, ...]
+    sizes: tuple[int, ...]
+    trick: tuple[int, ...]
+    sides: tuple[bool, ...]
+
+
+def observe(player: Player, game: Game, beliefs: Beliefs | None = None) -> Observation:
+    """
+    Collect what a player knows of a game during the card play: what its Beliefs deduce, which holds the cards
+    played, seen and known and the seeds every player lacks, the hand sizes, and the teams, which the exchange
+    of the called card reveals.
+    Args:
+        player (Player): The player deciding.
+        game (Game): The game being played.
+        beliefs (Beliefs | None): The beliefs of the player, brought up to date with the game; built from the
+            game if None.
+    Returns:
+        Observation: The knowledge of the player.
+    Example:
+        >>> game = Game([Player("Alice"), Player("Bob"), Player("Charlie")], 1)
+        >>> game.setup_game()
+        >>> observe(game.players[1], game).seat
+        1
+    """
+
+    players = game.players
+    seat = players.index(player)
+    if beliefs is None:
+        beliefs = Beliefs.from_game(player, game)
+    else:
+        beliefs.update(game)
+    trick: tuple[int, ...] = ()
+    current = game.current_round
+    if current is not None and len(current.played_cards) < game.num_players:
+        trick = tuple(CARD_RANKS[played_card.index] for played_card in current.played_cards)
+
+    fixed = [0 if other == seat else known for other, known in enumerate(beliefs.known)]
+    known = player.hand.mask | beliefs.played | beliefs.seen
+    for mask in fixed:
+        known |= mask
+
+    team = game.find_team(player).players
+    return Observation(
+        seat,
+        player.hand.mask,
+        _ALL_CARDS_MASK & ~known,
+        tuple(fixed),
+        tuple(voids | excluded for voids, excluded in zip(beliefs.voids, beliefs.excluded)),
+        tuple(len(other.hand) for other in players),
+        trick,
+        tuple(other in team for other in players),
+    )
+
+
+#the cards the asking player cannot discard: the 13-point cards other than tarots
+_UNDISCARDABLE: int = sum(1 << rank for rank, card in enumerate(_CARDS_BY_RANK) if card.value == 13 and card.seed != Seed.tarots)
+
+
+@lru_cache(maxsize=64)
+def deal_sampler(observation: Observation) -> DealSampler:
+    """
+    The sampler of the hidden cards of an observation: one slot per other seat, holding its hand minus the known
+    cards and excluding the seeds it lacks, and a last slot for the discards of the asking player if the player
+    has not seen them, which cannot hold a 13-point card other than a tarot. Samplers are cached, so the
+    counting is done once per observation.
+    Args:
+        observation (Observation): The knowledge of the player.
+    Returns:
+        DealSampler: The sampler.
+    """
+
+    sizes, excluded = [], []
+    for seat, size in enumerate(observation.sizes):
+        if seat != observation.seat:
+            sizes.append(size - observation.fixed[seat].bit_count())
+            excluded.append(observation.excluded[seat])
+    discards = observation.unseen.bit_count() - sum(sizes)
+    if discards:
+        sizes.append(discards)
+        excluded.append(_UNDISCARDABLE)
+    try:
+        return DealSampler(observation.unseen, sizes, excluded)
+    except ValueError: #the exclusions rule out every deal: deal without them
+        return DealSampler(observation.unseen, sizes, [0]*len(sizes))
+
+
+def sample_hands(observation: Observation, rng: rnd.Random) -> list[int]:
+    """
+    Deal the unseen cards to the other seats, every deal consistent with the known cards, the hand sizes and
+    the seeds the players lack having the same probability (see DealSampler).
+    Args:
+        observation (Observation): The knowledge of the player.
+        rng (rnd.Random): The generator of the deal.
+    Returns:
+        list[int]: The hand of every seat, as a bitset.
+    """
+
+    return _hands(observation, deal_sampler(observation).sample(rng))
+
+
+def sample_deals(observation: Observation, count: int, rng: rnd.Random) -> list[list[int]]:
+    """
+    Deal the unseen cards a number of times, as sample_hands does.
+    Args:
+        observation (Observation): The knowledge of the player.
+        count (int): The number of deals.
+        rng (rnd.Random): The generator of the deals.
+    Returns:
+        list[list[int]]: The hands of every seat of every deal.
+    """
+
+    return [_hands(observation, deal) for deal in deal_sampler(observation).sample_batch(count, rng)]
+
+
+def _hands(observation: Observation, deal: list[int]) -> list[int]:
+    """
+    The hands of every seat from the slots of a deal.
+    """
+
+    hands = []
+    slot = 0
+    for seat in range(len(observation.sizes)):
+        if seat == observation.seat:
+            hands.append(observation.hand)
+        else:
+            hands.append(observation.fixed[seat] | deal[slot])
+            slot += 1
+    return hands
+
+
+def _trick_state(trick: Sequence[int]) -> tuple[object, int, int]:
+    """
+    The lead seed, the strength of the card taking the trick and its seat.
+    """
+
+    lead = None
+    for rank in trick:
+        if rank != _FOOL_RANK:
+            lead = _SEED_BY_RANK[rank]
+            break
+    best_strength, best_seat = 0, -1
+    for seat, rank in enumerate(trick):
+        strength = _STRENGTH_BY_RANK[lead][rank] if lead is not None else 0
+        if best_seat < 0 or strength > best_strength:
+            best_strength, best_seat = strength, seat
+    return lead, best_strength, best_seat
+
+
+def rollout(hands: list[int], sides: Sequence[bool], trick: list[int], rng: rnd.Random) -> int:
+    """
+    Play a deal out with a fast greedy policy: the leader plays a random card, a follower whose side takes the
+    trick gives its most valuable card, otherwise it takes the trick with its weakest winning card if it can,
+    or gives its cheapest card.
+    Args:
+        hands (list[int]): The hand of every seat, as a bitset, changed in place.
+        sides (Sequence[bool]): True for the seats of the side whose points are counted.
+        trick (list[int]): The ranks of the cards of the trick in progress, changed in place.
+        rng (rnd.Random): The generator of the leads.
+    Returns:
+        int: The points the side takes from the trick in progress to the end.
+    """
+
+    num_seats = len(hands)
+    points = 0
+    while hands[0] or trick:
+        if len(trick) == num_seats:
+            _, _, winner = _trick_state(trick)
+            if sides[winner]:
+                points += sum(_POINTS_BY_RANK[rank] for rank in trick)
+            trick.clear()
+            continue
+
+        seat = len(trick)
+        lead, best_strength, best_seat = _trick_state(trick)
+        legal = CardRound.legal_mask(hands[seat], lead)
+        ranks = []
+        while legal:
+            bit = legal & -legal
+            ranks.append(bit.bit_length() - 1)
+            legal ^= bit
+
+        if not trick:
+            rank = rng.choice(ranks)
+        else:
+            strengths = _STRENGTH_BY_RANK[lead] if lead is not None else None
+            if sides[best_seat] == sides[seat]:
+                rank = max(ranks, key=lambda rank: (_POINTS_BY_RANK[rank], -rank))
+            else:
+                winners = [rank for rank in ranks if strengths is None or strengths[rank] > best_strength]
+                if winners:
+                    rank = min(winners, key=lambda rank: strengths[rank] if strengths is not None else rank)
+                else:
+                    rank = min(ranks, key=lambda rank: (_POINTS_BY_RANK[rank], rank))
+        hands[seat] ^= 1 << rank
+        trick.append(rank)
+    return points
+
+
+def evaluate_samples(observation: Observation, moves: Sequence[int], deals: Sequence[list[int]], seed: int,
+                     exact_cards: int = 0) -> list[int]:
+    """
+    Play every move on deals of the hidden cards, either solved exactly with DoubleDummySolver when the hands
+    are small or played out with rollout. All moves see the same deals and the same leads, so their differences
+    come from the moves only. The deals are drawn by the caller (see sample_deals), so the processes of a pool
+    do not build the sampler of the observation again.
+    Args:
+        observation (Observation): The knowledge of the player.
+        moves (Sequence[int]): The ranks of the legal cards.
+        deals (Sequence[list[int]]): The hands of every seat of every deal.
+        seed (int): The seed of the leads of the playouts.
+        exact_cards (int): The largest hand solved exactly, 0 to always play out.
+    Returns:
+        list[int]: The total points of the team of the player over the deals, for every move.
+    """
+
+    rng = rnd.Random(seed)
+    totals = [0]*len(moves)
+    sides = observation.sides
+    for deal in deals:
+        playout_seed = rng.getrandbits(64)
+        for number, rank in enumerate(moves):
+            hands = deal.copy()
+            trick = list(observation.trick)
+            hands[observation.seat] ^= 1 << rank
+            trick.append(rank)
+            points = 0
+            if len(trick) == len(hands): #the move ends the trick
+                _, _, winner = _trick_state(trick)
+                if sides[winner]:
+                    points = sum(_POINTS_BY_RANK[rank] for rank in trick)
+                trick = []
+            if max(hand.bit_count() for hand in hands) <= exact_cards:
+                solver = DoubleDummySolver(
+                    [[_CARDS_BY_RANK[rank] for rank in range(len(_CARDS_BY_RANK)) if hand >> rank & 1] for hand in hands],
+                    sides,
+                    [_CARDS_BY_RANK[rank] for rank in trick],
+                )
+                points += solver.solve()["asking"]
+            else:
+                points += rollout(hands, sides, trick, rnd.Random(playout_seed))
+            totals[number] += points
+    return totals
+
+
+class PIMCStrategy(Strategy):
+    """
+    A perfect-information Monte Carlo strategy for the card play: at every card to play it deals the cards it has
+    not seen again, consistently with what it knows and deduces (see Beliefs), plays each legal card on every
+    deal, solving small endings exactly and playing the rest out greedily, and plays the card with the best
+    average for its team.
+    The deals are evaluated in chunks, in a process pool when there is more than one worker, until the number of
+    samples is reached or the time budget runs out. The deals are drawn in the calling process, so the sampler of
+    the observation, which may take a while to build when the players have shown many voids, is built once per
+    decision and within its time budget. A chunk cannot be stopped once it runs, so the chunks still
+    running when the time runs out are waited for before the next decision submits its own: the next decision
+    may start up to one chunk late, and a smaller chunk_size bounds that delay. The other decisions are left to
+    the base strategy.
+    Attributes:
+        samples (int): The largest number of deals per card played.
+        time_budget (float | None): The seconds a card decision may take, None for no limit. At least one chunk
+            of deals is always evaluated.
+        workers (int): The number of processes evaluating deals, 1 to evaluate them in the calling process.
+        exact_cards (int): The largest hand size solved exactly instead of played out.
+        chunk_size (int): The number of deals of a task.
+        last_samples (int): The number of deals evaluated for the last card played.
+    Methods:
+        __init__(samples: int = 200, time_budget: float | None = 1.0, workers: int = 1, exact_cards: int = 4,
+                 chunk_size: int = 16, rng: rnd.Random | int | None = None):
+            Initializes the strategy.
+        evaluate(player: Player, available_cards: list[Card], game: Game) -> dict[Card, float]:
+            Estimate the points of the team of the player for every card.
+        choose_own_card(player: Player, available_cards: list[Card], game: Game | None = None) -> Card:
+            Choose the card with the best estimate, or a card to give with the base strategy.
+        close() -> None:
+            Shut the process pool down.
+    """
+
+    def __init__(self, samples: int = 200, time_budget: float | None = 1.0, workers: int = 1, exact_cards: int = 4,
+                 chunk_size: int = 16, rng: rnd.Random | int | None = None):
+        super().__init__(rng)
+        if samples < 1 or workers < 1 or chunk_size < 1:
+            raise ValueError("samples, workers and chunk_size must be positive")
+        self.samples = samples
+        self.time_budget = time_budget
+        self.workers = workers
+        self.exact_cards = exact_cards
+        self.chunk_size = chunk_size
+        self.last_samples = 0
+        self._pool: ProcessPoolExecutor | None = None
+        self._running: set[Future] = set() #the chunks of a past decision still running in the pool
+
+    def __repr__(self) -> str:
+        return f"PIMCStrategy(samples={self.samples}, time_budget={self.time_budget}, workers={self.workers})"
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        state["_pool"] = None #a pool cannot be pickled: a copy of the strategy starts its own
+        state["_running"] = set()
+        return state
+
+    def close(self) -> None:
+        """
+        Shut the process pool down, if it was started.
+        """
+
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
+        self._running.clear()
+        return None
+
+    def evaluate(self, player: Player, available_cards: list[Card], game: Game) -> dict[Card, float]:
+        """
+        Estimate the points the team of the player takes from now to the end of the deal for every card.
+        Args:
+            player (Player): The player to move.
+            available_cards (list[Card]): The legal cards.
+            game (Game): The game being played.
+        Returns:
+            dict[Card, float]: The average points of the team of the player for every card.
+        Example:
+            >>> game = Game([Player("Alice"), Player("Bob"), Player("Charlie")], 1)
+            >>> game.setup_game()
+            >>> strategy = PIMCStrategy(samples=32, time_budget=None)
+            >>> scores = strategy.evaluate(game.to_move, game.legal_moves(), game)
+        """
+
+        if self._running: #the workers must be free before this decision's clock starts
+            wait(self._running)
+            self._running.clear()
+        start = time.perf_counter()
+        observation = observe(player, game)
+        moves = [CARD_RANKS[card.index] for card in available_cards]
+        rng = self._rng(game.rng)
+        totals = [0]*len(moves)
+        done = 0
+
+        def out_of_time() -> bool:
+            return self.time_budget is not None and time.perf_counter() - start >= self.time_budget
+
+        def add(chunk: list[int], size: int) -> None:
+            nonlocal done
+            for number, points in enumerate(chunk):
+                totals[number] += points
+            done += size
+
+        if self.workers == 1:
+            while done < self.samples and not (done and out_of_time()):
+                size = min(self.chunk_size, self.samples - done)
+                deals = sample_deals(observation, size, rng)
+                add(evaluate_samples(observation, moves, deals, rng.getrandbits(64), self.exact_cards), size)
+        else:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(max_workers=self.workers)
+            pending: dict[Future, int] = {}
+            submitted = 0
+
+            def submit() -> None:
+                nonlocal submitted
+                size = min(self.chunk_size, self.samples - submitted)
+                deals = sample_deals(observation, size, rng) #the sampler is built once, in this process
+                future = self._pool.submit(evaluate_samples, observation, moves, deals, rng.getrandbits(64), self.exact_cards)
+                pending[future] = size
+                submitted += size
+
+            while submitted < self.samples and len(pending) < self.workers:
+                submit()
+            while pending:
+                timeout = None
+                if self.time_budget is not None and done:
+                    timeout = max(0.0, self.time_budget - (time.perf_counter() - start))
+                finished, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+                if not finished: #out of time: the chunks still running are dropped
+                    break
+                for future in finished:
+                    add(future.result(), pending.pop(future))
+                    if submitted < self.samples and not out_of_time():
+                        submit()
+                if done and out_of_time():
+                    break
+            for future in pending: #a queued chunk is cancelled, a running one is waited for at the next decision
+                if not future.cancel():
+                    self._running.add(future)
+
+        self.last_samples = done
+        return {card: total/done for card, total in zip(available_cards, totals)}
+
+    def choose_own_card(self, player: Player, available_cards: list[Card], game: Game | None = None) -> Card:
+        """
+        Choose the card with the best estimate for the team of the player. The card given to the partner in the
+        exchange is chosen by the base strategy.
+        Args:
+            player (Player): The player choosing.
+            available_cards (list[Card]): The legal cards.
+            game (Game | None): The game being played, if any.
+        Returns:
+            Card: The chosen card.
+        """
+
+        if game is None or game.current_round is None or len(available_cards) == 1:
+            return super().choose_own_card(player, available_cards, game)
+        scores = self.evaluate(player, available_cards, game)
+        return max(available_cards, key=scores.__getitem__)
@@ -0,0 +1,171 @@
+from __future__ import annotations
+from bisect import bisect_right
+from math import comb
+from typing import Iterator, Sequence
+import random as rnd
+
+
+def _compositions(total: int, caps: Sequence[int]) -> Iterator[tuple[int, ...]]:
+    """
+    The ways to split a number of cards among slots without going over their capacities.
+    """
+
+    if len(caps) == 1:
+        if total <= caps[0]:
+            yield (total,)
+        return
+    rest = sum(caps[1:])
+    for first in range(max(0, total - rest), min(total, caps[0]) + 1):
+        for tail in _compositions(total - first, caps[1:]):
+            yield (first,) + tail
+
+
+class DealSampler:
+    """
+    A sampler of the deals of a set of cards to slots (the hidden hands, and the discards of the asking player)
+    with exact sizes, where every slot may exclude some cards, drawing every consistent deal with the same
+    probability and without rejection, so it stays fast however many voids the players have shown.
+    The cards are grouped by the set of slots that may hold them. A deal is a number of cards of every group
+    for every slot, weighted by the ways to pick them; the number of completions of every partial deal is
+    counted once, group by group, and memoised with the running totals of the splits, then every sample draws
+    the split of each group by bisection. The group open to the most slots is split last, in closed form.
+    Building the sampler does the counting, so one sampler should serve a whole batch.
+    Attributes:
+        slots (int): The number of slots.
+        sizes (tuple[int, ...]): The number of cards of every slot.
+        groups (list[tuple[list[int], tuple[int, ...]]]): The bits of the cards of every group and the slots
+            that may hold them.
+        total (int): The number of consistent deals.
+    Methods:
+        __init__(cards: int, sizes: Sequence[int], excluded: Sequence[int]):
+            Initializes the sampler of the deals of a bitset of cards.
+        sample(rng: rnd.Random) -> list[int]:
+            Draw a deal.
+        sample_batch(count: int, rng: rnd.Random) -> list[list[int]]:
+            Draw many deals.
+    """
+
+    def __init__(self, cards: int, sizes: Sequence[int], excluded: Sequence[int]):
+        if len(sizes) != len(excluded):
+            raise ValueError("There must be one exclusion mask per slot")
+        if cards.bit_count() != sum(sizes):
+            raise ValueError(f"{cards.bit_count()} cards cannot fill slots of {sum(sizes)} cards")
+        self.slots = len(sizes)
+        self.sizes = tuple(sizes)
+
+        by_slots: dict[tuple[int, ...], list[int]] = {}
+        mask = cards
+        while mask:
+            bit = mask & -mask
+            mask ^= bit
+            allowed = tuple(slot for slot in range(self.slots) if not excluded[slot] & bit and sizes[slot])
+            by_slots.setdefault(allowed, []).append(bit)
+        if () in by_slots:
+            raise ValueError("No deal is consistent with the exclusions")
+        self.groups = sorted(((bits, allowed) for allowed, bits in by_slots.items()), key=lambda group: (len(group[1]), len(group[0])))
+        self._memo: dict[tuple[int, tuple[int, ...]], int] = {}
+        #the splits of a group for given capacities with the running total of their deals, to draw by bisection
+        self._tables: dict[tuple[int, tuple[int, ...]], tuple[list[tuple[int, ...]], list[int]]] = {}
+        self.total = self._count(0, self.sizes)
+        if not self.total:
+            raise ValueError("No deal is consistent with the exclusions")
+
+    def __repr__(self) -> str:
+        return f"DealSampler({self.slots} slots, {len(self.groups)} groups, {self.total} deals)"
+
+    def _splits(self, number: int, caps: tuple[int, ...]) -> Iterator[tuple[tuple[int, ...], int]]:
+        """
+        The splits of a group among its slots fitting the capacities left, with their number of deals.
+        """
+
+        bits, allowed = self.groups[number]
+        size = len(bits)
+        for split in _compositions(size, [caps[slot] for slot in allowed]):
+            left = list(caps)
+            ways = 1
+            remaining = size
+            for slot, taken in zip(allowed, split):
+                left[slot] -= taken
+                ways *= comb(remaining, taken)
+                remaining -= taken
+            completions = self._count(number + 1, tuple(left))
+            if completions:
+                yield split, ways*completions
+
+    def _count(self, number: int, caps: tuple[int, ...]) -> int:
+        """
+        The number of deals of the groups from a given one on, filling the capacities left exactly.
+        """
+
+        if number == len(self.groups):
+            return 1 if not any(caps) else 0
+        key = (number, caps)
+        count = self._memo.get(key)
+        if count is not None:
+            return count
+        bits, allowed = self.groups[number]
+        if number == len(self.groups) - 1: #the last group fills every slot left: a multinomial
+            count = 0
+            if sum(caps) == len(bits) and all(caps[slot] == 0 or slot in allowed for slot in range(self.slots)):
+                count = 1
+                remaining = len(bits)
+                for slot in allowed:
+                    count *= comb(remaining, caps[slot])
+                    remaining -= caps[slot]
+        else:
+            splits, running = [], []
+            count = 0
+            for split, ways in self._splits(number, caps):
+                count += ways
+                splits.append(split)
+                running.append(count)
+            self._tables[key] = (splits, running)
+        self._memo[key] = count
+        return count
+
+    def sample(self, rng: rnd.Random) -> list[int]:
+        """
+        Draw a deal, every consistent deal having the same probability.
+        Args:
+            rng (rnd.Random): The generator of the deal.
+        Returns:
+            list[int]: The cards of every slot, as a bitset.
+        Example:
+            >>> sampler = DealSampler(0b1111, [2, 2], [0b0001, 0])
+            >>> sampler.total
+            3
+            >>> sampler.sample(rnd.Random(1))[1] & 0b0001
+            1
+        """
+
+        deal = [0]*self.slots
+        caps = self.sizes
+        for number, (bits, allowed) in enumerate(self.groups):
+            if number == len(self.groups) - 1:
+                split = tuple(caps[slot] for slot in allowed)
+            else:
+                splits, running = self._tables[number, caps]
+                split = splits[bisect_right(running, rng.randrange(running[-1]))]
+            shuffled = bits.copy()
+            rng.shuffle(shuffled)
+            start = 0
+            left = list(caps)
+            for slot, taken in zip(allowed, split):
+                for bit in shuffled[start:start + taken]:
+                    deal[slot] |= bit
+                start += taken
+                left[slot] -= taken
+            caps = tuple(left)
+        return deal
+
+    def sample_batch(self, count: int, rng: rnd.Random) -> list[list[int]]:
+        """
+        Draw many deals, sharing the counting of the sampler.
+        Args:
+            count (int): The number of deals.
+            rng (rnd.Random): The generator of the deals.
+        Returns:
+            list[list[int]]: The deals.
+        """
+
+        return [self.sample(rng) for _ in range(count)]
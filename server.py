@@ -0,0 +1,384 @@
+from __future__ import annotations
+from typing import Awaitable, Callable
+import argparse
+import asyncio
+import json
+import os
+import random as rnd
+import statistics
+import tempfile
+import time
+from tarots import Decision, DecisionKind, Game, Player, Strategy, make_rng
+
+#a seat is asked for every decision with a request dict and answers with the position of the chosen option,
+#or with a bool for the prize claim
+SeatCallback = Callable[[dict], Awaitable[object]]
+
+
+def decision_request(decision: Decision, game: Game) -> dict:
+    """
+    Describe a decision for a seat with card notations only, so that it can be sent as JSON.
+    Args:
+        decision (Decision): The decision the game is waiting for.
+        game (Game): The game.
+    Returns:
+        dict: The kind of decision, the player, the options, the hand of the player and the cards of the trick.
+    """
+
+    player = decision.player
+    return {
+        "kind": decision.kind.name,
+        "player": player.name,
+        "options": [card.notation for card in decision.options],
+        "hand": [card.notation for card in player.hand],
+        "trick": [card.notation for card in game.current_round.cards] if game.current_round is not None else [],
+    }
+
+
+class RemoteSeat:
+    """
+    A seat played by a client connected over a TCP or Unix socket, with one JSON object per line: the server
+    sends {"type": "decision", "id": n, ...request} and the client answers {"id": n, "choice": choice}; at the
+    end of the game the server sends {"type": "result", "scores": {...}}.
+    Attributes:
+        name (str): The name the client gave when joining.
+        reader (asyncio.StreamReader): The stream the answers are read from.
+        writer (asyncio.StreamWriter): The stream the requests are written to.
+    Methods:
+        __init__(name: str, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+            Initializes the seat with the streams of the connection.
+        __call__(request: dict) -> object:
+            Send a decision request and wait for the answer.
+        finish(scores: dict):
+            Send the result of the game and close the connection.
+    """
+
+    def __init__(self, name: str, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.name = name
+        self.reader = reader
+        self.writer = writer
+        self._next_id = 0
+
+    def __repr__(self) -> str:
+        return f"RemoteSeat({self.name})"
+
+    async def __call__(self, request: dict) -> object:
+        self._next_id += 1
+        self.writer.write((json.dumps({"type": "decision", "id": self._next_id, **request}) + "\n").encode())
+        await self.writer.drain()
+        while True: #answers to requests that timed out are late and skipped
+            line = await self.reader.readline()
+            if not line:
+                raise ConnectionError(f"{self.name} disconnected")
+            answer = json.loads(line)
+            if answer.get("id") == self._next_id:
+                return answer.get("choice")
+
+    async def finish(self, scores: dict) -> None:
+        """
+        Send the result of the game and close the connection.
+        Args:
+            scores (dict): The points made in the game, by player name.
+        """
+
+        try:
+            self.writer.write((json.dumps({"type": "result", "scores": scores}) + "\n").encode())
+            await self.writer.drain()
+            self.writer.close()
+            await self.writer.wait_closed()
+        except ConnectionError: #the client left first
+            pass
+        return None
+
+
+class GameServer:
+    """
+    An asyncio server hosting many Game tables in one process. Every table is a task driving the decisions of
+    Game.decisions: each decision is awaited from the seat callback, so one thread interleaves all the tables and
+    a slow seat only holds its own table. A decision that is not answered within the timeout, or answered with
+    an invalid choice, is answered by the default Strategy of the player instead.
+    Seats are in-process callbacks given to play_table, or clients joining over TCP or Unix sockets with serve:
+    every num_players clients that join start a table.
+    Attributes:
+        num_players (int): The number of players of the tables filled from the socket lobby.
+        timeout (float): The seconds a seat has for each decision before the default move is played.
+        rng (rnd.Random): The generator drawing the seed of every table.
+        latencies (list[float]): The seconds taken by every decision.
+        fallbacks (int): The number of decisions that fell back to the default move.
+        tables_played (int): The number of tables finished.
+    Methods:
+        __init__(num_players: int = 3, timeout: float = 5.0, rng: rnd.Random | int | None = None):
+            Initializes the server.
+        decide(seat: SeatCallback, decision: Decision, game: Game) -> object:
+            Ask a seat for a decision, with the default move as fallback.
+        play_table(seats: list[SeatCallback], names: list[str] | None = None, seed: int | None = None) -> dict:
+            Play one game with the given seats.
+        serve(host: str | None = None, port: int | None = None, path: str | None = None) -> asyncio.AbstractServer:
+            Accept clients over TCP or over a Unix socket.
+    """
+
+    def __init__(self, num_players: int = 3, timeout: float = 5.0, rng: rnd.Random | int | None = None):
+        if num_players < 3 or num_players > 5:
+            raise ValueError("Number of players must be between 3 and 5")
+        self.num_players = num_players
+        self.timeout = timeout
+        self.rng = make_rng(rng)
+        self.latencies: list[float] = []
+        self.fallbacks = 0
+        self.tables_played = 0
+        self._lobby: list[RemoteSeat] = []
+        self._tables: set[asyncio.Task] = set()
+
+    def __repr__(self) -> str:
+        return f"GameServer({self.num_players} players, {self.tables_played} tables played)"
+
+    async def decide(self, seat: SeatCallback, decision: Decision, game: Game) -> object:
+        """
+        Ask a seat for a decision and check the answer.
+        Args:
+            seat (SeatCallback): The seat of the player who has to decide.
+            decision (Decision): The decision the game is waiting for.
+            game (Game): The game.
+        Returns:
+            object: The chosen card, or a bool for the prize claim; the default move of the player if the seat
+                did not answer in time or gave an invalid answer.
+        """
+
+        start = time.perf_counter()
+        try:
+            choice = await asyncio.wait_for(seat(decision_request(decision, game)), self.timeout)
+        except (asyncio.TimeoutError, ConnectionError, ValueError): #a slow or lost seat plays the default move
+            choice = None
+        finally:
+            self.latencies.append(time.perf_counter() - start)
+
+        if decision.kind is DecisionKind.claim:
+            if isinstance(choice, bool):
+                return choice
+        elif isinstance(choice, int) and not isinstance(choice, bool) and 0 <= choice < len(decision.options):
+            return decision.options[choice]
+        self.fallbacks += 1
+        return game.answer(decision)
+
+    async def play_table(self, seats: list[SeatCallback], names: list[str] | None = None, seed: int | None = None) -> dict:
+        """
+        Play one game with the given seats.
+        Args:
+            seats (list[SeatCallback]): The seats, in the seat order of the game.
+            names (list[str] | None): The names of the players, "Seat 1", "Seat 2"... if None.
+            seed (int | None): The seed of the game, drawn from the generator of the server if None.
+        Returns:
+            dict: The points made in the game, by player name.
+        Example:
+            >>> server = GameServer(3, timeout=1.0)
+            >>> scores = await server.play_table([SimulatedClient(rng=seat) for seat in range(3)])
+        """
+
+        if names is None:
+            names = [f"Seat {seat + 1}" for seat in range(len(seats))]
+        if seed is None:
+            seed = self.rng.getrandbits(64)
+        players = [Player(name, strategy=Strategy()) for name in names] #the strategies only play the default moves
+        seat_of = {id(player): seat for player, seat in zip(players, seats)}
+        game = Game(players, seed)
+        steps = game.decisions()
+        try:
+            decision = next(steps)
+            while True:
+                decision = steps.send(await self.decide(seat_of[id(decision.player)], decision, game))
+        except StopIteration: #the game is over
+            pass
+        self.tables_played += 1
+        return game.scores
+
+    async def _join(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            line = await reader.readline()
+            if not line:
+                raise ConnectionError("the client left before joining")
+            hello = json.loads(line)
+            if not isinstance(hello, dict):
+                raise ValueError("the hello is not a JSON object")
+        except (ValueError, ConnectionError): #a malformed hello or a lost client takes no seat
+            writer.close()
+            return None
+        for seat in self._lobby: #the clients that left while waiting give their seat up
+            if seat.reader.at_eof():
+                seat.writer.close()
+        self._lobby = [seat for seat in self._lobby if not seat.reader.at_eof()]
+        self._lobby.append(RemoteSeat(str(hello.get("name", f"Client {len(self._lobby) + 1}")), reader, writer))
+        if len(self._lobby) < self.num_players:
+            return None
+        seats, self._lobby = self._lobby[:self.num_players], self._lobby[self.num_players:]
+        task = asyncio.create_task(self._run_remote_table(seats)) #the tables outlive the connection handlers
+        self._tables.add(task)
+        task.add_done_callback(self._tables.discard)
+        return None
+
+    async def _run_remote_table(self, seats: list[RemoteSeat]) -> None:
+        scores = await self.play_table(seats, [seat.name for seat in seats])
+        await asyncio.gather(*(seat.finish(scores) for seat in seats))
+        return None
+
+    async def serve(self, host: str | None = None, port: int | None = None, path: str | None = None) -> asyncio.AbstractServer:
+        """
+        Accept clients over TCP, or over a Unix socket if a path is given. A client first sends a line with
+        {"name": name}, then answers the decisions of its seat until the result of the game. A client whose first
+        line is not a JSON object is disconnected, and a client that leaves the lobby before its table starts
+        gives its seat up.
+        Args:
+            host (str | None): The host to listen on, all the interfaces if None.
+            port (int | None): The TCP port, a free one if None or 0.
+            path (str | None): The path of the Unix socket, to listen on a Unix socket instead of TCP.
+        Returns:
+            asyncio.AbstractServer: The server, which is already accepting clients.
+        """
+
+        if path is not None:
+            return await asyncio.start_unix_server(self._join, path=path, backlog=1024)
+        return await asyncio.start_server(self._join, host, port or 0, backlog=1024)
+
+
+class SimulatedClient:
+    """
+    A simulated player for load tests: it answers every decision at random after an optional delay, either as
+    an in-process seat callback or as a client connected to a GameServer.
+    Attributes:
+        name (str): The name sent when joining a server.
+        rng (rnd.Random): The generator of the choices.
+        delay (float): The seconds waited before each answer.
+        scores (dict | None): The result received from the server, None before the end of the game.
+    Methods:
+        __init__(name: str = "Client", rng: rnd.Random | int | None = None, delay: float = 0.0):
+            Initializes the client.
+        __call__(request: dict) -> object:
+            Answer a decision request.
+        connect(host: str = "127.0.0.1", port: int | None = None, path: str | None = None) -> dict:
+            Join a server and play until the end of the game.
+    """
+
+    def __init__(self, name: str = "Client", rng: rnd.Random | int | None = None, delay: float = 0.0):
+        self.name = name
+        self.rng = make_rng(rng)
+        self.delay = delay
+        self.scores: dict | None = None
+
+    def __repr__(self) -> str:
+        return f"SimulatedClient({self.name})"
+
+    async def __call__(self, request: dict) -> object:
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if request["kind"] == "claim":
+            return self.rng.random() < 0.5
+        return self.rng.randrange(len(request["options"]))
+
+    async def connect(self, host: str = "127.0.0.1", port: int | None = None, path: str | None = None) -> dict:
+        """
+        Join a server and answer its decisions until the end of the game.
+        Args:
+            host (str): The host of the server.
+            port (int | None): The TCP port of the server.
+            path (str | None): The path of the Unix socket of the server, to connect to it instead of TCP.
+        Returns:
+            dict: The points made in the game, by player name.
+        """
+
+        if path is not None:
+            reader, writer = await asyncio.open_unix_connection(path)
+        else:
+            reader, writer = await asyncio.open_connection(host, port)
+        writer.write((json.dumps({"name": self.name}) + "\n").encode())
+        await writer.drain()
+        while self.scores is None:
+            line = await reader.readline()
+            if not line:
+                raise ConnectionError("the server closed the connection before the result")
+            message = json.loads(line)
+            if message["type"] == "result":
+                self.scores = message["scores"]
+            else:
+                writer.write((json.dumps({"id": message["id"], "choice": await self(message)}) + "\n").encode())
+                await writer.drain()
+        writer.close()
+        await writer.wait_closed()
+        return self.scores
+
+
+async def load_test(num_tables: int, num_players: int = 3, transport: str = "inproc", delay: float = 0.0,
+                    timeout: float = 5.0, max_tables: int = 64, rng: rnd.Random | int | None = None) -> dict:
+    """
+    Play many tables at once against simulated clients and measure the server.
+    Args:
+        num_tables (int): The number of tables to play.
+        num_players (int): The number of players of each table.
+        transport (str): "inproc" for in-process callbacks, "tcp" or "unix" for clients over sockets.
+        delay (float): The seconds each simulated client waits before answering.
+        timeout (float): The seconds a seat has for each decision.
+        max_tables (int): The number of in-process tables played at the same time.
+        rng (rnd.Random | int | None): The generator or seed of the server and of the clients.
+    Returns:
+        dict: The tables played, the seconds taken, the tables per second and per CPU second of the process,
+            the decisions, their latency in milliseconds (mean, median, 95th percentile, max) and the fallbacks.
+    Example:
+        >>> report = asyncio.run(load_test(100, transport="tcp"))
+        >>> report["tables"]
+        100
+    """
+
+    rng = make_rng(rng)
+    server = GameServer(num_players, timeout, rng.getrandbits(64))
+    start, cpu_start = time.perf_counter(), time.process_time()
+
+    if transport == "inproc":
+        slots = asyncio.Semaphore(max_tables)
+
+        async def table() -> dict:
+            async with slots:
+                return await server.play_table([SimulatedClient(rng=rng.getrandbits(64), delay=delay) for _ in range(num_players)])
+
+        await asyncio.gather(*(table() for _ in range(num_tables)))
+    elif transport in ("tcp", "unix"):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "tarocchi.sock") if transport == "unix" else None
+            listener = await server.serve("127.0.0.1", 0, path)
+            port = None if path else listener.sockets[0].getsockname()[1]
+            clients = [
+                SimulatedClient(f"Client {number}", rng.getrandbits(64), delay)
+                for number in range(num_tables*num_players)
+            ]
+            await asyncio.gather(*(client.connect("127.0.0.1", port, path) for client in clients))
+            listener.close()
+            await listener.wait_closed()
+    else:
+        raise ValueError(f"Unknown transport {transport}")
+
+    seconds, cpu_seconds = time.perf_counter() - start, time.process_time() - cpu_start
+    latencies = sorted(latency*1000 for latency in server.latencies)
+    return {
+        "tables": server.tables_played,
+        "seconds": seconds,
+        "tables_per_second": server.tables_played/seconds if seconds else 0.0,
+        "tables_per_core_second": server.tables_played/cpu_seconds if cpu_seconds else 0.0,
+        "decisions": len(latencies),
+        "latency_ms_mean": statistics.fmean(latencies) if latencies else 0.0,
+        "latency_ms_median": statistics.median(latencies) if latencies else 0.0,
+        "latency_ms_p95": latencies[int(0.95*(len(latencies) - 1))] if latencies else 0.0,
+        "latency_ms_max": latencies[-1] if latencies else 0.0,
+        "fallbacks": server.fallbacks,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Load test of the Tarocchi game server with simulated clients.")
+    parser.add_argument("--tables", type=int, default=200, help="number of tables to play")
+    parser.add_argument("--players", type=int, default=3, help="players per table")
+    parser.add_argument("--transport", choices=("inproc", "tcp", "unix"), default="inproc")
+    parser.add_argument("--delay", type=float, default=0.0, help="seconds each client waits before answering")
+    parser.add_argument("--timeout", type=float, default=5.0, help="seconds a seat has for each decision")
+    parser.add_argument("--concurrency", type=int, default=64, help="tables played at the same time")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+    report = asyncio.run(load_test(args.tables, args.players, args.transport, args.delay, args.timeout, args.concurrency, args.seed))
+    for key, value in report.items():
+        print(f"{key}: {value:.3f}" if isinstance(value, float) else f"{key}: {value}")
@@ -0,0 +1,460 @@
+from __future__ import annotations
+from typing import Iterable, Sequence
+import time
+from tarots import Card, Game, Seed, CARD_POINTS, CARD_RANKS, SEED_MASKS, TRICK_STRENGTH, _CARDS_BY_RANK
+
+#the solver works on ranks, the bit positions of Hand.mask, where the cards of a seed are contiguous and in trick order
+_POINTS_BY_RANK: tuple[int, ...] = tuple(CARD_POINTS[card.index] for card in _CARDS_BY_RANK)
+_SEED_BY_RANK: tuple[Seed, ...] = tuple(card.seed for card in _CARDS_BY_RANK)
+_STRENGTH_BY_RANK: dict[Seed, tuple[int, ...]] = {
+    seed: tuple(TRICK_STRENGTH[seed][card.index] for card in _CARDS_BY_RANK) for seed in Seed
+}
+_FOOL_RANK: int = CARD_RANKS[Card(Seed.tarots, 0).index]
+#the same tables with the seeds numbered by their position in Seed, which the search hashes much faster than the enum
+_SEEDS: tuple[Seed, ...] = tuple(Seed)
+_TAROTS: int = _SEEDS.index(Seed.tarots)
+_SEED_NUMBER_BY_RANK: tuple[int, ...] = tuple(_SEEDS.index(seed) for seed in _SEED_BY_RANK)
+_SEED_MASK_BY_NUMBER: tuple[int, ...] = tuple(SEED_MASKS[seed] for seed in _SEEDS)
+_STRENGTH_BY_NUMBER: tuple[tuple[int, ...], ...] = tuple(_STRENGTH_BY_RANK[seed] for seed in _SEEDS)
+_SUITS: tuple[int, ...] = tuple(number for number in range(len(_SEEDS)) if number != _TAROTS)
+_MASTER_MASK: int = SEED_MASKS[Seed.tarots] & ~(1 << _FOOL_RANK) #the tarots that take every trick they are played in
+
+#the position of every rank in the layout of the transposition keys, one separator byte after every seed
+_LAYOUT_POSITION: tuple[int, ...] = tuple(rank + _SEED_NUMBER_BY_RANK[rank] for rank in range(len(_CARDS_BY_RANK)))
+_LAYOUT_SIZE: int = len(_CARDS_BY_RANK) + len(Seed)
+_POINT_CLASSES: dict[int, int] = {points: number for number, points in enumerate(sorted(set(_POINTS_BY_RANK)))}
+_EMPTY = 0 #layout byte of a card already played
+_SEPARATOR = 255
+
+
+def _legal_mask(mask: int, lead: int | None) -> int:
+    """
+    CardRound.legal_mask with the lead seed given by its number.
+    """
+
+    if lead is None:
+        return mask
+    legal = mask & _SEED_MASK_BY_NUMBER[lead]
+    if legal:
+        return legal
+    legal = mask & _SEED_MASK_BY_NUMBER[_TAROTS]
+    if legal:
+        return legal
+    return mask
+
+
+class DoubleDummySolver:
+    """
+    An exact solver of the card play with every hand visible: it returns the points the asking team and its
+    opponents make in the remaining tricks when both sides play perfectly, the points of a trick going to the
+    side of its winner, as Card.value scores them. The opponents of the asking team play as one side, so with
+    4 players the two single opponents cooperate against the asking team.
+    The search is a fail-soft alpha-beta over the cards played, driven by null window searches halving the range
+    of the value, with:
+    - a transposition table of the positions at the start of a trick, the first seat leading every trick. A
+      position is keyed by the owner and the points of the cards left in every seed in trick order, so positions
+      that differ only by which cards were already played share their entry. Its bounds are kept from one null
+      window search to the next;
+    - quick tricks: a tarot above every tarot of the other side takes its trick whatever the play, and so do the
+      top cards of a suit while the suit is led and no opponent can trump them, so the points either side is sure
+      of bound a position before it is searched;
+    - move ordering: the best card of the table first, then for the followers the cards whose side takes the
+      trick unless a later opponent can beat them, giving the most points, then the cards giving the fewest;
+    - the cards of a hand of the same seed and points merged into one move, the lowest, when none of them takes
+      the trick or no card between them can be played by the later seats or takes the trick. The lead never
+      changes hands, so taking a trick costs nothing later and keeping the higher card of the two is never worse.
+    The search grows exponentially with the tricks left. On one core, endgames of 10 tricks take up to about half
+    a second and endgames of 12 tricks up to about 12 seconds. Even with every move ordered by a finished search,
+    the positions to search grow about threefold with every trick, so a full 3-player deal of 25 tricks is out of
+    reach and the solver is meant for endgames.
+    Attributes:
+        hands (list[int]): The hand of every seat, as a bitset like Hand.mask.
+        asking (list[bool]): True for the seats of the asking team.
+        trick (list[int]): The ranks of the cards of the trick in progress, in seat order.
+        nodes (int): The number of positions searched by the last solve.
+        table (dict): The transposition table, the lower and upper bound and the best card of every position.
+    Methods:
+        __init__(hands: Sequence[Iterable[Card]], asking: Sequence[bool], trick: Sequence[Card] = ()):
+            Initializes the solver with the hands, the asking team and the trick in progress.
+        from_game(game: Game) -> DoubleDummySolver:
+            Build the solver of the position of a game.
+        solve() -> dict:
+            Find the optimal points of both sides and the best card of the seat to move.
+    """
+
+    def __init__(self, hands: Sequence[Iterable[Card]], asking: Sequence[bool], trick: Sequence[Card] = ()):
+        if len(hands) != len(asking):
+            raise ValueError("There must be one asking flag per hand")
+        if len(trick) >= len(hands):
+            raise ValueError("The trick in progress is already complete")
+        self.hands: list[int] = []
+        self._layout = bytearray(_LAYOUT_SIZE)
+        for rank in range(len(_CARDS_BY_RANK)):
+            if rank == len(_CARDS_BY_RANK) - 1 or _SEED_BY_RANK[rank + 1] != _SEED_BY_RANK[rank]:
+                self._layout[_LAYOUT_POSITION[rank] + 1] = _SEPARATOR
+        for seat, hand in enumerate(hands):
+            mask = 0
+            for card in hand:
+                rank = CARD_RANKS[card.index]
+                mask |= 1 << rank
+                self._layout[_LAYOUT_POSITION[rank]] = 1 + seat + 8*_POINT_CLASSES[_POINTS_BY_RANK[rank]]
+            self.hands.append(mask)
+        self.asking = [bool(flag) for flag in asking]
+        self.trick = [CARD_RANKS[card.index] for card in trick]
+        self.nodes = 0
+        self.table: dict[bytes, tuple[int, int, int]] = {}
+        self._left = 0 #the points of the cards in the hands
+        self._best_move = -1
+
+    def __repr__(self) -> str:
+        return f"DoubleDummySolver({len(self.hands)} seats, {len(self.table)} positions stored)"
+
+    @classmethod
+    def from_game(cls, game: Game) -> DoubleDummySolver:
+        """
+        Build the solver of the position of a game after setup_game, possibly in the middle of a trick.
+        Args:
+            game (Game): The game.
+        Returns:
+            DoubleDummySolver: The solver of the position.
+        Example:
+            >>> game = Game([Player("Alice"), Player("Bob"), Player("Charlie")], 1)
+            >>> game.setup_game()
+            >>> DoubleDummySolver.from_game(game)
+            DoubleDummySolver(3 seats, 0 positions stored)
+        """
+
+        asking_team = game.find_team(game.asking_player)
+        current = game.current_round
+        trick = current.cards if current is not None and len(current.played_cards) < game.num_players else []
+        return cls(
+            [player.hand.cards for player in game.players],
+            [player in asking_team.players for player in game.players],
+            trick,
+        )
+
+    def _moves(self, seat: int, lead: int | None, best_strength: int, best_seat: int, hint: int) -> list[int]:
+        """
+        The cards worth trying for a seat: the lowest card of every group of equivalent cards, in the order to try
+        them.
+        """
+
+        hands = self.hands
+        asking = self.asking
+        side = asking[seat]
+        legal = _legal_mask(hands[seat], lead)
+        strengths = _STRENGTH_BY_NUMBER[lead] if lead is not None else None
+        others = 0 #the cards that can come between two cards of the seat in the trick
+        threat = support = -1 #the strongest card the later opponents and partners can play
+        if strengths is None and seat: #after a led fool the card played sets the lead seed
+            for other, hand in enumerate(hands):
+                if other != seat:
+                    others |= hand
+            for rank in self.trick:
+                others |= 1 << rank
+        else:
+            for other in range(seat + 1, len(hands)):
+                playable = _legal_mask(hands[other], lead)
+                others |= playable
+                if strengths is None:
+                    continue
+                strongest = -1
+                while playable:
+                    bit = playable & -playable
+                    playable ^= bit
+                    strongest = max(strongest, strengths[bit.bit_length() - 1])
+                if asking[other] == side:
+                    support = max(support, strongest)
+                else:
+                    threat = max(threat, strongest)
+            if best_seat >= 0 and asking[best_seat] != side:
+                others |= 1 << self.trick[best_seat]
+
+        winning = best_seat >= 0 and asking[best_seat] == side
+        keys = []
+        groups: dict[int, tuple[int, int]] = {} #the first and last card of the open group of every seed and points
+        hinted = -1
+        mask = legal
+        while mask:
+            bit = mask & -mask
+            mask ^= bit
+            rank = bit.bit_length() - 1
+            points = _POINTS_BY_RANK[rank]
+            number = _SEED_NUMBER_BY_RANK[rank]*64 + points
+            beaten = strengths is not None and best_seat >= 0 and strengths[rank] <= best_strength
+            if beaten: #the cards that do not take the trick all leave it as it is, so the lowest stands for them
+                number += 32
+            group = groups.get(number)
+            if group is not None and (beaten or not others & (bit - (2 << group[1]))):
+                groups[number] = (group[0], rank)
+                if rank == hint: #the card of the table stands for its group
+                    hinted = group[0]
+                continue
+            groups[number] = (rank, rank)
+            if rank == hint:
+                hinted = rank
+            if strengths is None: #leading: strong cards first
+                keys.append((0, -_STRENGTH_BY_NUMBER[_SEED_NUMBER_BY_RANK[rank]][rank], 0, rank))
+                continue
+            strength = strengths[rank]
+            if winning or strength > best_strength: #the side takes the trick unless a later opponent beats it
+                takes = max(strength, best_strength) > threat
+            else:
+                takes = support > best_strength
+            if takes: #the most points to a trick the side takes, with the cheapest card
+                keys.append((0, -points, strength, rank))
+            else: #the fewest points to a trick the side loses
+                keys.append((1, points, strength, rank))
+        if hinted >= 0:
+            keys = [(-1, 0, 0, key[3]) if key[3] == hinted else key for key in keys]
+        keys.sort()
+        return [key[3] for key in keys]
+
+    def _key(self) -> bytes:
+        """
+        The transposition key of the position at the start of a trick: the owner and points of the cards left.
+        """
+
+        return bytes(self._layout).replace(b"\x00", b"")
+
+    def _relative(self, rank: int) -> int:
+        """
+        A card as its seed and its position among the cards of its seed left, which is the same card in every
+        position sharing the transposition key.
+        """
+
+        remaining = 0
+        for hand in self.hands:
+            remaining |= hand
+        seed = _SEED_NUMBER_BY_RANK[rank]
+        below = remaining & _SEED_MASK_BY_NUMBER[seed] & ((1 << rank) - 1)
+        return seed*128 + below.bit_count()
+
+    def _absolute(self, relative: int) -> int:
+        """
+        The rank of the card with a relative position in the current position, -1 if there is none.
+        """
+
+        seed, position = relative // 128, relative % 128
+        remaining = 0
+        for hand in self.hands:
+            remaining |= hand
+        mask = remaining & _SEED_MASK_BY_NUMBER[seed]
+        for _ in range(position):
+            mask &= mask - 1
+        return (mask & -mask).bit_length() - 1
+
+    def _sure_points(self, side: bool) -> int:
+        """
+        The points a side takes whatever the play from the start of a trick. Every tarot above the tarots of the
+        other side takes the trick it is played in. So do the top cards of a suit held by one seat, at most as many
+        as the first seat has cards of the suit to lead if the seat is another one, and as every opponent after the
+        first seat who could trump them has cards of the suit to follow with. A seat plays one card per trick, and
+        the other cards of those tricks are worth at least a point each.
+        """
+
+        hands = self.hands
+        cards = other = 0
+        trumps = [] #the opponents after the first seat holding a tarot that takes a suit card
+        for seat, hand in enumerate(hands):
+            if self.asking[seat] == side:
+                cards |= hand
+            else:
+                other |= hand
+                if seat and hand & _MASTER_MASK:
+                    trumps.append(hand)
+        sure = cards & _MASTER_MASK & -(1 << (other & _MASTER_MASK).bit_length())
+        remaining = cards | other
+        for number in _SUITS:
+            seed_mask = _SEED_MASK_BY_NUMBER[number]
+            left = remaining & seed_mask
+            top = 1 << left.bit_length() >> 1
+            if not cards & top:
+                continue
+            owner = next(seat for seat, hand in enumerate(hands) if hand & top)
+            tricks = (hands[0] & seed_mask).bit_count() if owner else left.bit_count()
+            for hand in trumps:
+                tricks = min(tricks, (hand & seed_mask).bit_count())
+            while tricks and hands[owner] & top: #the top cards of the owner, from the highest
+                sure |= top
+                left ^= top
+                tricks -= 1
+                top = 1 << left.bit_length() >> 1
+        if not sure:
+            return 0
+        tricks = max((hand & sure).bit_count() for seat, hand in enumerate(hands) if self.asking[seat] == side)
+        points = len(hands)*tricks - sure.bit_count()
+        while sure:
+            bit = sure & -sure
+            points += _POINTS_BY_RANK[bit.bit_length() - 1]
+            sure ^= bit
+        return points
+
+    def _search(self, alpha: int, beta: int, lead: int | None, best_strength: int, best_seat: int, points: int) -> int:
+        """
+        The points of the asking team from the current position to the end, within the alpha-beta window.
+        Args:
+            alpha (int): The points the asking team is already sure of.
+            beta (int): The points the opponents already hold the asking team to.
+            lead (int | None): The number of the lead seed of the trick in progress in Seed.
+            best_strength (int): The strength of the card taking the trick so far.
+            best_seat (int): The seat of the card taking the trick so far, -1 if no card was played.
+            points (int): The points of the cards of the trick in progress.
+        Returns:
+            int: The points of the asking team.
+        """
+
+        self.nodes += 1
+        hands = self.hands
+        trick = self.trick
+        seat = len(trick)
+        key = None
+        hint = -1
+        if seat == 0:
+            if not hands[0]:
+                return 0
+            key = self._key()
+            entry = self.table.get(key)
+            if entry is not None:
+                lower, upper, relative = entry
+                if lower >= beta or lower == upper:
+                    return lower
+                if upper <= alpha:
+                    return upper
+                alpha = max(alpha, lower)
+                beta = min(beta, upper)
+                hint = self._absolute(relative)
+            else: #quick tricks: the points either side is sure of may settle the window at once
+                lower = self._sure_points(True)
+                if lower >= beta:
+                    return lower
+                upper = self._left - self._sure_points(False)
+                if upper <= alpha:
+                    return upper
+        alpha_start, beta_start = alpha, beta
+
+        maximizing = self.asking[seat]
+        best = -1 if maximizing else 1 << 30
+        best_move = -1
+        last_seat = seat == len(hands) - 1
+        layout = self._layout
+        for rank in self._moves(seat, lead, best_strength, best_seat, hint):
+            bit = 1 << rank
+            hands[seat] ^= bit
+            position = _LAYOUT_POSITION[rank]
+            code = layout[position]
+            layout[position] = _EMPTY
+            trick.append(rank)
+            card_points = _POINTS_BY_RANK[rank]
+            self._left -= card_points
+            card_lead = lead
+            if card_lead is None and rank != _FOOL_RANK:
+                card_lead = _SEED_NUMBER_BY_RANK[rank]
+            strength = _STRENGTH_BY_NUMBER[card_lead][rank] if card_lead is not None else 0
+            if best_seat < 0 or strength > best_strength: #a led fool has strength 0, so the next card takes over
+                new_strength, new_seat = strength, seat
+            else:
+                new_strength, new_seat = best_strength, best_seat
+            trick_points = points + card_points
+
+            if last_seat:
+                gain = trick_points if self.asking[new_seat] else 0
+                self.trick = []
+                value = gain + self._search(alpha - gain, beta - gain, None, 0, -1, 0)
+                self.trick = trick
+            else:
+                value = self._search(alpha, beta, card_lead, new_strength, new_seat, trick_points)
+
+            self._left += card_points
+            trick.pop()
+            layout[position] = code
+            hands[seat] ^= bit
+            if maximizing:
+                if value > best:
+                    best, best_move = value, rank
+                    if best > alpha:
+                        alpha = best
+            elif value < best:
+                best, best_move = value, rank
+                if best < beta:
+                    beta = best
+            if alpha >= beta:
+                break
+
+        if key is not None:
+            lower, upper = 0, 1 << 30
+            if best <= alpha_start:
+                upper = best
+            elif best >= beta_start:
+                lower = best
+            else:
+                lower = upper = best
+            entry = self.table.get(key)
+            if entry is not None: #keep the tightest bounds
+                lower, upper = max(lower, entry[0]), min(upper, entry[1])
+            self.table[key] = (lower, upper, self._relative(best_move))
+        self._best_move = best_move
+        return best
+
+    def solve(self) -> dict:
+        """
+        Find the points both sides make in the remaining tricks with perfect play, and the best card of the seat
+        to move.
+        Returns:
+            dict: The points of the asking team ("asking") and of the opponents ("opponents"), the best card
+                ("best_card", None if no card is left), the positions searched ("nodes") and the seconds taken.
+        Example:
+            >>> game = Game([Player("Alice"), Player("Bob"), Player("Charlie")], 1)
+            >>> game.setup_game()
+            >>> while len(game.players[0].hand.cards) > 6:
+            ...     game.apply(game.legal_moves()[0])
+            >>> solver = DoubleDummySolver.from_game(game)
+            >>> result = solver.solve()
+            >>> result["best_card"] in game.legal_moves()
+            True
+        """
+
+        start = time.perf_counter()
+        self.nodes = 0
+        trick = self.trick
+        points = sum(_POINTS_BY_RANK[rank] for rank in trick)
+        self._left = 0
+        for hand in self.hands:
+            mask = hand
+            while mask:
+                bit = mask & -mask
+                self._left += _POINTS_BY_RANK[bit.bit_length() - 1]
+                mask ^= bit
+        total = points + self._left
+
+        lead = None
+        best_strength, best_seat = 0, -1
+        for seat, rank in enumerate(trick):
+            if lead is None and rank != _FOOL_RANK:
+                lead = _SEED_NUMBER_BY_RANK[rank]
+        for seat, rank in enumerate(trick):
+            strength = _STRENGTH_BY_NUMBER[lead][rank] if lead is not None else 0
+            if best_seat < 0 or strength > best_strength:
+                best_strength, best_seat = strength, seat
+
+        lower, upper = 0, total
+        while lower < upper: #null window searches halving the range of the value
+            beta = (lower + upper + 1)//2
+            value = self._search(beta - 1, beta, lead, best_strength, best_seat, points)
+            if value >= beta:
+                lower = min(value, upper)
+            else:
+                upper = max(value, lower)
+        #a last search around the value with the root out of the table finds the card reaching it
+        if not trick and self.hands[0]:
+            self.table.pop(self._key(), None)
+        self._best_move = -1
+        self._search(lower - 1, lower + 1, lead, best_strength, best_seat, points)
+        best_move = self._best_move
+        return {
+            "asking": lower,
+            "opponents": total - lower,
+            "best_card": _CARDS_BY_RANK[best_move] if self.hands[len(trick)] else None,
+            "nodes": self.nodes,
+            "seconds": time.perf_counter() - start,
+        }
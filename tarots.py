@@ -1,9 +1,53 @@
 from __future__ import annotations
-from typing import List
+from typing import Callable, Generator, Iterable, Iterator, List, Sequence
 from enum import Enum
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+import hashlib
+import time
 import random as rnd
 
 
+def make_rng(rng: rnd.Random | int | None = None) -> rnd.Random:
+    """
+    Return the random number generator to use for a random choice.
+    Args:
+        rng (rnd.Random | int | None): A generator, which is returned as it is, a seed for a new
+            generator or None to use the global generator of the random module.
+    Returns:
+        rnd.Random: The random number generator.
+    Example:
+        >>> make_rng(42).random() == make_rng(42).random()
+        True
+    """
+
+    if rng is None:
+        return rnd.random.__self__ #the generator behind the functions of the random module, so random.seed still applies
+    if isinstance(rng, rnd.Random):
+        return rng
+    return rnd.Random(rng)
+
+def spawn_seed(seed: int, *path: int) -> int:
+    """
+    Derive the seed of an independent child stream from a root seed.
+    The same root seed and path always give the same child seed, so any stream of a large run can be
+    rebuilt on its own: the games of a match use the path (game number,).
+    Args:
+        seed (int): The root seed.
+        *path (int): The position of the child stream under the root, one number per level.
+    Returns:
+        int: A 64 bit seed for the child stream.
+    Example:
+        >>> spawn_seed(42, 0) == spawn_seed(42, 0)
+        True
+        >>> spawn_seed(42, 0) == spawn_seed(42, 1)
+        False
+    """
+
+    key = ",".join(str(number) for number in (seed, *path)).encode()
+    return int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), "little")
+
+
 class Seed(Enum):
     """
     The Seed class represents a type of card in a tarot deck. It includes methods for comparison and conversion between notation strings and Seed instances.
@@ -100,7 +144,7 @@ class Seed(Enum):
             >>> Seed.spades == Seed.spades
             True
         """
-        return self.value == other.value
+        return self._value_ == other._value_
 
     def __ne__(self, other):
         """
@@ -116,7 +160,7 @@ class Seed(Enum):
             >>> Seed.spades != Seed.coins
             True
         """
-        return self.value != other.value
+        return self._value_ != other._value_
 
     def __str__(self):
         """
@@ -155,7 +199,7 @@ class Seed(Enum):
             >>> hash(Seed.spades)
             1
         """
-        return hash(self.value)
+        return hash(self._value_)
 
     @property
     def notation(self) -> str:
@@ -243,67 +287,143 @@ class Card:
         __gt__(other): Checks if one card is greater than another.
         __ge__(other): Checks if one card is greater than or equal to another.
         value(): Returns the value of the card.
+        rank(): Returns the sort rank of the card.
+        index: The position of the card in the standard deck.
+        from_index(index): Returns the card at a given position of the standard deck.
+
+    Cards are immutable flyweights: the 78 cards of the standard deck are created once and
+    `Card(seed, number)` returns the shared instance, so two equal cards are the same object.
+
+    Example:
+        >>> Card(Seed.spades, 5) is Card(Seed.spades, 5)
+        True
     """
 
-    def __init__(self, seed: Seed, number: int):
-        self.seed = seed
-        self.number = number
+    __slots__ = ("seed", "number", "index", "_hash")
 
-        pass
+    def __new__(cls, seed: Seed, number: int) -> Card:
+        card = _CARD_REGISTRY.get((seed, number))
+        if card is None: #not a card of the standard deck, build a free instance
+            card = cls._create(seed, number)
+        return card
 
-    def __repr__(self):   
+    @classmethod
+    def _create(cls, seed: Seed, number: int, index: int|None = None) -> Card:
+        """
+        Build a new, non-interned instance of the class bypassing the registry.
+        Args:
+            seed (Seed): The seed of the card.
+            number (int): The number of the card.
+            index (int|None): The deck index of the card, looked up in the registry if not given.
+        Returns:
+            Card: A new instance of the class.
+        """
+        if index is None:
+            canonical = _CARD_REGISTRY.get((seed, number))
+            index = canonical.index if canonical is not None else None
 
-        if self.seed == Seed.tarots:
-            
-            tarot_name = self.tarot_name(self.number)
-            return f"{self.number}: {tarot_name}"
-        
-        if self.number == 1:
-            return f"Ace of {self.seed.name}"
-        if self.number == 11:
-            return f"Knight of {self.seed.name}"
-        if self.number == 12:
-            return f"Jack of {self.seed.name}"
-        if self.number == 13:
-            return f"Queen of {self.seed.name}"
-        if self.number == 14:
-            return f"King of {self.seed.name}"
-    
-        return f"{self.number} of {self.seed.name}"
+        card = object.__new__(cls)
+        object.__setattr__(card, "seed", seed)
+        object.__setattr__(card, "number", number)
+        object.__setattr__(card, "index", index)
+        object.__setattr__(card, "_hash", hash((seed, number)))
+        return card
+
+    @classmethod
+    def from_index(cls, index: int) -> Card:
+        """
+        Return the card at a given position of the standard deck.
+        Args:
+            index (int): The index of the card, between 0 and 77.
+        Returns:
+            Card: The interned card with that index.
+        Example:
+            >>> Card.from_index(0)
+            0: The Fool
+            >>> Card.from_index(22)
+            Ace of spades
+        """
+        if not 0 <= index < len(_CARDS):
+            raise ValueError(f"Invalid card index: {index}")
+        return _CARDS[index]
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError(f"{type(self).__name__} instances are immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} instances are immutable")
+
+    def __reduce__(self):
+        return (Card, (self.seed, self.number))
+
+    def __repr__(self):   
+        index = self.index
+        if index is None:
+            return Card._compute_name(self.seed, self.number)
+        return CARD_NAMES[index]
         
     def __str__(self):
         return self.__repr__()
 
     def __hash__(self):
-        return hash((self.seed, self.number))
+        return self._hash
 
     @classmethod
     def tarot_name(cls, number: int) -> str:
-        tarot_names = {
-                0:  "The Fool",
-                1:  "The Magician",
-                2:  "The High Priestess",
-                3:  "The Empress",
-                4:  "The Emperor",
-                5:  "The Hierophant",
-                6:  "The Lovers",
-                7:  "The Chariot",
-                8:  "The Strength",
-                9:  "The Hermit",
-                10: "The Wheel of Fortune",
-                11: "The Justice",
-                12: "The Hanged Man",
-                13: "The Death",
-                14: "The Temperance",
-                15: "The Devil",
-                16: "The Tower",
-                17: "The Star",
-                18: "The Moon",
-                19: "The Sun",
-                20: "The Judgement",
-                21: "The World"
-            }
-        return tarot_names.get(number, "Unknown")
+        if 0 <= number < len(TAROT_NAMES):
+            return TAROT_NAMES[number]
+        return "Unknown"
+
+    @classmethod
+    def _compute_name(cls, seed: Seed, number: int) -> str:
+        """
+        Compute the display name of a card, used to build CARD_NAMES.
+        """
+
+        if seed == Seed.tarots:
+            return f"{number}: {cls.tarot_name(number)}"
+
+        figure_names = {1: "Ace", 11: "Knight", 12: "Jack", 13: "Queen", 14: "King"}
+        if number in figure_names:
+            return f"{figure_names[number]} of {seed.name}"
+
+        return f"{number} of {seed.name}"
+
+    @classmethod
+    def _compute_value(cls, seed: Seed, number: int) -> int:
+        """
+        Compute the points of a card, used to build CARD_POINTS.
+        """
+
+        if number == 0: #if the card is the fool
+            return 12
+        
+        if seed == Seed.tarots: #if the card is a tarot
+            return 13 if number in [1, 21] else 1
+        
+        if number > 10: #if the card is a figure
+                return (number - 9)*3 - 2
+
+        return 1 
+
+    @classmethod
+    def _compute_rank(cls, seed: Seed, number: int) -> int:
+        """
+        Compute the sort rank of a card, used to build CARD_RANKS.
+        The ranks of the standard deck are the integers from 0 to 77: seeds are ordered
+        spades < coins < clubs < cups < tarots, figures are above the numbered cards and
+        the numbered cards of cups and coins are in reverse order.
+        """
+
+        if seed == Seed.tarots: #tarots are above every other seed
+            return 4*14 + number
+
+        if number <= 10 and seed in [Seed.cups, Seed.coins]: #reversed numbered cards
+            position = 10 - number
+        else:
+            position = number - 1
+
+        return (seed.value - 1)*14 + position
 
 
     @property
@@ -320,10 +440,13 @@ class Card:
             >>> card.notation
             '5s'
         """
-        return f"{self.number}{self.seed.notation}"
+        index = self.index
+        if index is None:
+            return f"{self.number}{self.seed.notation}"
+        return CARD_NOTATIONS[index]
 
     @classmethod
-    def random(cls) -> Card:
+    def random(cls, rng: rnd.Random | int | None = None) -> Card:
         """
         Generate a random Card instance.
 
@@ -331,21 +454,26 @@ class Card:
         seed is Seed.tarots, it generates a random number between 0 and 21 (inclusive).
         Otherwise, it generates a random number between 1 and 14 (inclusive).
 
+        Args:
+            rng (rnd.Random | int | None): The generator or seed to use, the global generator if None.
         Returns:
             Card: A Card instance with the randomly selected seed and number.
         """
 
-        seed = rnd.choice(list(Seed))
+        rng = make_rng(rng)
+        seed = rng.choice(list(Seed))
         if seed == Seed.tarots:
-            number = rnd.randint(0, 21)
+            number = rng.randint(0, 21)
         else:
-            number = rnd.randint(1, 14)
-        return Card(seed, number)
+            number = rng.randint(1, 14)
+        return _CARD_REGISTRY[seed, number]
        
     def __eq__(self, other: object) -> bool:
+        if self is other: #interned cards are equal only to themselves
+            return True
         if not isinstance(other, Card):
             return NotImplemented
-        return self.seed == other.seed and self.number == other.number
+        return self.seed is other.seed and self.number == other.number
 
     def __ne__(self, other: object) -> bool:
         return not self.__eq__(other)
@@ -386,27 +514,7 @@ class Card:
             False
         """
 
-        if self == other: #if the cards are the same
-            return False
-        if self.seed == Seed.tarots: #if self is a tarots card
-            if other.seed != Seed.tarots: #if the other card is not a tarots card
-                return False
-            return self.number < other.number #if the other card is a tarots card and higher
-            
-
-        if other.seed == Seed.tarots: #if the other card is a tarots card and self is not
-            return True
-
-        if self.seed != other.seed: #if the second card is not the same seed as the first
-            return self.seed < other.seed
-
-        if self.number > 10 or other.number > 10: #if one or both cards are figures
-            return self.number < other.number
-
-        if self.seed in [Seed.cups, Seed.coins]: #if the seed is cups or coins
-            return self.number > other.number
-
-        return self.number < other.number
+        return self.rank < other.rank #the rules above are encoded in CARD_RANKS
         
     def __le__(self, other: Card) -> bool:
         """
@@ -430,7 +538,7 @@ class Card:
             >>> card1 <= card2
             False
         """
-        return self.__lt__(other) or self.__eq__(other)
+        return self.rank <= other.rank
 
     def __gt__(self, other: Card) -> bool:
         """
@@ -452,7 +560,7 @@ class Card:
             False
         """
 
-        return not self.__le__(other)
+        return self.rank > other.rank
 
     def __ge__(self, other: Card) -> bool:
         """
@@ -471,7 +579,7 @@ class Card:
             False
         """
 
-        return not self.__lt__(other)
+        return self.rank >= other.rank
 
     @property
     def value(self) -> int:
@@ -500,26 +608,135 @@ class Card:
             1
         """
 
-        number = self.number
+        index = self.index
+        if index is None:
+            return Card._compute_value(self.seed, self.number)
+        return CARD_POINTS[index]
 
-        if number == 0: #if the card is the fool
-            return 12
-        
-        if self.seed == Seed.tarots: #if the card is a tarot
-            return 13 if number in [1, 21] else 1
-        
-        if number > 10: #if the card is a figure
-                return (number - 9)*3 - 2
+    @property
+    def rank(self) -> int:
+        """
+        Return the sort rank of the card: the cards of the standard deck have ranks from 0 to 77
+        and a card is less than another one if its rank is lower.
+        Returns:
+            int: The sort rank of the card.
+        Examples:
+            >>> Card(Seed.spades, 1).rank
+            0
+            >>> Card(Seed.tarots, 21).rank
+            77
+        """
+
+        index = self.index
+        if index is None:
+            return Card._compute_rank(self.seed, self.number)
+        return CARD_RANKS[index]
+
+
+TAROT_NAMES: tuple[str, ...] = (
+    "The Fool",
+    "The Magician",
+    "The High Priestess",
+    "The Empress",
+    "The Emperor",
+    "The Hierophant",
+    "The Lovers",
+    "The Chariot",
+    "The Strength",
+    "The Hermit",
+    "The Wheel of Fortune",
+    "The Justice",
+    "The Hanged Man",
+    "The Death",
+    "The Temperance",
+    "The Devil",
+    "The Tower",
+    "The Star",
+    "The Moon",
+    "The Sun",
+    "The Judgement",
+    "The World",
+)
+
+#(seed, number) of the standard deck in deck order: the position in this list is the card index
+_DECK_ORDER: list[tuple[Seed, int]] = [
+    (seed, number) for seed in Seed for number in (range(22) if seed == Seed.tarots else range(1, 15))
+]
+
+#lookup tables indexed by Card.index
+CARD_POINTS: tuple[int, ...] = tuple(Card._compute_value(seed, number) for seed, number in _DECK_ORDER)
+CARD_RANKS: tuple[int, ...] = tuple(Card._compute_rank(seed, number) for seed, number in _DECK_ORDER)
+CARD_NOTATIONS: tuple[str, ...] = tuple(f"{number}{seed.notation}" for seed, number in _DECK_ORDER)
+CARD_NAMES: tuple[str, ...] = tuple(Card._compute_name(seed, number) for seed, number in _DECK_ORDER)
+
+#the interned cards of the standard deck, by (seed, number) and by index
+_CARD_REGISTRY: dict[tuple[Seed, int], Card] = {
+    (seed, number): Card._create(seed, number, index) for index, (seed, number) in enumerate(_DECK_ORDER)
+}
+_CARDS: tuple[Card, ...] = tuple(_CARD_REGISTRY.values())
+
+#bitset helpers for Hand: bit i of a mask is the card of rank i, so the seeds are contiguous ranges
+_RANK_BITS: tuple[int, ...] = tuple(1 << rank for rank in CARD_RANKS) #indexed by Card.index
+_CARDS_BY_RANK: tuple[Card, ...] = tuple(sorted(_CARDS, key=lambda card: CARD_RANKS[card.index]))
+SEED_MASKS: dict[Seed, int] = {seed: 0 for seed in Seed}
+for _card in _CARDS:
+    SEED_MASKS[_card.seed] |= _RANK_BITS[_card.index]
+_ALL_CARDS_MASK: int = (1 << len(_CARDS)) - 1
+
+#strength of every card in a trick led by a given seed, indexed by Card.index: the highest strength
+#takes the trick. The fool never wins, tarots beat everything, the cards of the lead seed follow
+#their sort rank and the cards of any other seed cannot win.
+_CARD_SEEDS: tuple[Seed, ...] = tuple(card.seed for card in _CARDS) #indexed by Card.index
+FOOL_INDEX: int = _CARD_REGISTRY[Seed.tarots, 0].index
+TRICK_STRENGTH: dict[Seed, tuple[int, ...]] = {}
+for _lead in Seed:
+    _strengths = []
+    for _card in _CARDS:
+        if _card.index == FOOL_INDEX:
+            _strengths.append(0)
+        elif _card.seed == Seed.tarots:
+            _strengths.append(100 + _card.number)
+        elif _card.seed == _lead: #position of the card inside its seed, from 1 to 14
+            _seed_base = (SEED_MASKS[_lead] & -SEED_MASKS[_lead]).bit_length() - 1
+            _strengths.append(1 + CARD_RANKS[_card.index] - _seed_base)
+        else:
+            _strengths.append(0)
+    TRICK_STRENGTH[_lead] = tuple(_strengths)
+
+#points of every byte of a mask: _BYTE_POINTS[k][b] is the value of the cards of bits 8k..8k+7 set in b
+_BYTE_POINTS: tuple[tuple[int, ...], ...] = tuple(
+    tuple(
+        sum(CARD_POINTS[_CARDS_BY_RANK[8*k + bit].index] for bit in range(8) if byte >> bit & 1 and 8*k + bit < len(_CARDS))
+        for byte in range(256)
+    )
+    for k in range((len(_CARDS) + 7) // 8)
+)
+
+MAX_SEATS: int = 5 #the most players a game can have
+
+#Zobrist keys of the positions of the card play, indexed by seat (or by position in the trick) then by Card.index:
+#the key of a position is the XOR of the keys of where every card is and of the seat to move. The keys come from
+#a fixed seed, so a key means the same position in every process.
+_zobrist_rng = rnd.Random(0x7A40CC1)
+ZOBRIST_HAND: tuple[tuple[int, ...], ...] = tuple(tuple(_zobrist_rng.getrandbits(64) for _ in _CARDS) for _ in range(MAX_SEATS))
+ZOBRIST_WON: tuple[tuple[int, ...], ...] = tuple(tuple(_zobrist_rng.getrandbits(64) for _ in _CARDS) for _ in range(MAX_SEATS))
+ZOBRIST_TRICK: tuple[tuple[int, ...], ...] = tuple(tuple(_zobrist_rng.getrandbits(64) for _ in _CARDS) for _ in range(MAX_SEATS))
+ZOBRIST_TO_MOVE: tuple[int, ...] = tuple(_zobrist_rng.getrandbits(64) for _ in range(MAX_SEATS))
+del _zobrist_rng
 
-        return 1 
 
 class Hand:
     """
     A class to represent a hand of cards.
+    The hand is stored as a bitset of the standard deck where bit i is set when the card of rank i
+    is in the hand, so membership, seed queries, additions and removals are bit operations and
+    the cards are always listed from the highest to the lowest. A hand holds each card at most once.
     Attributes:
     ----------
+    mask : int
+        The bitset of the cards in the hand, indexed by Card.rank.
     cards : list[Card]
-        A list of Card objects representing the hand.
+        A list of Card objects representing the hand, sorted in descending order.
     Methods:
     -------
     __init__(cards: list[Card]):
@@ -572,12 +789,119 @@ class Hand:
         Returns an empty hand.
     exchange_cards(cls, hand_1: Hand, hand_2: Hand, card_1: Card, card_2: Card) -> None:
         Exchanges specified cards between two hands.
+    from_mask(cls, mask: int) -> Hand:
+        Creates a hand from a bitset of card ranks.
+    seed_mask(seed: Seed) -> int:
+        Returns the bitset of the cards of the specified seed.
     """
 
+    __slots__ = ("mask", "_value", "_cards")
 
     def __init__(self, cards: list[Card]):
-        self.cards = sorted(cards, reverse=True)
-        pass
+        mask = 0
+        for card in cards:
+            mask |= _RANK_BITS[Hand._card_index(card)]
+        self._set_mask(mask)
+
+    @staticmethod
+    def _card_index(card: Card) -> int:
+        """
+        Return the index of a card that can be stored in a hand.
+        Args:
+            card (Card): The card to locate.
+        Returns:
+            int: The index of the card.
+        Raises:
+            ValueError: If the card does not belong to the standard deck.
+        """
+        index = card.index
+        if index is None:
+            raise ValueError(f"{card} is not a card of the standard deck")
+        return index
+
+    @staticmethod
+    def mask_value(mask: int) -> int:
+        """
+        Return the total value of the cards of a mask, summing one precomputed table entry per byte.
+        Args:
+            mask (int): The bitset of card ranks.
+        Returns:
+            int: The total value of the cards.
+        Example:
+            >>> Hand.mask_value(Hand([Card(Seed.spades, 1), Card(Seed.cups, 13)]).mask)
+            11
+        """
+        value = 0
+        for byte_points in _BYTE_POINTS:
+            value += byte_points[mask & 0xFF]
+            mask >>= 8
+        return value
+
+    def _set_mask(self, mask: int) -> None:
+        """
+        Replace the content of the hand, recomputing the cached value and dropping the cached cards.
+        Args:
+            mask (int): The new bitset of the hand.
+        """
+        self.mask = mask
+        self._value = Hand.mask_value(mask)
+        self._cards: list[Card]|None = None
+
+    @classmethod
+    def from_mask(cls, mask: int) -> Hand:
+        """
+        Create a hand from a bitset of card ranks.
+        Args:
+            mask (int): The bitset, where bit i is the card of rank i.
+        Returns:
+            Hand: A hand containing the cards of the bitset.
+        Example:
+            >>> Hand.from_mask(0b11)
+            [2 of spades, Ace of spades]
+        """
+        hand = cls.__new__(cls)
+        hand._set_mask(mask)
+        return hand
+
+    @property
+    def cards(self) -> list[Card]:
+        """
+        Return the cards of the hand sorted in descending order.
+        The list is cached until the hand changes and must not be modified in place.
+        Returns:
+            list[Card]: The cards of the hand.
+        """
+        cards = self._cards
+        if cards is None:
+            cards = []
+            mask = self.mask
+            while mask:
+                top = mask.bit_length() - 1
+                cards.append(_CARDS_BY_RANK[top])
+                mask ^= 1 << top
+            self._cards = cards
+        return cards
+
+    @cards.setter
+    def cards(self, cards: list[Card]) -> None:
+        mask = 0
+        for card in cards:
+            mask |= _RANK_BITS[Hand._card_index(card)]
+        self._set_mask(mask)
+
+    def seed_mask(self, seed: Seed) -> int:
+        """
+        Return the bitset of the cards of a specific seed in the hand.
+        Args:
+            seed (Seed): The seed to filter cards by.
+        Returns:
+            int: The bitset of the cards of the seed.
+        Example:
+            >>> hand = Hand([Card(Seed.spades, 1), Card(Seed.cups, 13)])
+            >>> hand.seed_mask(Seed.spades)
+            1
+        """
+        return self.mask & SEED_MASKS[seed]
 
     def __repr__(self) -> str:
         return f"{self.cards}"
@@ -599,41 +923,47 @@ class Hand:
             >>> print(combined_hand.cards)
             [1 of spades, 13 of cups, 12 of coins, 11 of clubs]
         """
-        new_cards = self.cards + other.cards
-        unique_cards = []
-        seen = set()
-        for card in new_cards:
-            if (card.seed, card.number) not in seen:
-                unique_cards.append(card)
-                seen.add((card.seed, card.number))
-        return Hand(unique_cards)
+        hand = Hand.__new__(Hand)
+        overlap = self.mask & other.mask
+        hand.mask = self.mask | other.mask
+        hand._value = self._value + other._value - (Hand.mask_value(overlap) if overlap else 0)
+        hand._cards = None
+        return hand
 
     def __iter__(self):
         return iter(self.cards)
 
     def __len__(self):
-        return len(self.cards)
+        return self.mask.bit_count()
+
+    def __contains__(self, card: object) -> bool:
+        return isinstance(card, Card) and self.has_card(card)
     
     def __getitem__(self, key):
         return self.cards[key]
 
     def __setitem__(self, key, value):
-        self.cards[key] = value
+        cards = self.cards.copy()
+        cards[key] = value
+        self.cards = cards
 
     def __delitem__(self, key):
-        del self.cards[key]
+        cards = self.cards.copy()
+        del cards[key]
+        self.cards = cards
  
     def __hash__(self):
-        return hash(tuple(self.cards))
+        return hash(self.mask)
 
     @classmethod
-    def random(cls, num: int) -> Hand:
+    def random(cls, num: int, rng: rnd.Random | int | None = None) -> Hand:
         """
         Generate a random hand of cards.
         This method generates a specified number of random cards, ensuring that
         no duplicate cards are included in the hand.
         Args:
             num (int): The number of random cards to generate.
+            rng (rnd.Random | int | None): The generator or seed to use, the global generator if None.
         Returns:
             Hand: A hand containing the specified number of unique random cards.
         Example:
@@ -642,12 +972,11 @@ class Hand:
             [Card(Seed.spades, 5), Card(Seed.cups, 10), Card(Seed.coins, 3)]
         """
 
-        cards = []
-        while len(cards) < num:
-            card = Card.random()
-            if card not in cards:
-                cards.append(card)
-        return Hand(cards)
+        rng = make_rng(rng)
+        hand = Hand.empty()
+        while len(hand) < num:
+            hand.add_card(Card.random(rng))
+        return hand
 
     def cards_of_seed(self, seed: Seed) -> Hand:
         """
@@ -663,7 +992,7 @@ class Hand:
             [Card(Seed.cups, 13)]
         """
 
-        return Hand([card for card in self.cards if card.seed == seed])
+        return Hand.from_mask(self.mask & SEED_MASKS[seed])
 
     def max_card_of_seed(self, seed: Seed) -> Card:
         """
@@ -679,7 +1008,10 @@ class Hand:
             13: The Death
         """
 
-        return max(self.cards_of_seed(seed))
+        mask = self.mask & SEED_MASKS[seed]
+        if not mask:
+            raise ValueError(f"No {seed} cards in the hand")
+        return _CARDS_BY_RANK[mask.bit_length() - 1]
 
     def min_card_of_seed(self, seed: Seed) -> Card:
         """
@@ -694,7 +1026,10 @@ class Hand:
             >>> print(min_card)
             1: The Magician
         """
-        return min(self.cards_of_seed(seed))
+        mask = self.mask & SEED_MASKS[seed]
+        if not mask:
+            raise ValueError(f"No {seed} cards in the hand")
+        return _CARDS_BY_RANK[(mask & -mask).bit_length() - 1]
     
     def add_card(self, card: Card) -> None:
         """
@@ -711,8 +1046,12 @@ class Hand:
             [13 of cups, 1 of spades]
         """
         
-        self.cards.append(card)
-        self.cards.sort(reverse=True)
+        index = Hand._card_index(card)
+        bit = _RANK_BITS[index]
+        if not self.mask & bit:
+            self.mask |= bit
+            self._value += CARD_POINTS[index]
+            self._cards = None
 
     def add_cards(self, cards: List[Card]) -> None:
         """
@@ -728,8 +1067,8 @@ class Hand:
             [13 of cups, 1 of spades]
         """
         
-        self.cards.extend(cards)
-        self.cards.sort(reverse=True)
+        for card in cards:
+            self.add_card(card)
 
     def remove_card(self, card: Card) -> None:
         """
@@ -744,8 +1083,16 @@ class Hand:
             >>> print(hand)
             [13 of cups]
         """
-        self.cards.remove(card)
-        self.cards.sort(reverse=True)
+        index = Hand._card_index(card)
+        bit = _RANK_BITS[index]
+        if not self.mask & bit:
+            raise ValueError(f"{card} is not in the hand")
+        self.mask ^= bit
+        self._value -= CARD_POINTS[index]
+        cards = self._cards
+        if cards is not None: #a new list, as the old one may have been handed out
+            card = _CARDS[index]
+            self._cards = [other for other in cards if other is not card]
 
     def remove_cards(self, cards: List[Card]) -> None:
         """
@@ -762,8 +1109,7 @@ class Hand:
         """
 
         for card in cards:
-            self.cards.remove(card)
-        self.cards.sort(reverse=True)
+            self.remove_card(card)
 
     def has_card(self, card: Card) -> bool:
         """
@@ -779,7 +1125,8 @@ class Hand:
             >>> hand.has_card(card1)
             True
         """
-        return card in self.cards
+        index = card.index
+        return index is not None and bool(self.mask & _RANK_BITS[index])
 
     def has_cards(self, cards: List[Card]) -> bool:
         """
@@ -795,7 +1142,7 @@ class Hand:
             >>> hand.has_cards([card1, card2])
             True
         """
-        return all(card in self.cards for card in cards)
+        return all(self.has_card(card) for card in cards)
 
     def has_seed(self, seed: Seed) -> bool:
         """
@@ -811,7 +1158,7 @@ class Hand:
             >>> hand.has_seed(Seed.spades)
             True
         """
-        return any(card.seed == seed for card in self.cards)
+        return bool(self.mask & SEED_MASKS[seed])
 
     def has_seeds(self, seeds: List[Seed]) -> bool:
         """
@@ -827,20 +1174,22 @@ class Hand:
             >>> hand.has_seeds([Seed.spades, Seed.cups])
             True
         """
-        return all(any(card.seed == seed for card in self.cards) for seed in seeds)
+        mask = self.mask
+        return all(mask & SEED_MASKS[seed] for seed in seeds)
 
     @property
     def value(self) -> int:
         """
-        Calculate the total value of the cards in the hand.
+        Return the total value of the cards in the hand.
+        The total is kept up to date as cards are added and removed, so reading it is O(1).
         Returns:
             int: The total value of the cards in the hand.
         Example:
             >>> hand = Hand([Card(Seed.spades, 1), Card(Seed.cups, 13)])
             >>> hand.value
-            14
+            11
         """
-        return sum(card.value for card in self.cards)
+        return self._value
 
     @property
     def group_cards(self) -> dict[Seed, List[Card]]:
@@ -935,7 +1284,7 @@ class Hand:
             >>> hand.is_empty
             True
         """
-        return not bool(self.cards)
+        return not self.mask
 
     def sort(self) -> Hand:
         """
@@ -948,7 +1297,7 @@ class Hand:
             >>> print(sorted_hand)
             [13 of cups, 5 of spades, 1 of spades]
         """
-        return Hand(sorted(self.cards, reverse=True))   
+        return Hand.from_mask(self.mask)
 
     def clear(self) -> None:
         """
@@ -959,16 +1308,20 @@ class Hand:
         >>> print(hand)
         []
         """
-        self.cards.clear()
+        self._set_mask(0)
 
 class Deck:
     """
     A class representing a deck of cards.
+    Drawing moves a cursor over the list of cards instead of slicing it, and the drawn cards are
+    only discarded from the list when the deck is modified in another way.
     Attributes:
         cards (List[Card]): A list of Card objects representing the deck.
+        rng (rnd.Random | int | None): The generator or seed used to shuffle the deck, None for the
+            global generator.
     Methods:
-        __init__(cards: List[Card]):
-            Initializes the Deck with a list of cards.
+        __init__(cards: List[Card], rng: rnd.Random | int | None = None):
+            Initializes the Deck with a list of cards and an optional random number generator.
         __repr__():
             Returns a string representation of the deck.
         __iter__():
@@ -981,8 +1334,10 @@ class Deck:
             Sets the card at the specified index.
         __delitem__(key):
             Deletes the card at the specified index.
-        standard() -> Deck:
+        standard(rng: rnd.Random | int | None = None) -> Deck:
             Creates a standard deck of cards.
+        reset_standard():
+            Puts back all the cards of the standard deck, reusing the list.
         shuffle():
             Shuffles the deck.
         draw(num: int) -> List[Card]:
@@ -1024,15 +1379,38 @@ class Deck:
     """
 
 
-    def __init__(self, cards: List[Card]):
+    def __init__(self, cards: List[Card], rng: rnd.Random | int | None = None):
         """
         Initialize the Tarot deck with a list of cards.
         Args:
             cards (List[Card]): A list of Card objects representing the tarot deck.
+            rng (rnd.Random | int | None): The generator or seed used to shuffle the deck, the global
+                generator if None.
         """
 
-        self.cards = cards
-        pass
+        self._cards = cards
+        self._cursor = 0 #position of the next card to draw
+        self.rng = make_rng(rng) if rng is not None else None #None keeps following random.seed
+
+    #positions of the prize and of each hand in a deal, by (number of players, number of cards)
+    _DEAL_LAYOUTS: dict[tuple[int, int], tuple[list[int], list[list[int]]]] = {}
+
+    @property
+    def cards(self) -> List[Card]:
+        """
+        Return the cards left in the deck, discarding the ones already drawn.
+        Returns:
+            List[Card]: The cards left in the deck.
+        """
+        if self._cursor:
+            del self._cards[:self._cursor]
+            self._cursor = 0
+        return self._cards
+
+    @cards.setter
+    def cards(self, cards: List[Card]) -> None:
+        self._cards = cards
+        self._cursor = 0
 
     def __repr__(self):
         """
@@ -1050,7 +1428,7 @@ class Deck:
         return iter(self.cards)
 
     def __len__(self):
-        return len(self.cards)
+        return len(self._cards) - self._cursor
 
     def __getitem__(self, key):
         return self.cards[key]
@@ -1157,9 +1535,12 @@ class Deck:
         return hash(tuple(self.cards))
 
     @classmethod
-    def standard(cls) -> Deck:
+    def standard(cls, rng: rnd.Random | int | None = None) -> Deck:
         """
         Create a standard deck of cards.
+        Args:
+            rng (rnd.Random | int | None): The generator or seed used to shuffle the deck, the global
+                generator if None.
         Returns:
             Deck: A standard deck of cards.
         Example:
@@ -1168,28 +1549,36 @@ class Deck:
             [0: The Fool, 1: The Magician, 2: The High Priestess, ..., 13 of coins, 14 of coins, ..., 14 of swords]
         """
 
-        cards = []
-        for seed in Seed:
-
-            if seed == Seed.tarots:
-                cards.extend([Card(seed, number) for number in range(22)])
-            else:
-                cards.extend([Card(seed, number) for number in range(1, 15)])
-        return Deck(cards)
+        return Deck(list(_CARD_REGISTRY.values()), rng)
     
+    def reset_standard(self) -> None:
+        """
+        Put back all the cards of the standard deck in deck order, reusing the list of the deck.
+        Example:
+            >>> deck = Deck.standard()
+            >>> deck.draw(10)
+            >>> deck.reset_standard()
+            >>> len(deck)
+            78
+        """
+
+        self._cards[:] = _CARDS
+        self._cursor = 0
+        return None
+
     def shuffle(self):
        
         """
         Shuffle the deck.
-        This method shuffles the cards in the deck in random order.
+        This method shuffles the cards in the deck in random order with the generator of the deck.
         Example:
-        >>> deck = Deck.standard()
+        >>> deck = Deck.standard(rng=42)
         >>> deck.shuffle()
         >>> print(deck)
         [13 of coins, 4 of spades, 1 of cups, ..., 14 of swords]
         """
         
-        rnd.shuffle(self.cards)
+        make_rng(self.rng).shuffle(self.cards)
 
     def draw(self, num: int) -> List[Card]:
         """
@@ -1205,8 +1594,9 @@ class Deck:
             [0: The Fool, 1: The Magician, 2: The High Priestess]
         """
 
-        drawn = self.cards[:num]
-        self.cards = self.cards[num:]
+        start = self._cursor
+        drawn = self._cards[start:start + num]
+        self._cursor = start + len(drawn)
         
         return drawn
 
@@ -1285,16 +1675,55 @@ class Deck:
             prize_draw = 3
             initial_draw = 5
 
-        prize = self.draw_hand(prize_draw) #draw the prize
-        hands = [self.draw_hand(initial_draw) for _ in range(num_players)] #draw the initial
+        cards = self._cards
+        start = self._cursor
+        prize_positions, hands_positions = Deck._deal_layout(num_players, len(cards) - start, prize_draw, initial_draw)
 
-        #draw 5 cards per player until the deck is empty
-        while self.cards:
-            for hand in hands:
-                hand.add_cards(self.draw(5))
+        prize = Hand([cards[start + position] for position in prize_positions])
+        hands = [Hand([cards[start + position] for position in positions]) for positions in hands_positions]
+        self._cursor = len(cards) #the whole deck has been dealt
 
         return hands, prize
 
+    @classmethod
+    def _deal_layout(cls, num_players: int, num_cards: int, prize_draw: int, initial_draw: int) -> tuple[list[int], list[list[int]]]:
+        """
+        Return the positions of the cards that go to the prize and to each player when dealing.
+        The prize is drawn first, then each player draws the initial cards, then each player in turn
+        draws 5 cards until the deck is empty. The layout only depends on the number of players and
+        of cards, so it is computed once and cached.
+        Args:
+            num_players (int): The number of players.
+            num_cards (int): The number of cards in the deck.
+            prize_draw (int): The number of cards of the prize.
+            initial_draw (int): The number of cards initially drawn by each player.
+        Returns:
+            tuple[list[int], list[list[int]]]: The positions of the prize and of the hand of each player.
+        """
+
+        key = (num_players, num_cards)
+        layout = cls._DEAL_LAYOUTS.get(key)
+        if layout is not None:
+            return layout
+
+        position = min(prize_draw, num_cards)
+        prize_positions = list(range(position))
+        hands_positions: list[list[int]] = []
+        for _ in range(num_players): #the initial draw
+            end = min(position + initial_draw, num_cards)
+            hands_positions.append(list(range(position, end)))
+            position = end
+
+        while position < num_cards: #5 cards per player until the deck is empty
+            for positions in hands_positions:
+                end = min(position + 5, num_cards)
+                positions.extend(range(position, end))
+                position = end
+
+        layout = (prize_positions, hands_positions)
+        cls._DEAL_LAYOUTS[key] = layout
+        return layout
+
     @property
     def group_cards(self) -> dict[Seed, List[Card]]:
         """
@@ -1492,7 +1921,7 @@ class Deck:
             >>> print(sorted_deck)
             [13 of cups, 1 of spades]
         """
-        return Deck(sorted(self.cards))
+        return Deck(sorted(self.cards), self.rng)
     
     @property
     def reversed(self) -> Deck:
@@ -1506,7 +1935,7 @@ class Deck:
             >>> print(reversed_deck)
             [1 of spades, 13 of cups]
         """
-        return Deck(list(reversed(self.cards)))
+        return Deck(list(reversed(self.cards)), self.rng)
     
     def sort(self) -> None:
         """
@@ -1531,6 +1960,140 @@ class Deck:
         """
         self.cards.clear()
        
+
+class Strategy:
+    """
+    A decision policy of a player: the game asks the strategy of each player for every choice, so the same
+    game can be played from the console or driven by bots without any I/O.
+    The base class chooses uniformly at random among the options it is given and never prints anything.
+    Attributes:
+        rng (rnd.Random | None): The generator used for the random choices, None to use the generator
+            the game passes or the global one.
+    Methods:
+        __init__(rng: rnd.Random | int | None = None):
+            Initializes the Strategy with an optional random number generator or seed.
+        choice_bool(player: Player, rng: rnd.Random | int | None = None, game: Game | None = None) -> bool:
+            Decide whether to claim the prize.
+        choose_card(player: Player, available_cards: list[Card], game: Game | None = None) -> Card:
+            Choose the card to call among the available cards.
+        choose_own_card(player: Player, available_cards: list[Card], game: Game | None = None) -> Card:
+            Choose a card of the hand to play or to give away.
+        choose_own_card_for_prize(player: Player, available_cards: list[Card], game: Game | None = None) -> Card:
+            Choose a card of the hand to discard after taking the prize.
+        notify(player: Player, message: str) -> None:
+            Receive a message for the player, like the reason a card was rejected.
+    """
+
+    def __init__(self, rng: rnd.Random | int | None = None):
+        self.rng = make_rng(rng) if rng is not None else None
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}()"
+
+    def _rng(self, rng: rnd.Random | int | None = None) -> rnd.Random:
+        return self.rng if self.rng is not None else make_rng(rng)
+
+    def choice_bool(self, player: Player, rng: rnd.Random | int | None = None, game: Game | None = None) -> bool:
+        """
+        Decide whether to claim the prize. The base strategy flips a coin.
+        Args:
+            player (Player): The player deciding.
+            rng (rnd.Random | int | None): The generator of the game, used if the strategy has none.
+            game (Game | None): The game being played, if any.
+        Returns:
+            bool: True to claim the prize, False otherwise.
+        """
+
+        return self._rng(rng).choice([True, False])
+
+    def choose_card(self, player: Player, available_cards: list[Card], game: Game | None = None) -> Card:
+        """
+        Choose the card to call among the available cards.
+        Args:
+            player (Player): The player choosing.
+            available_cards (list[Card]): The cards that can be called.
+            game (Game | None): The game being played, if any.
+        Returns:
+            Card: The chosen card.
+        """
+
+        return self._rng(game.rng if game else None).choice(available_cards)
+
+    def choose_own_card(self, player: Player, available_cards: list[Card], game: Game | None = None) -> Card:
+        """
+        Choose a card of the hand to play or to give away.
+        Args:
+            player (Player): The player choosing.
+            available_cards (list[Card]): The cards of the hand that can be chosen.
+            game (Game | None): The game being played, if any.
+        Returns:
+            Card: The chosen card.
+        """
+
+        return self._rng(game.rng if game else None).choice(available_cards)
+
+    def choose_own_card_for_prize(self, player: Player, available_cards: list[Card], game: Game | None = None) -> Card:
+        """
+        Choose a card of the hand to discard after taking the prize.
+        Args:
+            player (Player): The player choosing.
+            available_cards (list[Card]): The cards of the hand that can be discarded.
+            game (Game | None): The game being played, if any.
+        Returns:
+            Card: The chosen card.
+        """
+
+        return self._rng(game.rng if game else None).choice(available_cards)
+
+    def notify(self, player: Player, message: str) -> None:
+        """
+        Receive a message for the player. The base strategy ignores it.
+        Args:
+            player (Player): The player the message is for.
+            message (str): The message.
+        """
+
+        return None
+
+
+class ConsoleStrategy(Strategy):
+    """
+    A strategy asking a human player for every choice: the options are printed and the choice is read
+    with input(). The prize claim stays a random choice.
+    Methods:
+        ask(prompt: str, available_cards: list[Card]) -> Card:
+            Print the available cards and read the number of the chosen one.
+    """
+
+    def ask(self, prompt: str, available_cards: list[Card]) -> Card:
+        """
+        Print the available cards and read the number of the chosen one.
+        Args:
+            prompt (str): The line printed before the cards.
+            available_cards (list[Card]): The cards to choose from.
+        Returns:
+            Card: The chosen card.
+        """
+
+        print(prompt)
+        for idx, card in enumerate(available_cards):
+            print(f"{idx + 1}: {card}")
+        choice = int(input("Enter the number of the card you want to choose: ")) - 1
+        return available_cards[choice]
+
+    def choose_card(self, player: Player, available_cards: list[Card], game: Game | None = None) -> Card:
+        return self.ask("Choose a card from the available cards:", available_cards)
+
+    def choose_own_card(self, player: Player, available_cards: list[Card], game: Game | None = None) -> Card:
+        return self.ask("Choose a card from your hand:", available_cards)
+
+    def choose_own_card_for_prize(self, player: Player, available_cards: list[Card], game: Game | None = None) -> Card:
+        return self.ask("Choose a card from your hand for the prize:", available_cards)
+
+    def notify(self, player: Player, message: str) -> None:
+        print(message)
+        return None
+
         
 class Player:
     """
@@ -1542,9 +2105,10 @@ class Player:
         debt (int): The debt of the player.
         won_cards (Hand): The cards won by the player.
         asking (bool): A flag indicating if the player is asking for cards.
+        strategy (Strategy): The policy taking the decisions of the player, a ConsoleStrategy by default.
     Methods:
-        __init__(name: str, hand: Hand): 
-            Initializes the Player with a name and a hand of cards.
+        __init__(name: str, hand: Hand | None = None, strategy: Strategy | None = None): 
+            Initializes the Player with a name, a hand of cards and a decision strategy.
         __repr__():
             Returns a string representation of the player.
         __iter__():
@@ -1577,11 +2141,15 @@ class Player:
             Reset the player's won cards to an empty hand.
         value() -> int:
             Calculate the total value of the cards in the player's hand.
-        choose_card() -> Card:
-            Choose a card to play.
-        choose_own_card() -> Card:
+        choose_card(available_cards: list[Card], game: Game | None = None) -> Card:
+            Choose a card among the available ones.
+        choose_own_card(available_cards: list[Card] | None = None, game: Game | None = None) -> Card:
             Choose a card from the player's hand.
-        choice_bool() -> bool:
+        choose_own_card_for_prize(game: Game | None = None) -> Card:
+            Choose a card from the player's hand to discard after taking the prize.
+        notify(message: str) -> None:
+            Pass a message to the player's strategy.
+        choice_bool(rng: rnd.Random | int | None = None, game: Game | None = None) -> bool:
             Choose a boolean value.
         add_won_card(card: Card):
             Add a card to the player's won cards.
@@ -1615,13 +2183,14 @@ class Player:
             Create a placeholder player or a list of placeholder players.
     """
 
-    def __init__(self, name:str, hand: Hand = Hand.empty()):
+    def __init__(self, name:str, hand: Hand | None = None, strategy: Strategy | None = None):
         self.name = name
-        self.hand = hand
+        self.hand = hand if hand is not None else Hand.empty() #a shared default hand would be mutated by every player
         self.score = 0
         self.debt = 0
         self.won_cards = Hand.empty()
         self.asking = False
+        self.strategy = strategy if strategy is not None else ConsoleStrategy()
 
     def __repr__(self):
         return f"{self.name}"
@@ -1909,52 +2478,62 @@ class Player:
 
         return self.hand.value
     
-    def choose_card(self, available_cards: list[Card]) -> Card:
+    def choose_card(self, available_cards: list[Card], game: Game | None = None) -> Card:
         """
         Choose a card from the available cards.
         Args:
             available_cards (list[Card]): The list of available cards to choose from.
+            game (Game | None): The game being played, if any.
         Returns:
             Card: The chosen card.
         """
-        print("Choose a card from the available cards:")
-        for idx, card in enumerate(available_cards):
-            print(f"{idx + 1}: {card}")
-        choice = int(input("Enter the number of the card you want to choose: ")) - 1
-        return available_cards[choice]
 
-    def choose_own_card(self) -> Card:
+        return self.strategy.choose_card(self, available_cards, game)
+
+    def choose_own_card(self, available_cards: list[Card] | None = None, game: Game | None = None) -> Card:
         """
         Choose a card from the player's hand.
+        Args:
+            available_cards (list[Card] | None): The cards of the hand that can be chosen, the whole hand if None.
+            game (Game | None): The game being played, if any.
         Returns:
             Card: The chosen card.
         """
-        print("Choose a card from your hand:")
-        for idx, card in enumerate(self.hand.cards):
-            print(f"{idx + 1}: {card}")
-        choice = int(input("Enter the number of the card you want to choose: ")) - 1
-        return self.hand.cards[choice]
 
-    def choose_own_card_for_prize(self) -> Card:
-        
-        tarots = [card for card in self.hand.cards if card.seed == Seed.tarots]
+        if available_cards is None:
+            available_cards = self.hand.cards
+        return self.strategy.choose_own_card(self, available_cards, game)
+
+    def choose_own_card_for_prize(self, game: Game | None = None) -> Card:
+        """
+        Choose a card from the player's hand to discard after taking the prize: the cards worth 13 can
+        only be discarded if they are tarots.
+        Args:
+            game (Game | None): The game being played, if any.
+        Returns:
+            Card: The chosen card.
+        """
 
         available_cards = [card for card in self.hand.cards if (card.value != 13 or card.seed == Seed.tarots)]
-        available_cards.extend(tarots)
-
-        print("Choose a card from your hand for the prize:")
-        for idx, card in enumerate(available_cards):
-            print(f"{idx + 1}: {card}")
-        choice = int(input("Enter the number of the card you want to choose: ")) - 1
-        return available_cards[choice]
-
+        return self.strategy.choose_own_card_for_prize(self, available_cards, game)
 
+    def notify(self, message: str) -> None:
+        """
+        Pass a message to the player's strategy, which may show it or ignore it.
+        Args:
+            message (str): The message.
+        """
 
+        self.strategy.notify(self, message)
+        return None
 
 
-    def choice_bool(self) -> bool:
+    def choice_bool(self, rng: rnd.Random | int | None = None, game: Game | None = None) -> bool:
         """
         Choose a boolean value.
+        Args:
+            rng (rnd.Random | int | None): The generator or seed to use, the global generator if None.
+            game (Game | None): The game being played, if any.
         Returns:
             bool: The boolean value chosen.
         Example:
@@ -1963,7 +2542,7 @@ class Player:
             >>> print(choice)
             True
         """
-        return rnd.choice([True, False]) 
+        return self.strategy.choice_bool(self, rng, game)
 
     def add_won_card(self, card: Card) -> None:
         """
@@ -2270,13 +2849,15 @@ class Player:
             >>> player.is_hand_empty
             True
         """
-        return not bool(self.hand.cards)
+        return self.hand.is_empty
 
     
 
 class PlayedCard(Card):
     """
     A class representing a card played by a player.
+    Played cards compare as their cards do. Which card takes a trick depends on the lead seed of the trick, which
+    a played card does not know: see CardRound.winner_played_card and CardRound.sorted.
     Attributes:
         seed (Seed): The seed of the card.
         number (int): The number of the card.
@@ -2291,14 +2872,6 @@ class PlayedCard(Card):
             Check if the played card is equal to another played card.
         __ne__(other: PlayedCard) -> bool:
             Check if the played card is not equal to another played card.
-        __lt__(other: PlayedCard) -> bool:
-            Check if the played card is less than another played card.
-        __le__(other: PlayedCard) -> bool:
-            Check if the played card is less than or equal to another played card.
-        __gt__(other: PlayedCard) -> bool:
-            Check if the played card is greater than another played card.
-        __ge__(other: PlayedCard) -> bool:
-            Check if the played card is greater than or equal to another played card.
         from_card(cls, card: Card, order: int, owner: Player = Player.placeholder()) -> PlayedCard:
             Create a PlayedCard from a Card.
         random(cls, maxOrder: int) -> PlayedCard:
@@ -2309,10 +2882,17 @@ class PlayedCard(Card):
             Return the card of the played card.
     """
 
+    __slots__ = ("order", "player")
+
+    def __new__(cls, seed: Seed, number: int, order: int, player: Player) -> PlayedCard:
+        return cls._create(seed, number) #played cards carry their own state, never interned
+
     def __init__(self, seed: Seed, number: int, order: int, player: Player):
-        super().__init__(seed, number)
-        self.order = order
-        self.player = player
+        object.__setattr__(self, "order", order)
+        object.__setattr__(self, "player", player)
+
+    def __reduce__(self):
+        return (PlayedCard, (self.seed, self.number, self.order, self.player))
 
     def __repr__(self):
         """
@@ -2359,92 +2939,6 @@ class PlayedCard(Card):
         """
         return not self.__eq__(other)
 
-    def __lt__(self, other: Card) -> bool:
-        """
-        Check if the played card is less than another played card.
-        Args:
-            other (PlayedCard): The other played card to compare with.
-        Returns:
-            bool: True if the played card is less than the other played card, False otherwise.
-        Example:
-            >>> card_1 = PlayedCard(Seed.spades, 1, 0, Player("Alice"))
-            >>> card_2 = PlayedCard(Seed.spades, 2, 1, Player("Bob"))
-            >>> card_1 < card_2
-            True
-        """
-
-        if not isinstance(other, PlayedCard):
-            return NotImplemented
-
-        if self == other: #if the cards are the same
-            return False
-
-        if self.number == 0 or other.number == 0: #if one of the cards is the fool
-            return self.number == 0
-
-        if self.seed == Seed.tarots: #if self is a tarots card
-            return other.seed != Seed.tarots or self.number < other.number
-
-        if other.seed == Seed.tarots: #if the other card is a tarots card and self is not
-            return False 
-
-        if self.seed != other.seed: #if the second card is not the same seed as the first
-            return self.number < other.number
-
-        if self.number > 10 or other.number > 10: #if the card is a figure
-            return self.number < other.number
-
-        if self.seed in [Seed.cups, Seed.coins]: #if the seed is cups or coins
-            return self.number > other.number
-        
-        return self.number < other.number #check the higher number
-               
-    def __le__(self, other: Card) -> bool:
-        """
-        Check if the played card is less than or equal to another played card.
-        Args:
-            other (PlayedCard): The other played card to compare with.
-        return self.__lt__(other) or self.__eq__(other)
-        Example:
-            >>> card_1 = PlayedCard(Seed.spades, 1, 0, Player("Alice"))
-            >>> card_2 = PlayedCard(Seed.spades, 1, 0, Player("Bob"))
-            >>> card_1 <= card_2
-            True
-        """
-        return self.__lt__(other) or self.__eq__(other)
-
-    def __gt__(self, other: Card) -> bool:
-        """
-        Check if the played card is greater than another played card.
-        Args:
-            other (PlayedCard): The other played card to compare with.
-        Returns:
-            bool: True if the played card is greater than the other played card, False otherwise.
-        Example:
-            >>> card_1 = PlayedCard(Seed.spades, 1, 0, Player("Alice"))
-            >>> card_2 = PlayedCard(Seed.spades, 2, 1, Player("Bob"))
-            >>> card_1 > card_2
-            False
-        """
-
-        return not self.__le__(other)
-
-    def __ge__(self, other: Card) -> bool:
-        """
-        Check if the played card is greater than or equal to another played card.
-        Args:
-            other (PlayedCard): The other played card to compare with.
-        Returns:
-            bool: True if the played card is greater than or equal to the other played card, False otherwise.
-        Example:
-            >>> card_1 = PlayedCard(Seed.spades, 1, 0, Player("Alice"))
-            >>> card_2 = PlayedCard(Seed.spades, 1, 0, Player("Bob"))
-            >>> card_1 >= card_2
-            True
-        """
-
-        return not self.__lt__(other)
-
     def __hash__(self):
         return hash(self.card)
 
@@ -2468,11 +2962,11 @@ class PlayedCard(Card):
         return PlayedCard(card.seed, card.number, order, owner)
 
     @classmethod
-    def random(cls) -> PlayedCard:
+    def random(cls, rng: rnd.Random | int | None = None) -> PlayedCard:
         """
         Create a random PlayedCard.
         Args:
-            maxOrder (int): The maximum order for the random PlayedCard.
+            rng (rnd.Random | int | None): The generator or seed to use, the global generator if None.
         Returns:
             PlayedCard: A random PlayedCard.
         Example:
@@ -2481,8 +2975,9 @@ class PlayedCard(Card):
             '0) 1 of spades from placeholder'
         """
 
-        card = Card.random()
-        order = rnd.randint(0, 100)
+        rng = make_rng(rng)
+        card = Card.random(rng)
+        order = rng.randint(0, 100)
         player = Player.placeholder()
         return PlayedCard(card.seed, card.number, order, player)
 
@@ -2517,7 +3012,10 @@ class PlayedCard(Card):
             1 of spades
         """
 
-        return Card(seed=self.seed,number=self.number)
+        index = self.index
+        if index is None:
+            return Card(self.seed, self.number)
+        return _CARDS[index]
 
 
 class CardRound:
@@ -2543,7 +3041,7 @@ class CardRound:
         random(cls, num: int) -> CardRound:
             Create a random CardRound.
         winner_played_card() -> PlayedCard:
-            Return the played card with the highest value.
+            Return the played card that takes the trick.
         winner_player() -> Player:
             Return the player who played the card with the highest value.
         add_card(card: PlayedCard) -> None:
@@ -2565,7 +3063,7 @@ class CardRound:
         value() -> int:
             Calculate the total value of the cards in the card round.
         sorted() -> CardRound:
-            Return a sorted version of the card round.
+            Return the card round in the order the cards rank in the trick, the winner last.
         reversed() -> CardRound:
             Return a reversed version of the card round.
         ordered() -> CardRound:
@@ -2574,8 +3072,18 @@ class CardRound:
             Return a reversed ordered version of the card round.
         seed() -> Seed:
             Return the seed of the card round.
+        lead_seed() -> Seed | None:
+            Return the seed the other players must follow.
+        legal_mask(cls, mask: int, lead: Seed | None) -> int:
+            Return the bitset of the cards of a hand bitset that can be played on a lead seed.
+        legal_cards(player: Player) -> list[Card]:
+            Return the cards of a player that can be put into play.
         empty() -> CardRound:
             Return an empty card round.
+        trick_winner(cls, indices: Sequence[int]) -> int:
+            Return the position of the card that takes a trick given as card indices.
+        resolve_tricks(cls, tricks: Iterable[Sequence[int]]) -> list[tuple[int, int]]:
+            Return the winning position and the points of many tricks at once.
     """
 
     def __init__(self, cards: list[PlayedCard]):
@@ -2651,11 +3159,12 @@ class CardRound:
         return CardRound(PlayedCard.from_cards(cards,players))
 
     @classmethod
-    def random(cls, num: int) -> CardRound:
+    def random(cls, num: int, rng: rnd.Random | int | None = None) -> CardRound:
         """
         Create a random CardRound.
         Args:
             num (int): The number of random played cards to create.
+            rng (rnd.Random | int | None): The generator or seed to use, the global generator if None.
         Returns:
             CardRound: A random CardRound.
         Example:
@@ -2664,21 +3173,75 @@ class CardRound:
             '0) 1 of spades from placeholder\n1) 1 of spades from placeholder\n2) 1 of spades from placeholder\n'
         """
 
-        return CardRound([PlayedCard.random() for _ in range(num)])
+        rng = make_rng(rng)
+        return CardRound([PlayedCard.random(rng) for _ in range(num)])
 
     @property
     def winner_played_card(self) -> PlayedCard:
         """
-        Return the played card with the highest value.
+        Return the played card that takes the trick.
+        The fool never wins, the highest tarot wins if any was played, otherwise the highest card of
+        the lead seed wins. The lead seed is the seed of the first card that is not the fool.
         Returns:
-            PlayedCard: The played card with the highest value.
+            PlayedCard: The played card that takes the trick.
         Example:
             >>> card_round = CardRound([PlayedCard(Seed.spades, 1, 0, Player("Alice"))])
             >>> print(card_round.winner_played_card)
             '0) 1 of spades from Alice'
         """
 
-        return max(self.played_cards)
+        played_cards = self.played_cards
+        if not played_cards:
+            raise ValueError("No cards in the round")
+
+        return played_cards[CardRound.trick_winner([card.index for card in played_cards])]
+
+    @classmethod
+    def trick_winner(cls, indices: Sequence[int]) -> int:
+        """
+        Return the position of the card that takes a trick, comparing the precomputed
+        TRICK_STRENGTH of each card for the lead seed.
+        Args:
+            indices (Sequence[int]): The Card.index of the cards of the trick, in play order.
+        Returns:
+            int: The position in the trick of the winning card.
+        Example:
+            >>> CardRound.trick_winner([Card(Seed.cups, 3).index, Card(Seed.cups, 1).index, Card(Seed.spades, 14).index])
+            1
+        """
+
+        lead = indices[0]
+        if lead == FOOL_INDEX and len(indices) > 1: #the fool does not set the lead seed
+            lead = indices[1]
+        strengths = TRICK_STRENGTH[_CARD_SEEDS[lead]]
+
+        winner = 0
+        best = strengths[indices[0]]
+        for position in range(1, len(indices)):
+            strength = strengths[indices[position]]
+            if strength > best:
+                winner = position
+                best = strength
+        return winner
+
+    @classmethod
+    def resolve_tricks(cls, tricks: Iterable[Sequence[int]]) -> list[tuple[int, int]]:
+        """
+        Resolve many tricks in one call.
+        Args:
+            tricks (Iterable[Sequence[int]]): The tricks, each one given as the Card.index of its cards in play order.
+        Returns:
+            list[tuple[int, int]]: For every trick the position of the winning card and the points of the trick.
+        Example:
+            >>> spades = [Card(Seed.spades, 13).index, Card(Seed.spades, 2).index, Card(Seed.tarots, 5).index]
+            >>> cups = [Card(Seed.cups, 1).index, Card(Seed.cups, 14).index, Card(Seed.coins, 14).index]
+            >>> CardRound.resolve_tricks([spades, cups])
+            [(2, 12), (1, 27)]
+        """
+
+        trick_winner = cls.trick_winner
+        points = CARD_POINTS
+        return [(trick_winner(trick), sum([points[index] for index in trick])) for trick in tricks]
 
     @property
     def winner_player(self) -> Player:
@@ -2832,16 +3395,23 @@ class CardRound:
     @property
     def sorted(self) -> CardRound:
         """
-        Return a sorted version of the card round.
+        Return the card round with the cards in the order they rank in the trick, by their TRICK_STRENGTH for
+        the lead seed, so the last card is the one that takes the trick. Of two cards of the same strength the
+        one played first ranks higher, as in trick_winner.
         Returns:
             CardRound: A sorted version of the card round.
         Example:
             >>> card_round = CardRound([PlayedCard(Seed.spades, 1, 0, Player("Alice")), PlayedCard(Seed.cups, 13, 1, Player("Bob"))])
             >>> print(card_round.sorted)
-            '0) 1 of spades from Alice\n1) 13 of cups from Bob\n'
+            '1) 13 of cups from Bob\n0) 1 of spades from Alice\n'
         """
 
-        return CardRound(sorted(self.played_cards))
+        lead = self.lead_seed
+        if lead is None: #no card or only the fool
+            return CardRound(list(self.played_cards))
+        strengths = TRICK_STRENGTH[lead]
+        positions = sorted(range(len(self.played_cards)), key=lambda position: (strengths[self.played_cards[position].index], -position))
+        return CardRound([self.played_cards[position] for position in positions])
 
     @property
     def reversed(self) -> CardRound:    
@@ -2902,11 +3472,77 @@ class CardRound:
         
         return self.played_cards[0].seed
 
+    @property
+    def lead_seed(self) -> Seed | None:
+        """
+        Return the seed the other players must follow: the seed of the first card that is not the fool,
+        as for the winner of the trick.
+        Returns:
+            Seed | None: The lead seed, None if no card or only the fool was played.
+        Example:
+            >>> card_round = CardRound([PlayedCard(Seed.tarots, 0, 0, Player("Alice")), PlayedCard(Seed.cups, 3, 1, Player("Bob"))])
+            >>> card_round.lead_seed
+            <Seed.cups: 4>
+        """
+
+        for played_card in self.played_cards:
+            if played_card.index != FOOL_INDEX:
+                return played_card.seed
+        return None
+
+    @classmethod
+    def legal_mask(cls, mask: int, lead: Seed | None) -> int:
+        """
+        Return the cards of a hand that can be played on a lead seed, using the precomputed SEED_MASKS:
+        the cards of the lead seed if there are any, otherwise the tarots if there are any, otherwise the
+        whole hand.
+        Args:
+            mask (int): The bitset of the hand, as in Hand.mask.
+            lead (Seed | None): The lead seed of the trick, None if anything can be played.
+        Returns:
+            int: The bitset of the legal cards.
+        Example:
+            >>> hand = Hand([Card(Seed.spades, 1), Card(Seed.tarots, 5), Card(Seed.cups, 2)])
+            >>> Hand.from_mask(CardRound.legal_mask(hand.mask, Seed.coins))
+            [5: The Hierophant]
+        """
+
+        if lead is None:
+            return mask
+        legal = mask & SEED_MASKS[lead]
+        if legal:
+            return legal
+        legal = mask & SEED_MASKS[Seed.tarots]
+        if legal:
+            return legal
+        return mask
+
+    def legal_cards(self, player: Player) -> list[Card]:
+        """
+        Return the cards of a player that can be put into play: the player must follow the lead seed,
+        otherwise play a tarot, otherwise anything.
+        Args:
+            player (Player): The player who has to play.
+        Returns:
+            list[Card]: The legal cards, sorted in descending order.
+        Example:
+            >>> card_round = CardRound([PlayedCard(Seed.spades, 1, 0, Player("Alice"))])
+            >>> card_round.legal_cards(Player("Bob", Hand([Card(Seed.spades, 3), Card(Seed.cups, 13)])))
+            [3 of spades]
+        """
+
+        hand = player.hand
+        legal = CardRound.legal_mask(hand.mask, self.lead_seed)
+        if legal == hand.mask:
+            return hand.cards
+        return Hand.from_mask(legal).cards
+
     def put_card_into_play(self, played_card: PlayedCard) -> bool:
         """
-        Put a card into play. The card must be of the same seed as the round or a tarot card. 
-        If the card is not of the same seed as the round and the player has cards of the same seed as the round, the card cannot be put into play. 
-        If the card is not of the same seed as the round and the player has tarot cards, the card must be a tarot card.
+        Put a card into play. The card must be of the lead seed of the round or a tarot card. 
+        If the card is not of the lead seed and the player has cards of the lead seed, the card cannot be put into play. 
+        If the card is not of the lead seed and the player has tarot cards, the card must be a tarot card.
+        A fool played first does not set the lead seed, see legal_cards for the moves allowed.
         Args:
             played_card (PlayedCard): The card to put into play.
         Returns:
@@ -2928,18 +3564,13 @@ class CardRound:
         card = played_card.card
         player = played_card.player
 
-        if self.is_empty: #if the card round is empty
-            player.hand.remove_card(card) #remove the card from the player's hand
-            self.add_card(played_card) #add the card to the card round
-            return True
-
-
-        if card.seed != self.seed: #if the card is not of the same seed as the round
-            if player.has_seed(self.seed): #if the player has cards of the same seed as the round
-                print(f"Card must be of the {self.seed} seed")
+        lead = self.lead_seed
+        if lead is not None and card.seed != lead: #if the card is not of the lead seed
+            if player.has_seed(lead): #if the player has cards of the lead seed
+                player.notify(f"Card must be of the {lead} seed")
                 return False
-            if player.has_seed(Seed.tarots): #if the player has tarots cards
-                print(f"{self.seed} cards finished, card must be a tarot")
+            if card.seed != Seed.tarots and player.has_seed(Seed.tarots): #if the player has tarots cards
+                player.notify(f"{lead} cards finished, card must be a tarot")
                 return False
         
         player.hand.remove_card(card) #remove the card from the player's hand
@@ -2956,6 +3587,222 @@ class CardRound:
         return [played_card.card for played_card in self.played_cards]
 
 
+class Beliefs:
+    """
+    What one player can deduce about the hands of the others, kept up to date card by card. A player who does
+    not follow the lead seed holds none of its cards, and one who plays neither the lead seed nor a tarot holds
+    no tarots either; the cards played, the cards the observer has seen and the cards known to be in a hand
+    (the called card, held by the asking player, and for the asking player and the partner the card given in
+    the exchange) cannot be in any other hand. A called tarot may have been discarded by the asking player, so
+    it is only ruled out of the other hands. Every update is a few bitset operations, as in Hand.mask.
+    Attributes:
+        seat (int): The seat of the observer.
+        num_players (int): The number of players.
+        hand (int): The hand of the observer, as a bitset.
+        seen (int): The cards the observer has seen out of play, like the cards it discarded.
+        played (int): The cards played.
+        voids (list[int]): For every seat, the union of the SEED_MASKS of the seeds it is known to lack.
+        known (list[int]): For every seat, the cards known to be in its hand.
+        excluded (list[int]): For every seat, the cards known not to be in its hand besides the seeds it lacks.
+        cards_seen (int): The number of played cards update has taken into account.
+    Methods:
+        __init__(seat: int, num_players: int, hand: int = 0):
+            Initializes the beliefs of an observer with its hand.
+        from_game(player: Player, game: Game) -> Beliefs:
+            Build the beliefs of a player from what it has seen of a game.
+        know(seat: int, card: Card) -> None:
+            Record that a seat holds a card.
+        exclude(seat: int, card: Card) -> None:
+            Record that a seat does not hold a card.
+        card_played(seat: int, card: Card, lead: Seed | None) -> None:
+            Record a card played on a lead seed.
+        update(game: Game) -> None:
+            Record the cards played in a game since the last update.
+        is_void(seat: int, seed: Seed) -> bool:
+            Tell if a seat is known to lack a seed.
+        cannot_hold(seat: int) -> int:
+            The cards a seat cannot hold.
+        possible(seat: int) -> int:
+            The cards a seat may hold.
+    """
+
+    def __init__(self, seat: int, num_players: int, hand: int = 0):
+        self.seat = seat
+        self.num_players = num_players
+        self.hand = hand
+        self.seen = 0
+        self.played = 0
+        self.voids = [0]*num_players
+        self.known = [0]*num_players
+        self.known[seat] = hand
+        self.excluded = [0]*num_players
+        self.cards_seen = 0
+
+    def __repr__(self) -> str:
+        voids = [[seed.name for seed in Seed if mask & SEED_MASKS[seed]] for mask in self.voids]
+        return f"Beliefs(seat={self.seat}, voids={voids})"
+
+    @classmethod
+    def from_game(cls, player: Player, game: Game) -> Beliefs:
+        """
+        Build the beliefs of a player from what it has seen of a game: its hand and won cards, the called card,
+        the exchanged card if it took part in the exchange, and the cards played so far.
+        Args:
+            player (Player): The observer.
+            game (Game): The game.
+        Returns:
+            Beliefs: The beliefs of the player.
+        Example:
+            >>> game = Game([Player("Alice"), Player("Bob"), Player("Charlie")], 1)
+            >>> game.setup_game()
+            >>> Beliefs.from_game(game.players[1], game).possible(0) & game.players[1].hand.mask
+            0
+        """
+
+        players = game.players
+        seat = players.index(player)
+        beliefs = cls(seat, game.num_players, player.hand.mask)
+        played = 0
+        for card_round in game.rounds:
+            for played_card in card_round.played_cards:
+                played |= _RANK_BITS[played_card.index]
+        beliefs.seen = player.won_cards.mask & ~played #the won cards not played in a round were discarded
+
+        asking = game.asking_player
+        if game.called_card is not None: #the called card goes to the asking player, in sight of everyone
+            asking_seat = players.index(asking)
+            if game.called_card.seed == Seed.tarots: #the asking player may have discarded it since
+                for other in range(game.num_players):
+                    if other != asking_seat:
+                        beliefs.exclude(other, game.called_card)
+            else:
+                beliefs.know(asking_seat, game.called_card)
+        asking_team = game.find_team(asking).players if game.teams else []
+        if game.exchanged_card is not None and player in asking_team: #the partner holds the card given for it
+            for partner in asking_team:
+                if partner is not asking:
+                    beliefs.know(players.index(partner), game.exchanged_card)
+        beliefs.update(game)
+        return beliefs
+
+    def know(self, seat: int, card: Card) -> None:
+        """
+        Record that a seat holds a card.
+        Args:
+            seat (int): The seat.
+            card (Card): The card.
+        """
+
+        self.known[seat] |= _RANK_BITS[card.index]
+        return None
+
+    def exclude(self, seat: int, card: Card) -> None:
+        """
+        Record that a seat does not hold a card.
+        Args:
+            seat (int): The seat.
+            card (Card): The card.
+        """
+
+        self.excluded[seat] |= _RANK_BITS[card.index]
+        return None
+
+    def card_played(self, seat: int, card: Card, lead: Seed | None) -> None:
+        """
+        Record a card played on a lead seed: a card of another seed proves the seat lacks the lead seed, and a
+        card that is not a tarot either proves it lacks tarots.
+        Args:
+            seat (int): The seat playing the card.
+            card (Card): The card.
+            lead (Seed | None): The lead seed of the round before the card, None if the card sets it.
+        """
+
+        bit = _RANK_BITS[card.index]
+        self.played |= bit
+        self.known[seat] &= ~bit
+        if seat == self.seat:
+            self.hand &= ~bit
+        seed = _CARD_SEEDS[card.index]
+        if lead is not None and seed != lead:
+            self.voids[seat] |= SEED_MASKS[lead]
+            if seed != Seed.tarots:
+                self.voids[seat] |= SEED_MASKS[Seed.tarots]
+        return None
+
+    def update(self, game: Game) -> None:
+        """
+        Record the cards played in a game since the last update, the rounds being played in order.
+        Args:
+            game (Game): The game.
+        """
+
+        rounds = game.rounds
+        num_players = self.num_players
+        count = self.cards_seen
+        while True:
+            number, position = divmod(count, num_players)
+            current = game.current_round
+            if number < len(rounds):
+                card_round = rounds[number]
+            elif number == len(rounds) and current is not None and len(current.played_cards) < num_players:
+                card_round = current #the round in progress
+            else:
+                break
+            played_cards = card_round.played_cards
+            if position >= len(played_cards):
+                break
+            lead = None
+            for played_card in played_cards[:position]:
+                if played_card.index != FOOL_INDEX:
+                    lead = _CARD_SEEDS[played_card.index]
+                    break
+            self.card_played(position, played_cards[position].card, lead)
+            count += 1
+        self.cards_seen = count
+        return None
+
+    def is_void(self, seat: int, seed: Seed) -> bool:
+        """
+        Tell if a seat is known to lack a seed.
+        Args:
+            seat (int): The seat.
+            seed (Seed): The seed.
+        Returns:
+            bool: True if the seat has shown it holds no card of the seed.
+        """
+
+        return bool(self.voids[seat] & SEED_MASKS[seed])
+
+    def cannot_hold(self, seat: int) -> int:
+        """
+        The cards a seat cannot hold: the cards played, seen by the observer, known elsewhere or excluded, and
+        the seeds the seat lacks. The observer's own hand is exact.
+        Args:
+            seat (int): The seat.
+        Returns:
+            int: The bitset of the cards.
+        """
+
+        if seat == self.seat:
+            return _ALL_CARDS_MASK & ~self.hand
+        elsewhere = 0
+        for other, known in enumerate(self.known):
+            if other != seat:
+                elsewhere |= known
+        return (self.played | self.seen | elsewhere | self.voids[seat] | self.excluded[seat]) & ~self.known[seat]
+
+    def possible(self, seat: int) -> int:
+        """
+        The cards a seat may hold.
+        Args:
+            seat (int): The seat.
+        Returns:
+            int: The bitset of the cards.
+        """
+
+        return _ALL_CARDS_MASK & ~self.cannot_hold(seat)
+
+
 class Team:
     """
     A class representing a team of players.
@@ -3459,6 +4306,53 @@ class Team:
 
 
 
+class DecisionKind(Enum):
+    """
+    The kinds of decision a game asks its players for.
+    Attributes:
+        claim (int):    Claim the prize or not, answered with a bool.
+        call (int):     Call a card worth 13, answered with one of the options.
+        give (int):     Give a card of the hand to the owner of the called card, answered with one of the options.
+        discard (int):  Discard a card after taking the prize, answered with one of the options.
+        play (int):     Play a card in the trick, answered with one of the options.
+    """
+
+    claim = 0
+    call = 1
+    give = 2
+    discard = 3
+    play = 4
+
+
+class Decision:
+    """
+    A decision a game is waiting for: the player who has to decide and the options they have.
+    Attributes:
+        kind (DecisionKind): The kind of decision.
+        player (Player): The player who has to decide.
+        options (list[Card]): The cards to choose from, empty for the prize claim.
+    Methods:
+        __init__(kind: DecisionKind, player: Player, options: list[Card]):
+            Initializes the decision.
+        __repr__():
+            Returns a string representation of the decision.
+    """
+
+    __slots__ = ("kind", "player", "options")
+
+    def __init__(self, kind: DecisionKind, player: Player, options: list[Card]):
+        self.kind = kind
+        self.player = player
+        self.options = options
+
+    def __repr__(self) -> str:
+        return f"Decision({self.kind.name}, {self.player.name}, {self.options})"
+
+
+#the answers are sent back into the generators of Game: the chosen card, or a bool for the prize claim
+DecisionSteps = Generator[Decision, object, None]
+
+
 class Game:
     """
     A class representing a game of Tarocchi.
@@ -3472,9 +4366,20 @@ class Game:
         non_asking_players (List[Player]): The players who are not asking in the game.
         current_player (Player): The player who is currently playing in the game.
         prize_claimed (bool): True if the prize has been claimed, False otherwise.
+        called_card (Card | None): The card called by the asking player, None if no card could be called.
+        exchanged_card (Card | None): The card the asking player gave for the called card, None if there was no
+            exchange. Only the asking player and the partner see it.
+        zobrist (int): The Zobrist key of the position, kept up to date from the end of setup_game as the cards
+            are played, 0 before.
+        current_round (CardRound | None): The trick being played, None before the first one.
+        deck (Deck): The deck of the game, refilled at every deal.
+        rng (rnd.Random): The random number generator of the game, used for every random choice.
+        seed (int | None): The seed the generator was built from, None if a generator was given.
     Methods:
-        __init__(players: List[Player]):
-            Initializes the Game with a list of players.
+        __init__(players: List[Player], rng: rnd.Random | int | None = None):
+            Initializes the Game with a list of players and a random number generator or seed.
+        reset(players: List[Player], rng: rnd.Random | int | None = None):
+            Prepare the game for a new deal, reusing its deck, rounds and played cards.
         __repr__():
             Returns a string representation of the game.
         shuffle_players():
@@ -3513,23 +4418,80 @@ class Game:
             Setup the deck for the game.
         set_non_asking_players():
             Set the non-asking players in the game.
+        legal_cards(player: Player, round: CardRound | None = None) -> list[Card]:
+            Return the cards a player can play in a round.
+        decisions() -> DecisionSteps:
+            Play the whole game as a generator of the decisions of the players.
+        answer(decision: Decision) -> object:
+            Answer a decision by asking the player who has to decide.
+        to_move() -> Player:
+            Get the player who plays the next card.
+        legal_moves() -> list[Card]:
+            Get the cards the player to move can play.
+        apply(card: Card):
+            Play a card of the player to move, for search.
+        undo():
+            Take back the last card played with apply.
+        compute_zobrist() -> int:
+            Compute the Zobrist key of the position from scratch.
     """
 
 
-    def __init__(self, players: List[Player]):
+    def __init__(self, players: List[Player], rng: rnd.Random | int | None = None):
+        self.rounds: List[CardRound] = []
+        self.teams: List[Team] = []
+        self.deck = Deck(list(_CARDS))
+        self._round_pool: list[CardRound] = [] #the CardRound objects of the tricks, kept across reset
+        self._played_cards: dict[tuple[int, int, int], PlayedCard] = {} #(player id, order, card index) -> PlayedCard
+        self._moves: list[tuple[CardRound, bool]] = [] #for undo: the round of every applied card, True if it ended the round
+        self.seed = None
+        self.players: List[Player] = []
+        self.reset(players, rng)
+
+    def reset(self, players: List[Player], rng: rnd.Random | int | None = None) -> None:
+        """
+        Prepare the game for a new deal with the given players, reusing the deck, the rounds and the played
+        cards of the previous deal: the rounds of the previous deal are emptied, so they must not be kept. The
+        played cards are only kept if the players are the same, in any order.
+        Args:
+            players (List[Player]): The players of the new deal, the first one is the first to play.
+            rng (rnd.Random | int | None): The generator or seed of the new deal. A seed reseeds the generator
+                of the game if the game was built from a seed too.
+        Example:
+            >>> game = Game([Player("Alice"), Player("Bob"), Player("Charlie")], 1)
+            >>> game.setup_game()
+            >>> game.play_game()
+            >>> game.reset(game.players[1:] + game.players[:1], 2)
+        """
+
         num_players = len(players)
         if num_players < 3 or num_players > 5:
             raise ValueError("Number of players must be between 3 and 5")
+        if {id(player) for player in players} != {id(player) for player in self.players}:
+            self._played_cards.clear() #the played cards of players who left would keep them alive
         self.num_players = num_players
         self.players = players
-        self.rounds: List[CardRound] = []
-        self.teams: List[Team] = []
+        for card_round in self._round_pool[:len(self.rounds) + 1]: #the round after the last one may be in progress
+            card_round.played_cards.clear()
+        self.rounds.clear()
+        self._moves.clear()
+        self.teams.clear()
         self.cycle_player = players.copy()
         self.asking_player = players[0]
         self.dealer = players[-1]
         self.non_asking_players: list[Player] = []
         self.current_player = players[0]
         self.prize_claimed = False
+        self.called_card: Card | None = None
+        self.exchanged_card: Card | None = None
+        self.zobrist = 0
+        self.current_round: CardRound | None = None
+        if isinstance(rng, int) and self.seed is not None: #the generator belongs to the game
+            self.rng.seed(rng)
+        else:
+            self.rng = make_rng(rng)
+        self.seed = rng if isinstance(rng, int) else None #a game built from a seed can be replayed
+        return None
 
     def __repr__(self):
         text = f"Players: {self.players}\n"
@@ -3549,7 +4511,7 @@ class Game:
             ['Bob', 'Alice', 'Charlie']
         """
 
-        rnd.shuffle(self.players)
+        self.rng.shuffle(self.players)
 
     def rotate_players(self) -> None:
         """
@@ -3696,17 +4658,33 @@ class Game:
             'Team #2: the team is composed of:\nBob\nCharlie\n'
         """
 
+        self._drive(self._card_request_steps())
+        return None
+
+    def _card_request_steps(self) -> DecisionSteps:
+        """
+        The steps of asking_player_card_request, yielding the call and the card to give.
+        """
+
         self.empty_teams()
 
         player = self.asking_player  #get the current player
-        available_cards = [card for card in Deck.standard() if (card.value == 13 and not player.has_card(card))]
+        available_cards = [card for card in _CARDS if (CARD_POINTS[card.index] == 13 and not player.has_card(card))]
+
+        if not available_cards: #the asking player holds every card worth 13 and plays alone
+            self.assign_prize()
+            self.add_team(Team([self.asking_player]))
+            self.add_team(Team(self.non_asking_players))
+            return None
 
-        if len(available_cards) != 1: #there is not only the hermit
-            available_cards.remove(Card(Seed.tarots, 1))
+        magician = Card(Seed.tarots, 1)
+        if len(available_cards) != 1 and magician in available_cards: #there is not only the hermit
+            available_cards.remove(magician)
 
-        requested_card = player.choose_card(available_cards)   #choose a card
+        requested_card = yield Decision(DecisionKind.call, player, available_cards)   #choose a card
         while requested_card.value != 13 or requested_card in player.hand: 
-            requested_card = player.choose_card(available_cards)
+            requested_card = yield Decision(DecisionKind.call, player, available_cards)
+        self.called_card = requested_card
 
         if self.prize.has_card(requested_card): #if the prize has the card
             self.assign_prize()
@@ -3730,9 +4708,10 @@ class Game:
         self.add_team(asking_team) #assign the teams
         self.add_teams(opposing_teams)
 
-        card_to_exchange = player.choose_own_card() 
+        card_to_exchange = yield Decision(DecisionKind.give, player, player.hand.cards)
 
         Player.exchange_cards(player, player_with_card, card_to_exchange, requested_card)
+        self.exchanged_card = card_to_exchange
 
         return None 
 
@@ -3805,9 +4784,12 @@ class Game:
             3
         """
 
+        game_score = 0 #only this game's points: the scores of the players add up over a match
         for player in self.non_asking_players:
+            score = player.score
             player.update_score()
-        self.asking_player.score -= self.non_asking_players_score
+            game_score += player.score - score
+        self.asking_player.score -= game_score
 
     def player_set_initial_won_cards(self) -> None:
         """
@@ -3822,14 +4804,21 @@ class Game:
             '1 of spades'
         """
 
-        prize_size = 2*(self.num_players == 4) + 3*(self.num_players != 4)
+        self._drive(self._initial_won_cards_steps())
+        return None
 
-        player = self.asking_player
+    def _initial_won_cards_steps(self) -> DecisionSteps:
+        """
+        The steps of player_set_initial_won_cards, yielding every discard.
+        """
 
+        prize_size = 2*(self.num_players == 4) + 3*(self.num_players != 4)
 
+        player = self.asking_player
 
         for _ in range(prize_size):
-            card = player.choose_own_card_for_prize()
+            options = [card for card in player.hand.cards if (card.value != 13 or card.seed == Seed.tarots)]
+            card = yield Decision(DecisionKind.discard, player, options)
             player.remove_card(card)
             player.add_won_card(card)
 
@@ -3845,7 +4834,9 @@ class Game:
             '1 of spades...'
         """
 
-        deck = Deck.standard()
+        deck = self.deck
+        deck.reset_standard()
+        deck.rng = self.rng
         deck.shuffle()
         
         hands, prize = deck.deal(self.num_players)
@@ -3882,8 +4873,16 @@ class Game:
             True
         """
 
+        self._drive(self._claim_prize_steps())
+        return None
+
+    def _claim_prize_steps(self) -> DecisionSteps:
+        """
+        The steps of claim_prize, yielding the claim of every player until one claims the prize.
+        """
+
         for player in self.players:
-            player_choice = player.choice_bool()
+            player_choice = yield Decision(DecisionKind.claim, player, [])
             if player_choice: #assign the prize to player
                 self.asking_player = player
                 player.asking = True
@@ -3957,18 +4956,34 @@ class Game:
      
     def setup_game(self) -> None:
         """
-        Setup the game.
+        Setup the game: the cards won, the debts and the asking flag of a previous game are reset, the cards are
+        dealt until someone claims the prize, then the asking player calls a card and discards the extra cards.
         Example:
             >>> game = Game([Player("Alice"), Player("Bob"), Player("Charlie")])
             >>> game.setup_game()
         """
+
+        self._drive(self._setup_steps())
+        return None
+
+    def _setup_steps(self) -> DecisionSteps:
+        """
+        The steps of setup_game, yielding the claims, the call, the card to give and the discards.
+        """
         
+        for player in self.players: #the players may come from a previous game of a match
+            player.reset_won_cards()
+            player.debt = 0
+            player.asking = False
+
         while not self.prize_claimed: #while the prize is not empty
             self.setup_deck() #setup the deck
-            self.claim_prize() #assign the prize
+            yield from self._claim_prize_steps() #assign the prize
 
-        self.asking_player_card_request() #request the player to choose a card    
+        yield from self._card_request_steps() #request the player to choose a card    
+        yield from self._initial_won_cards_steps() #the asking player discards as many cards as the prize had
         self.set_debts()
+        self.zobrist = self.compute_zobrist()
 
         return None
 
@@ -4017,6 +5032,245 @@ class Game:
          
         return text
 
+    def legal_cards(self, player: Player, round: CardRound | None = None) -> list[Card]:
+        """
+        Return the cards a player can play in a round.
+        Args:
+            player (Player): The player who has to play.
+            round (CardRound | None): The round being played, the current round if None.
+        Returns:
+            list[Card]: The legal cards of the player.
+        Example:
+            >>> game = Game([Player("Alice"), Player("Bob"), Player("Charlie")])
+            >>> game.setup_game()
+            >>> game.legal_cards(game.players[0], CardRound.empty()) == game.players[0].hand.cards
+            True
+        """
+
+        if round is None:
+            round = self.current_round if self.current_round is not None else CardRound.empty()
+        return round.legal_cards(player)
+
+    def decisions(self) -> DecisionSteps:
+        """
+        Play the whole game, setup included, as a generator: every time a player has to decide, the game yields
+        a Decision and waits for the answer to be sent back with send. The game never calls the players, so one
+        thread can interleave many games and answer their decisions in batches.
+        Yields:
+            Decision: The decision the game is waiting for.
+        Example:
+            >>> game = Game([Player("Alice"), Player("Bob"), Player("Charlie")], 1)
+            >>> steps = game.decisions()
+            >>> decision = next(steps)
+            >>> decision.kind
+            <DecisionKind.claim: 0>
+            >>> decision = steps.send(True)
+            >>> decision.kind
+            <DecisionKind.call: 1>
+        """
+
+        yield from self._setup_steps()
+        yield from self._play_steps()
+        return None
+
+    def answer(self, decision: Decision) -> object:
+        """
+        Answer a decision the way the setup and play methods do, asking the player who has to decide.
+        Args:
+            decision (Decision): The decision to answer.
+        Returns:
+            object: The chosen card, or a bool for the prize claim.
+        """
+
+        player = decision.player
+        kind = decision.kind
+        if kind is DecisionKind.play or kind is DecisionKind.give:
+            return player.choose_own_card(decision.options, self)
+        if kind is DecisionKind.claim:
+            return player.choice_bool(self.rng, self)
+        if kind is DecisionKind.call:
+            return player.choose_card(decision.options, self)
+        return player.choose_own_card_for_prize(self)
+
+    @property
+    def to_move(self) -> Player:
+        """
+        Get the player who plays the next card: the first player leads every round.
+        Returns:
+            Player: The player to move.
+        """
+
+        current = self.current_round
+        if current is None or len(current.played_cards) == self.num_players:
+            return self.players[0]
+        return self.players[len(current.played_cards)]
+
+    def legal_moves(self) -> list[Card]:
+        """
+        Get the cards the player to move can play.
+        Returns:
+            list[Card]: The legal cards of the player to move.
+        """
+
+        current = self.current_round
+        if current is None or len(current.played_cards) == self.num_players: #a new round starts
+            return self.players[0].hand.cards
+        return current.legal_cards(self.players[len(current.played_cards)])
+
+    def apply(self, card: Card) -> None:
+        """
+        Play a card of the player to move, for search: the card leaves the hand, joins the current round and, if
+        it ends the round, the winner takes the cards of the round. Only a few masks and lists change, the rounds
+        and the played cards are reused, and undo restores the previous position. Apply and undo are meant for
+        the card play after setup_game and before the scores of play_game are computed, which merges the won
+        cards of the teams.
+        Args:
+            card (Card): A legal card of the player to move.
+        Raises:
+            ValueError: If the card cannot be played.
+        Example:
+            >>> game = Game([Player("Alice"), Player("Bob"), Player("Charlie")], 1)
+            >>> game.setup_game()
+            >>> game.apply(game.legal_moves()[0])
+            >>> game.undo()
+        """
+
+        round = self.current_round
+        if round is None or len(round.played_cards) == self.num_players: #start the next round
+            number = len(self.rounds)
+            if number < len(self._round_pool):
+                round = self._round_pool[number]
+            else:
+                round = CardRound.empty()
+                self._round_pool.append(round)
+            self.current_round = round
+        played = round.played_cards
+        order = len(played)
+        player = self.players[order]
+
+        lead = round.lead_seed
+        index = card.index
+        if index is None or not CardRound.legal_mask(player.hand.mask, lead) & _RANK_BITS[index]:
+            raise ValueError(f"{card} cannot be played by {player.name}")
+
+        key = (id(player), order, index)
+        played_card = self._played_cards.get(key)
+        if played_card is None:
+            played_card = self._played_cards[key] = PlayedCard.from_card(card, order, player)
+        player.hand.remove_card(card)
+        played.append(played_card)
+        self._hash_card_played(order, index)
+
+        ends_round = order + 1 == self.num_players
+        if ends_round:
+            self.rounds.append(round)
+            winner_card = round.winner_played_card
+            winner_card.player.won_cards.add_cards(round.cards)
+            self._hash_round_won(round, winner_card.order)
+        self._moves.append((round, ends_round))
+        return None
+
+    def undo(self) -> None:
+        """
+        Take back the last card played with apply.
+        Raises:
+            IndexError: If no card was applied.
+        Example:
+            >>> game = Game([Player("Alice"), Player("Bob"), Player("Charlie")], 1)
+            >>> game.setup_game()
+            >>> game.apply(game.legal_moves()[0])
+            >>> game.undo()
+        """
+
+        round, ends_round = self._moves.pop()
+        if ends_round:
+            winner_card = round.winner_played_card
+            self._hash_round_won(round, winner_card.order) #the keys are XORed, so hashing again takes the change back
+            winner_card.player.won_cards.remove_cards(round.cards)
+            self.rounds.pop()
+        played_card = round.played_cards.pop()
+        played_card.player.hand.add_card(played_card.card)
+        self._hash_card_played(played_card.order, played_card.index)
+        self.current_round = round
+        return None
+
+    def compute_zobrist(self) -> int:
+        """
+        Compute the Zobrist key of the position from scratch: the cards in the hand and in the won cards of every
+        seat, the cards of the round in progress by their position in it and the seat to move. The cards of a
+        finished round count as won cards.
+        Returns:
+            int: The 64 bit key of the position.
+        Example:
+            >>> game = Game([Player("Alice"), Player("Bob"), Player("Charlie")], 1)
+            >>> game.setup_game()
+            >>> game.apply(game.legal_moves()[0])
+            >>> game.zobrist == game.compute_zobrist()
+            True
+        """
+
+        key = 0
+        for seat, player in enumerate(self.players):
+            hand_keys, won_keys = ZOBRIST_HAND[seat], ZOBRIST_WON[seat]
+            for card in player.hand.cards:
+                key ^= hand_keys[card.index]
+            for card in player.won_cards.cards:
+                key ^= won_keys[card.index]
+        current = self.current_round
+        to_move = 0
+        if current is not None and len(current.played_cards) < self.num_players:
+            for order, played_card in enumerate(current.played_cards):
+                key ^= ZOBRIST_TRICK[order][played_card.index]
+            to_move = len(current.played_cards)
+        return key ^ ZOBRIST_TO_MOVE[to_move]
+
+    def _hash_card_played(self, seat: int, index: int) -> None:
+        """
+        Update the Zobrist key for a card going from the hand of a seat to the same position in the round, and
+        for the turn passing to the next seat. Doing it twice takes the change back.
+        Args:
+            seat (int): The seat, which is also the position of the card in the round.
+            index (int): The Card.index of the card.
+        """
+
+        self.zobrist ^= (
+            ZOBRIST_HAND[seat][index] ^ ZOBRIST_TRICK[seat][index]
+            ^ ZOBRIST_TO_MOVE[seat] ^ ZOBRIST_TO_MOVE[(seat + 1) % self.num_players]
+        )
+        return None
+
+    def _hash_round_won(self, round: CardRound, seat: int) -> None:
+        """
+        Update the Zobrist key for the cards of a finished round going to the won cards of its winner. Doing it
+        twice takes the change back.
+        Args:
+            round (CardRound): The finished round.
+            seat (int): The seat of the winner, which is also the position of their card in the round.
+        """
+
+        won_keys = ZOBRIST_WON[seat]
+        key = self.zobrist
+        for order, played_card in enumerate(round.played_cards):
+            index = played_card.index
+            key ^= ZOBRIST_TRICK[order][index] ^ won_keys[index]
+        self.zobrist = key
+        return None
+
+    def _drive(self, steps: DecisionSteps) -> None:
+        """
+        Run decision steps to the end, answering every decision with answer.
+        Args:
+            steps (DecisionSteps): The steps to run.
+        """
+
+        answer = self.answer
+        try:
+            decision = next(steps)
+            while True:
+                decision = steps.send(answer(decision))
+        except StopIteration:
+            return None
+
     def play_round(self) -> None:
         """
         Play a round of the game.
@@ -4026,17 +5280,38 @@ class Game:
             >>> game.play_round()
         """
 
-        round = CardRound.empty()
+        self._drive(self._round_steps())
+        return None
+
+    def _round_steps(self) -> DecisionSteps:
+        """
+        The steps of play_round, yielding the card of every player.
+        """
 
+        number = len(self.rounds)
+        if number < len(self._round_pool): #reuse the round emptied by reset
+            round = self._round_pool[number]
+        else:
+            round = CardRound.empty()
+            self._round_pool.append(round)
+        self.current_round = round #visible to the strategies while the trick is played
+
+        played_cards = self._played_cards
         for idx, player in enumerate(self.players): 
             played = False 
             while not played: #check if the player has played
-                card = PlayedCard.from_card(player.choose_own_card(), idx, player) #choose a card
+                choice = yield Decision(DecisionKind.play, player, self.legal_cards(player, round)) #choose a legal card
+                key = (id(player), idx, choice.index)
+                card = played_cards.get(key)
+                if card is None: #played cards are immutable, so each one is built once per game object
+                    card = played_cards[key] = PlayedCard.from_card(choice, idx, player)
                 played = round.put_card_into_play(card) #put the card into play
+            self._hash_card_played(idx, choice.index)
 
         self.rounds.append(round)
-        winner = round.winner_player
-        winner.add_won_cards(round.cards)
+        winner_card = round.winner_played_card
+        winner_card.player.add_won_cards(round.cards)
+        self._hash_round_won(round, winner_card.order)
 
         return None
 
@@ -4049,8 +5324,16 @@ class Game:
             >>> game.play_game() 
         """
 
+        self._drive(self._play_steps())
+        return None
+
+    def _play_steps(self) -> DecisionSteps:
+        """
+        The steps of play_game, yielding the card of every player in every round.
+        """
+
         while not self.asking_player.is_hand_empty: 
-            self.play_round()
+            yield from self._round_steps()
 
         self.update_team_won_cards()
         self.update_players_won_cards()
@@ -4218,51 +5501,461 @@ class Game:
 
         return None  
 
+def drive_games(games: Sequence[Game], policy: Callable[[list[Decision]], Sequence[object]] | None = None) -> None:
+    """
+    Play many games at once in one thread: every game runs as a generator of decisions and, at every step, the
+    decisions all the unfinished games are waiting for are answered in one batch, so a policy can evaluate them
+    together. The games must be reset and not set up yet.
+    Args:
+        games (Sequence[Game]): The games to play.
+        policy (Callable[[list[Decision]], Sequence[object]] | None): Answers a batch of decisions, one answer
+            per decision in the same order. Game.answer of each game, which asks its players, if None.
+    Example:
+        >>> games = [Game([Player(name, strategy=Strategy()) for name in ("Alice", "Bob", "Charlie")], seed) for seed in range(1000)]
+        >>> drive_games(games)
+        >>> games[0].scores
+        {'Alice': 25, 'Bob': -40, 'Charlie': 15}
+    """
+
+    running = []
+    decisions = []
+    for game in games:
+        steps = game.decisions()
+        running.append((game, steps))
+        decisions.append(next(steps))
+
+    while running:
+        if policy is None:
+            answers = [game.answer(decision) for (game, _), decision in zip(running, decisions)]
+        else:
+            answers = policy(decisions)
+        still_running = []
+        next_decisions = []
+        for (game, steps), answer in zip(running, answers):
+            try:
+                next_decisions.append(steps.send(answer))
+            except StopIteration: #the game is over
+                continue
+            still_running.append((game, steps))
+        running, decisions = still_running, next_decisions
+    return None
+
+
+class GameSummary:
+    """
+    A compact summary of a finished game: only names, the called card and numbers, no reference to the
+    players, hands or rounds of the game, so keeping it does not keep the game alive.
+    Attributes:
+        game_number (int): The position of the game in the match.
+        players (tuple[str, ...]): The names of the players, in the seat order of the game.
+        asking_player (str): The name of the asking player.
+        called_card (Card | None): The card called by the asking player, None if no card could be called.
+        teams (tuple[tuple[str, ...], ...]): The names of the players of each team.
+        score_changes (dict): The points made in the game, by player name.
+        debts (dict): The debts of the players in the game, by player name.
+    Methods:
+        __init__(game_number: int, game: Game, scores: Sequence[int]):
+            Summarise a finished game, given the scores of its players before the game.
+        __repr__():
+            Returns a string representation of the summary.
+    """
+
+    __slots__ = ("game_number", "players", "asking_player", "called_card", "teams", "score_changes", "debts")
+
+    def __init__(self, game_number: int, game: Game, scores: Sequence[int]):
+        self.game_number = game_number
+        self.players = tuple(player.name for player in game.players)
+        self.asking_player = game.asking_player.name
+        self.called_card = game.called_card
+        self.teams = tuple(tuple(player.name for player in team.players) for team in game.teams)
+        self.score_changes = {player.name: player.score - score for player, score in zip(game.players, scores)}
+        self.debts = game.debts
+
+    def __repr__(self) -> str:
+        return f"GameSummary(#{self.game_number}, asking={self.asking_player}, called={self.called_card}, {self.score_changes})"
+
+
+class GameResults:
+    """
+    A fixed-layout table of per-game results, one row of 32 bit integers per game, stored in a
+    multiprocessing.shared_memory block so that worker processes write the rows in place and the parent
+    reads them without copying or unpickling anything. A table that is not shared lives in a bytearray.
+    Each row holds, for every seat from 0 to MAX_SEATS-1, the player (its position in the players of the
+    match), the points made in the game, the debt and the team (its position in Game.teams); then the seat
+    of the asking player and the index of the called card, -1 if no card was called. Unused seats are -1.
+    Attributes:
+        num_games (int): The number of rows of the table.
+        name (str | None): The name of the shared memory block, None if the table is not shared.
+        rows (memoryview): The rows of the table, as a 2D memoryview of integers.
+    Methods:
+        __init__(num_games: int, shared: bool = False, name: str | None = None):
+            Create a table, or attach to the shared table with the given name.
+        write(game_number: int, game: Game, player_ids: Sequence[int], scores: Sequence[int]):
+            Write the results of a game, given the scores of its players before the game.
+        seat(game_number: int, seat: int) -> tuple[int, int, int, int]:
+            Get the player, the points, the debt and the team of a seat.
+        asking_seat(game_number: int) -> int:
+            Get the seat of the asking player.
+        called_card(game_number: int) -> Card | None:
+            Get the called card.
+        score_changes(game_number: int, names: Sequence[str]) -> dict:
+            Get the points made in a game, by player name.
+        close():
+            Release the table, and the shared memory block of this process if any.
+        unlink():
+            Destroy the shared memory block once every process closed it.
+    """
+
+    SEAT_FIELDS = 4 #player, points, debt, team
+    ASKING = MAX_SEATS*SEAT_FIELDS
+    CALLED_CARD = ASKING + 1
+    ROW_SIZE = CALLED_CARD + 1
+    ITEM_SIZE = 4
+
+    def __init__(self, num_games: int, shared: bool = False, name: str | None = None):
+        self.num_games = num_games
+        num_bytes = num_games*GameResults.ROW_SIZE*GameResults.ITEM_SIZE
+        self._shm = None
+        if name is not None: #attach to a table created by another process
+            self._shm = shared_memory.SharedMemory(name=name) #worker processes share the resource tracker of the parent
+            buffer = self._shm.buf
+        elif shared:
+            self._shm = shared_memory.SharedMemory(create=True, size=max(1, num_bytes))
+            buffer = self._shm.buf
+            buffer[:num_bytes] = b"\xff"*num_bytes #every field starts at -1
+        else:
+            buffer = bytearray(b"\xff")*num_bytes
+        self.name = self._shm.name if self._shm is not None else None
+        self._items = memoryview(buffer)[:num_bytes].cast("i")
+        self.rows = memoryview(buffer)[:num_bytes].cast("i", (num_games, GameResults.ROW_SIZE)) if num_games else self._items
+
+    def __repr__(self) -> str:
+        return f"GameResults({self.num_games} games, shared={self.name is not None})"
+
+    def __len__(self) -> int:
+        return self.num_games
+
+    def __enter__(self) -> GameResults:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __del__(self) -> None:
+        if getattr(self, "_items", None) is not None: #the views must go before the shared memory block closes itself
+            self.close()
+
+    def write(self, game_number: int, game: Game, player_ids: Sequence[int], scores: Sequence[int]) -> None:
+        """
+        Write the results of a finished game.
+        Args:
+            game_number (int): The row of the game.
+            game (Game): The finished game.
+            player_ids (Sequence[int]): The position in the match of the player of every seat of the game.
+            scores (Sequence[int]): The score of the player of every seat before the game.
+        """
+
+        teams = {}
+        for team_number, team in enumerate(game.teams):
+            for player in team.players:
+                teams[id(player)] = team_number
+
+        items = self._items
+        base = game_number*GameResults.ROW_SIZE
+        for seat, player in enumerate(game.players):
+            offset = base + seat*GameResults.SEAT_FIELDS
+            items[offset] = player_ids[seat]
+            items[offset + 1] = player.score - scores[seat]
+            items[offset + 2] = player.debt
+            items[offset + 3] = teams.get(id(player), -1)
+        items[base + GameResults.ASKING] = game.players.index(game.asking_player)
+        called_card = game.called_card
+        items[base + GameResults.CALLED_CARD] = called_card.index if called_card is not None else -1
+        return None
+
+    def seat(self, game_number: int, seat: int) -> tuple[int, int, int, int]:
+        """
+        Get the results of a seat in a game.
+        Args:
+            game_number (int): The row of the game.
+            seat (int): The seat, 0 for the first player of the game.
+        Returns:
+            tuple[int, int, int, int]: The player, the points, the debt and the team of the seat.
+        """
+
+        offset = game_number*GameResults.ROW_SIZE + seat*GameResults.SEAT_FIELDS
+        return tuple(self._items[offset:offset + GameResults.SEAT_FIELDS])
+
+    def asking_seat(self, game_number: int) -> int:
+        """
+        Get the seat of the asking player in a game.
+        Args:
+            game_number (int): The row of the game.
+        Returns:
+            int: The seat of the asking player.
+        """
+
+        return self._items[game_number*GameResults.ROW_SIZE + GameResults.ASKING]
+
+    def called_card(self, game_number: int) -> Card | None:
+        """
+        Get the card called in a game.
+        Args:
+            game_number (int): The row of the game.
+        Returns:
+            Card | None: The called card, None if no card was called.
+        """
+
+        index = self._items[game_number*GameResults.ROW_SIZE + GameResults.CALLED_CARD]
+        return _CARDS[index] if index >= 0 else None
+
+    def score_changes(self, game_number: int, names: Sequence[str]) -> dict:
+        """
+        Get the points made in a game by each player.
+        Args:
+            game_number (int): The row of the game.
+            names (Sequence[str]): The names of the players, by their position in the match.
+        Returns:
+            dict: The points made in the game, by player name.
+        """
+
+        items = self._items
+        changes = {}
+        offset = game_number*GameResults.ROW_SIZE
+        for _ in range(MAX_SEATS):
+            player_id = items[offset]
+            if player_id >= 0:
+                changes[names[player_id]] = items[offset + 1]
+            offset += GameResults.SEAT_FIELDS
+        return changes
+
+    def close(self) -> None:
+        """
+        Release the table. The views over a shared block must be released before the block can be closed.
+        """
+
+        self.rows.release()
+        self._items.release()
+        if self._shm is not None:
+            self._shm.close()
+            self._shm = None
+        return None
+
+    def unlink(self) -> None:
+        """
+        Destroy the shared memory block: the processes that attached to it can still use it until they close it.
+        """
+
+        if self._shm is not None:
+            self._shm.unlink()
+        return None
+
+
+def _play_match_games(players: List[Player], seed: int, game_numbers: Sequence[int], results_name: str) -> int:
+    """
+    Play some games of a match in a worker process, on copies of the players and on one reused Game, writing
+    the results in the shared GameResults table of the match.
+    Args:
+        players (List[Player]): The players in the seat order of the first game of the match.
+        seed (int): The root seed of the match.
+        game_numbers (Sequence[int]): The positions in the match of the games to play.
+        results_name (str): The name of the shared memory block of the results.
+    Returns:
+        int: The number of games played.
+    """
+
+    num_players = len(players)
+    results = GameResults(game_numbers.stop, name=results_name)
+    game = None
+    for game_number in game_numbers:
+        shift = game_number % num_players #the seats rotate after every game
+        seats = players[shift:] + players[:shift]
+        player_ids = [(shift + seat) % num_players for seat in range(num_players)]
+        scores = [player.score for player in seats]
+        if game is None:
+            game = Game(seats, spawn_seed(seed, game_number))
+        else:
+            game.reset(seats, spawn_seed(seed, game_number))
+        game.setup_game()
+        game.play_game()
+        results.write(game_number, game, player_ids, scores)
+    results.close()
+    return len(game_numbers)
+
+
 class Match:
     """
     A class representing a match of Tarocchi.
     Attributes:
         players (List[Player]): The players in the match.
-        games (List[Game]): The games played in the match.
+        games (List[Game]): The games played in the match, only kept when the match is played in one process.
         num_matches (int): The number of matches to play.
         num_players (int): The number of players in the match.
+        seed (int): The root seed of the match, every game plays with its own child stream of it.
+        standings (dict): The points made in the match by each player, by name.
+        results (GameResults | None): The results of the games of the last play_match, player ids are
+            positions in the players before that call.
     Methods:
-        __init__(players: List[Player], num_matches: int):
-            Initializes the Match with a list of players and a number of matches.
+        __init__(players: List[Player], num_matches: int, rng: rnd.Random | int | None = None):
+            Initializes the Match with a list of players, a number of matches and a root seed.
         __repr__():
             Returns a string representation of the match.
-        play_match():
-            Play the match.
+        game_seed(game_number: int) -> int:
+            Get the seed of a game of the match.
+        play_match(processes: int = 1):
+            Play the match, in one process or spread over a pool of worker processes.
+        stream() -> Iterator[GameSummary]:
+            Play the match one game at a time, yielding a summary of each game instead of keeping it.
+        record_game(score_changes: dict):
+            Add the points of a game to the players and to the standings.
+        update_standings(score_changes: dict):
+            Add the points of a game to the standings.
         scores():
             Get the scores of the players in the match.
     """
 
 
-    def __init__(self, players: List[Player], num_matches: int):
+    def __init__(self, players: List[Player], num_matches: int, rng: rnd.Random | int | None = None):
         self.players = players
         self.games = []
         self.num_matches = num_matches
         self.num_players = len(players)
+        if rng is None or isinstance(rng, rnd.Random): #draw a root seed, so that the match can be replayed
+            rng = make_rng(rng).getrandbits(64)
+        self.seed = rng
+        self.standings = {player.name:0 for player in players}
+        self.results: GameResults | None = None
 
     def __repr__(self):
         text = f"Players: {self.players}\n"
         text += f"Number of matches: {self.num_matches}\n"
         text += f"Games: {self.games}\n"
         return text
+
+    def game_seed(self, game_number: int) -> int:
+        """
+        Get the seed of a game of the match: each game gets an independent stream derived from the root
+        seed, so a single game can be replayed with Game(players, match.game_seed(game_number)), given the
+        players in the order they had in that game and strategies in the same state (strategies with their own
+        generator draw from it, not from the seed of the game).
+        Args:
+            game_number (int): The position of the game in the match, starting from 0.
+        Returns:
+            int: The seed of the game.
+        Example:
+            >>> match = Match([Player("Alice"), Player("Bob"), Player("Charlie")], 1, rng=42)
+            >>> match.game_seed(0) == Match([], 1, rng=42).game_seed(0)
+            True
+        """
+
+        return spawn_seed(self.seed, game_number)
     
-    def play_match(self) -> None:
+    def play_match(self, processes: int = 1) -> None:
         """
-        Play the match.
+        Play the match, writing the results of every game in the GameResults table of the match. With more than
+        one process the games are split in contiguous chunks played by a pool of worker processes on copies of
+        the players: the workers write their rows in a shared memory table, which the parent reads in the order
+        of the games, so the scores are the same as in a single process as long as the strategies draw their
+        random choices from the generator of the game.
+        Args:
+            processes (int): The number of worker processes, 1 to play every game in this process.
         Example:
             >>> match = Match([Player("Alice"), Player("Bob"), Player("Charlie")], 1)
             >>> match.play_match()
+            >>> match.play_match(processes=4)
+        """
+
+        num_games = self.num_matches*self.num_players
+        names = [player.name for player in self.players] #a player id is the position in this list
+        if self.results is not None:
+            self.results.close()
+
+        if processes <= 1 or num_games == 0:
+            self.results = GameResults(num_games)
+            for game_number in range(num_games): #play the number of matches
+                shift = game_number % self.num_players
+                scores = [player.score for player in self.players]
+                game = Game(self.players, self.game_seed(game_number)) #create a new game with its own stream
+                game.setup_game() #setup the game
+                game.play_game() #play the game
+                self.games.append(game) #add the game to the list of games
+                self.results.write(game_number, game, [(shift + seat) % self.num_players for seat in range(self.num_players)], scores)
+                self.update_standings(self.results.score_changes(game_number, names))
+                self.players = self.players[1:] + self.players[:1] #rotate players
+            return None
+
+        self.results = GameResults(num_games, shared=True)
+        num_chunks = min(num_games, 4*processes) #a few chunks per process to balance slow and fast games
+        bounds = [num_games*chunk//num_chunks for chunk in range(num_chunks + 1)]
+        chunks = [range(bounds[chunk], bounds[chunk + 1]) for chunk in range(num_chunks)]
+        try:
+            with ProcessPoolExecutor(max_workers=processes) as executor:
+                list(executor.map(_play_match_games, [self.players]*num_chunks, [self.seed]*num_chunks, chunks, [self.results.name]*num_chunks))
+        finally:
+            self.results.unlink() #the parent keeps its mapping, nothing is left behind if a worker fails
+
+        for game_number in range(num_games):
+            self.record_game(self.results.score_changes(game_number, names))
+
+        shift = num_games % self.num_players
+        self.players = self.players[shift:] + self.players[:shift] #same rotation as in a single process
+        return None
+
+    def stream(self) -> Iterator[GameSummary]:
+        """
+        Play the match one game at a time on a single reused Game, yielding a GameSummary of each game as soon
+        as it is over. Nothing is kept in games or results and the standings are updated before each summary is
+        yielded, so the memory stays the same however many games the match has. The games and the scores are
+        the same as with play_match.
+        Yields:
+            GameSummary: The summary of each game, in the order of the games.
+        Example:
+            >>> match = Match([Player(name, strategy=Strategy()) for name in ("Alice", "Bob", "Charlie")], 10, rng=42)
+            >>> asking = [summary.asking_player for summary in match.stream()]
+            >>> len(asking)
+            30
+            >>> sum(match.scores.values())
+            0
         """
-        for _ in range(self.num_matches*self.num_players): #play the number of matches
-            game = Game(self.players) #create a new game
-            game.setup_game() #setup the game
-            game.play_game() #play the game
-            self.games.append(game) #add the game to the list of games
-            self.players = self.players[1:] + self.players[:1] #rotate players
+
+        game = None
+        for game_number in range(self.num_matches*self.num_players):
+            players = self.players
+            scores = [player.score for player in players]
+            if game is None:
+                game = Game(players, self.game_seed(game_number))
+            else: #the rounds of the previous deal are emptied, the summaries do not refer to them
+                game.reset(players, self.game_seed(game_number))
+            game.setup_game()
+            game.play_game()
+            summary = GameSummary(game_number, game, scores)
+            self.update_standings(summary.score_changes)
+            self.players = players[1:] + players[:1] #rotate players
+            yield summary
+        return None
+
+    def record_game(self, score_changes: dict) -> None:
+        """
+        Add the points of a game to the players and to the standings of the match.
+        Args:
+            score_changes (dict): The points made in the game, by player name.
+        """
+
+        for player in self.players:
+            player.score += score_changes[player.name]
+        self.update_standings(score_changes)
+        return None
+
+    def update_standings(self, score_changes: dict) -> None:
+        """
+        Add the points of a game to the standings of the match.
+        Args:
+            score_changes (dict): The points made in the game, by player name.
+        """
+
+        standings = self.standings
+        for name, points in score_changes.items():
+            standings[name] += points
         return None
     
     @property
@@ -4272,14 +5965,119 @@ class Match:
         Returns:
             dict: The scores of the players in the match.
         Example:
-            >>> match = Match([Player("Alice"), Player("Bob"), Player("Charlie")], 1)
+            >>> match = Match([Player(name, strategy=Strategy()) for name in ("Alice", "Bob", "Charlie")], 1, rng=42)
             >>> match.play_match()
             >>> match.scores
-            {'Alice': 0, 'Bob': 0, 'Charlie': 0}
+            {'Alice': -8, 'Bob': -73, 'Charlie': 81}
+        """
+
+        return dict(self.standings)
+
+
+class SelfPlay:
+    """
+    A batch self-play engine: plays many complete games between the same players with the rules of Game,
+    reusing a single Game object, its deck, its rounds and its played cards for every deal instead of
+    building and keeping a new Game each time as Match does.
+    The seats rotate after every game and game i plays with the seed spawn_seed(seed, i), as in a Match with
+    the same root seed, so both give the same scores.
+    Attributes:
+        players (List[Player]): The players, in the seat order of the next game.
+        seed (int): The root seed, every game plays with its own child stream of it.
+        game (Game): The game reused for every deal.
+        games_played (int): The number of games played so far.
+        seconds (float): The time spent playing the games, in seconds.
+    Methods:
+        __init__(players: List[Player], rng: rnd.Random | int | None = None):
+            Initializes the engine with a list of players and a root seed.
+        __repr__():
+            Returns a string representation of the engine.
+        game_seed(game_number: int) -> int:
+            Get the seed of a game.
+        play(num_games: int) -> dict:
+            Play a number of games and report the throughput.
+        games_per_second() -> float:
+            Get the number of games played per second so far.
+        scores() -> dict:
+            Get the scores of the players.
+    """
+
+
+    def __init__(self, players: List[Player], rng: rnd.Random | int | None = None):
+        self.players = list(players)
+        if rng is None or isinstance(rng, rnd.Random): #draw a root seed, so that every game can be replayed
+            rng = make_rng(rng).getrandbits(64)
+        self.seed = rng
+        self.game = Game(self.players, self.game_seed(0))
+        self.games_played = 0
+        self.seconds = 0.0
+
+    def __repr__(self):
+        text = f"Players: {self.players}\n"
+        text += f"Games played: {self.games_played}\n"
+        text += f"Games per second: {self.games_per_second:.1f}\n"
+        return text
+
+    def game_seed(self, game_number: int) -> int:
         """
+        Get the seed of a game, the same as Match.game_seed for the same root seed.
+        Args:
+            game_number (int): The position of the game, starting from 0.
+        Returns:
+            int: The seed of the game.
+        """
+
+        return spawn_seed(self.seed, game_number)
 
-        scores = {player.name:0 for player in self.players}
-        for game in self.games:
-            for player in game.players:
-                scores[player.name] += player.score
-        return scores
+    def play(self, num_games: int) -> dict:
+        """
+        Play a number of complete games: deal, prize claim, card call, tricks and scores.
+        Args:
+            num_games (int): The number of games to play.
+        Returns:
+            dict: The number of games played, the seconds taken, the games per second and the scores.
+        Example:
+            >>> engine = SelfPlay([Player(name, strategy=Strategy()) for name in ("Alice", "Bob", "Charlie")], 42)
+            >>> report = engine.play(1000)
+            >>> report["games"]
+            1000
+        """
+
+        game = self.game
+        players = self.players
+        start = time.perf_counter()
+        for _ in range(num_games):
+            game.reset(players, self.game_seed(self.games_played))
+            game.setup_game()
+            game.play_game()
+            self.games_played += 1
+            players.append(players.pop(0)) #rotate players
+        seconds = time.perf_counter() - start
+        self.seconds += seconds
+
+        return {
+            "games": num_games,
+            "seconds": seconds,
+            "games_per_second": num_games/seconds if seconds else 0.0,
+            "scores": self.scores,
+        }
+
+    @property
+    def games_per_second(self) -> float:
+        """
+        Get the number of games played per second so far.
+        Returns:
+            float: The games per second, 0 if no game was played.
+        """
+
+        return self.games_played/self.seconds if self.seconds else 0.0
+
+    @property
+    def scores(self) -> dict:
+        """
+        Get the scores of the players.
+        Returns:
+            dict: The scores of the players.
+        """
+
+        return {player.name:player.score for player in self.players}
@@ -0,0 +1,105 @@
+import random
+import unittest
+from pimc import observe, sample_hands
+from tarots import Beliefs, Card, Game, Player, Seed, Strategy, SEED_MASKS, _RANK_BITS
+
+class TestBeliefs(unittest.TestCase):
+
+    def test_beliefs_voids(self):
+        beliefs = Beliefs(0, 3)
+        beliefs.card_played(0, Card(Seed.spades, 5), None)
+        beliefs.card_played(1, Card(Seed.tarots, 7), Seed.spades)
+        beliefs.card_played(2, Card(Seed.cups, 2), Seed.spades)
+        self.assertTrue(beliefs.is_void(1, Seed.spades))
+        self.assertFalse(beliefs.is_void(1, Seed.tarots))
+        self.assertTrue(beliefs.is_void(2, Seed.spades))
+        self.assertTrue(beliefs.is_void(2, Seed.tarots))
+        self.assertFalse(beliefs.possible(2) & (SEED_MASKS[Seed.spades] | SEED_MASKS[Seed.tarots]))
+        self.assertFalse(beliefs.possible(1) & _RANK_BITS[Card(Seed.spades, 5).index])
+
+    def test_beliefs_fool_lead(self):
+        beliefs = Beliefs(0, 3)
+        beliefs.card_played(0, Card(Seed.tarots, 0), None)
+        beliefs.card_played(1, Card(Seed.coins, 3), None) #the card after the fool sets the lead
+        self.assertEqual(beliefs.voids, [0, 0, 0])
+
+    def test_beliefs_known(self):
+        called = Card(Seed.cups, 14)
+        beliefs = Beliefs(1, 3, _RANK_BITS[Card(Seed.coins, 1).index])
+        beliefs.know(0, called)
+        self.assertTrue(beliefs.possible(0) & _RANK_BITS[called.index])
+        self.assertFalse(beliefs.possible(2) & _RANK_BITS[called.index])
+        self.assertFalse(beliefs.possible(2) & beliefs.hand)
+        self.assertEqual(beliefs.possible(1), beliefs.hand)
+        beliefs.card_played(0, called, None)
+        self.assertFalse(beliefs.possible(0) & _RANK_BITS[called.index])
+
+    def test_beliefs_track_game(self):
+        for num_players in (3, 4, 5):
+            game = Game([Player(f"P{i}", strategy=Strategy(i)) for i in range(num_players)], 12)
+            game.setup_game()
+            trackers = [Beliefs.from_game(player, game) for player in game.players]
+            while not game.asking_player.is_hand_empty:
+                for _ in range(num_players):
+                    game.apply(game.legal_moves()[0])
+                    for beliefs in trackers:
+                        beliefs.update(game)
+                        for seat, player in enumerate(game.players): #the beliefs never rule out a real card
+                            self.assertEqual(beliefs.possible(seat) & player.hand.mask, player.hand.mask)
+            rebuilt = Beliefs.from_game(game.players[0], game)
+            self.assertEqual(rebuilt.voids, trackers[0].voids)
+            self.assertEqual(rebuilt.cards_seen, sum(len(card_round.played_cards) for card_round in game.rounds))
+
+    def test_beliefs_exchange(self):
+        for seed in range(10):
+            game = Game([Player(f"P{i}", strategy=Strategy(i)) for i in range(3)], seed)
+            game.setup_game()
+            if game.exchanged_card is None:
+                continue
+            asking = game.asking_player
+            partner = [player for player in game.find_team(asking).players if player is not asking][0]
+            beliefs = Beliefs.from_game(asking, game)
+            partner_seat = game.players.index(partner)
+            self.assertEqual(beliefs.possible(partner_seat) & _RANK_BITS[game.exchanged_card.index], _RANK_BITS[game.exchanged_card.index])
+            for seat in range(3):
+                if seat != partner_seat and game.players[seat] is not asking:
+                    self.assertFalse(beliefs.possible(seat) & _RANK_BITS[game.exchanged_card.index])
+            return
+        self.fail("No deal with an exchange")
+
+    def test_beliefs_called_tarot_discarded(self):
+        world = Card(Seed.tarots, 21)
+
+        class DiscardCalled(Strategy): #calls the world and discards it
+            def choose_card(self, player, available_cards, game=None):
+                return world if world in available_cards else super().choose_card(player, available_cards, game)
+            def choose_own_card_for_prize(self, player, available_cards, game=None):
+                return world if world in available_cards else super().choose_own_card_for_prize(player, available_cards, game)
+
+        for seed in range(50):
+            game = Game([Player(f"P{i}", strategy=DiscardCalled(i)) for i in range(3)], seed)
+            game.setup_game()
+            if game.called_card != world:
+                continue
+            asking = game.asking_player
+            self.assertNotIn(world, asking.hand)
+            asking_seat = game.players.index(asking)
+            observer = next(player for player in game.players if player is not asking)
+            seat = game.players.index(observer)
+            beliefs = Beliefs.from_game(observer, game)
+            bit = _RANK_BITS[world.index]
+            self.assertFalse(beliefs.known[asking_seat] & bit)
+            self.assertTrue(beliefs.possible(asking_seat) & bit)
+            other = 3 - seat - asking_seat
+            self.assertFalse(beliefs.possible(other) & bit)
+            observation = observe(observer, game, beliefs)
+            rng = random.Random(seed)
+            for _ in range(200): #the world goes to the asking player or to the discards, never to the other seat
+                hands = sample_hands(observation, rng)
+                self.assertFalse(hands[other] & bit)
+                self.assertEqual([hand.bit_count() for hand in hands], [len(player.hand) for player in game.players])
+            return
+        self.fail("No deal calling the world")
+
+if __name__ == '__main__':
+    unittest.main()
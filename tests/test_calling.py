@@ -0,0 +1,67 @@
+import unittest
+from tarots import Card, Game, Player, Seed, Strategy, CARD_POINTS
+
+try:
+    import numpy as np
+    from calling import CallEvaluator, CallStrategy, callable_cards
+except ImportError: #the evaluator needs NumPy
+    np = None
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class TestCalling(unittest.TestCase):
+
+    def test_callable_cards(self):
+        magician, world = Card(Seed.tarots, 1), Card(Seed.tarots, 21)
+        kings = [Card(seed, 14) for seed in (Seed.spades, Seed.coins, Seed.clubs, Seed.cups)]
+        self.assertEqual(set(callable_cards([])), set(kings + [world]))
+        self.assertEqual(callable_cards(kings + [world]), [magician])
+        self.assertEqual(callable_cards(kings + [world, magician]), [])
+        game = Game([Player("A"), Player("B"), Player("C")], 2)
+        game.setup_deck()
+        for card in callable_cards(game.players[0].hand):
+            self.assertEqual(CARD_POINTS[card.index], 13)
+            self.assertNotIn(card, game.players[0].hand)
+
+    def test_call_rank(self):
+        for num_players in (3, 4, 5):
+            game = Game([Player(f"P{i}") for i in range(num_players)], num_players)
+            game.setup_deck()
+            hand = game.players[1].hand
+            ranking = CallEvaluator(playouts=400, batch_size=200, time_budget=None, rng=1).rank(hand, 1, num_players)
+            self.assertEqual({estimate.card for estimate in ranking}, set(callable_cards(hand)))
+            self.assertEqual([estimate.score for estimate in ranking], sorted((estimate.score for estimate in ranking), reverse=True))
+            self.assertTrue(all(estimate.playouts == 400 for estimate in ranking))
+            again = CallEvaluator(playouts=400, batch_size=200, time_budget=None, rng=1).rank(hand, 1, num_players)
+            self.assertEqual(ranking, again)
+
+    def test_call_errors(self):
+        evaluator = CallEvaluator(playouts=100, rng=4)
+        hand = [Card(Seed.spades, 14)] + [Card(Seed.tarots, number) for number in range(2, 16)]
+        with self.assertRaises(ValueError):
+            evaluator.rank(hand, 0, 5, [Card(Seed.spades, 14)])
+        with self.assertRaises(ValueError):
+            evaluator.rank(hand, 0, 5, [Card(Seed.spades, 13)])
+        with self.assertRaises(ValueError):
+            evaluator.rank(hand[:-1], 0, 5)
+        with self.assertRaises(ValueError):
+            CallEvaluator(time_budget=0)
+
+    def test_call_time_budget(self):
+        evaluator = CallEvaluator(playouts=10**7, batch_size=100, time_budget=0.1, rng=5)
+        ranking = evaluator.rank([Card(Seed.tarots, number) for number in range(2, 17)], 2, 5)
+        self.assertLess(ranking[0].playouts, 10**7)
+        self.assertLess(evaluator.seconds, 2.0)
+
+    def test_call_strategy(self):
+        strategy = CallStrategy(CallEvaluator(playouts=200, rng=6), rng=6)
+        for num_players in (3, 4, 5):
+            players = [Player(f"P{i}", strategy=strategy if i == 0 else Strategy(i)) for i in range(num_players)]
+            game = Game(players, 10 + num_players)
+            game.setup_game()
+            game.play_game()
+            if game.asking_player is players[0] and game.called_card is not None and len(strategy.ranking) > 1:
+                self.assertEqual(game.called_card, strategy.ranking[0].card)
+            self.assertEqual(sum(game.scores.values()), 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,7 @@
+import copy
+import pickle
 import unittest
-from tarots import Seed, Card
+from tarots import Seed, Card, Deck, CARD_POINTS, CARD_RANKS, CARD_NOTATIONS, CARD_NAMES
 
 class TestCard(unittest.TestCase):
 
@@ -33,5 +35,52 @@ class TestCard(unittest.TestCase):
     def test_card_value(self):
         self.assertEqual(self.card.value, 12)
 
+    def test_card_interned(self):
+        self.assertIs(Card(Seed.cups, 13), Card(Seed.cups, 13))
+        self.assertIs(Card.random().__class__, Card)
+        self.assertEqual(len(set(map(id, Deck.standard()))), 78)
+        self.assertIs(Deck.standard()[0], self.card)
+
+    def test_card_immutable(self):
+        with self.assertRaises(AttributeError):
+            self.card.number = 1
+        with self.assertRaises(AttributeError):
+            self.card.owner = "Alice"
+
+    def test_card_index(self):
+        self.assertEqual(self.card.index, 0)
+        self.assertEqual(Card(Seed.spades, 1).index, 22)
+        self.assertEqual(Card(Seed.cups, 14).index, 77)
+        self.assertEqual([card.index for card in Deck.standard()], list(range(78)))
+        self.assertIsNone(Card(Seed.tarots, 100).index)
+
+    def test_card_from_index(self):
+        for card in Deck.standard():
+            self.assertIs(Card.from_index(card.index), card)
+        with self.assertRaises(ValueError):
+            Card.from_index(78)
+        with self.assertRaises(ValueError):
+            Card.from_index(-1)
+
+    def test_card_tables(self):
+        card = Card(Seed.coins, 12)
+        self.assertEqual(CARD_POINTS[card.index], card.value)
+        self.assertEqual(CARD_NOTATIONS[card.index], "12o")
+        self.assertEqual(CARD_NAMES[card.index], "Jack of coins")
+        self.assertEqual(sorted(CARD_RANKS), list(range(78)))
+        self.assertLess(Card(Seed.coins, 1), Card(Seed.coins, 11))
+        self.assertLess(Card(Seed.coins, 2), Card(Seed.coins, 1))
+        self.assertLess(Card(Seed.cups, 14), Card(Seed.tarots, 0))
+
+    def test_card_non_standard(self):
+        card = Card(Seed.tarots, 100)
+        self.assertEqual(repr(card), "100: Unknown")
+        self.assertEqual(card.value, 1)
+        self.assertGreater(card, Card(Seed.tarots, 21))
+
+    def test_card_copy_preserves_identity(self):
+        self.assertIs(copy.deepcopy(self.card), self.card)
+        self.assertIs(pickle.loads(pickle.dumps(self.card)), self.card)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,95 @@
+import random
+import unittest
+from tarots import CardRound, PlayedCard, Card, Seed, Player, Hand, Deck, Strategy
+
+class TestCardRound(unittest.TestCase):
+
+    def setUp(self):
+        self.players = [Player("Alice", Hand.empty()), Player("Bob", Hand.empty()), Player("Charlie", Hand.empty())]
+
+    def make_round(self, cards):
+        return CardRound.from_cards(cards, self.players)
+
+    def test_cardround_lead_seed_wins(self):
+        card_round = self.make_round([Card(Seed.cups, 3), Card(Seed.cups, 1), Card(Seed.spades, 14)])
+        self.assertEqual(card_round.winner_played_card.card, Card(Seed.cups, 1))
+        self.assertEqual(card_round.winner_player, self.players[1])
+
+    def test_cardround_figures_beat_numbers(self):
+        card_round = self.make_round([Card(Seed.coins, 1), Card(Seed.coins, 11), Card(Seed.coins, 10)])
+        self.assertEqual(card_round.winner_player, self.players[1])
+
+    def test_cardround_tarot_wins(self):
+        card_round = self.make_round([Card(Seed.spades, 14), Card(Seed.tarots, 2), Card(Seed.tarots, 1)])
+        self.assertEqual(card_round.winner_player, self.players[1])
+
+    def test_cardround_fool_never_wins(self):
+        card_round = self.make_round([Card(Seed.tarots, 0), Card(Seed.clubs, 2), Card(Seed.clubs, 5)])
+        self.assertEqual(card_round.winner_player, self.players[2])
+
+    def test_cardround_trick_winner(self):
+        trick = [Card(Seed.spades, 2).index, Card(Seed.cups, 14).index, Card(Seed.spades, 3).index]
+        self.assertEqual(CardRound.trick_winner(trick), 2)
+
+    def test_cardround_resolve_tricks(self):
+        tricks = [
+            [Card(Seed.spades, 13).index, Card(Seed.spades, 2).index, Card(Seed.tarots, 5).index],
+            [Card(Seed.cups, 1).index, Card(Seed.cups, 14).index, Card(Seed.coins, 14).index],
+        ]
+        self.assertEqual(CardRound.resolve_tricks(tricks), [(2, 12), (1, 27)])
+        self.assertEqual(CardRound.resolve_tricks([]), [])
+
+    def test_cardround_sorted_matches_winner(self):
+        rng = random.Random(5)
+        deck = Deck.standard().cards
+        for _ in range(300):
+            card_round = self.make_round(rng.sample(deck, 3))
+            ranked = card_round.sorted.played_cards
+            self.assertIs(ranked[-1], card_round.winner_played_card)
+            self.assertEqual(sorted(ranked, key=id), sorted(card_round.played_cards, key=id))
+        card_round = self.make_round([Card(Seed.spades, 3), Card(Seed.tarots, 5), Card(Seed.spades, 14)])
+        self.assertEqual([played.card for played in card_round.sorted.played_cards], [Card(Seed.spades, 3), Card(Seed.spades, 14), Card(Seed.tarots, 5)])
+
+    def test_cardround_empty_winner(self):
+        with self.assertRaises(ValueError):
+            CardRound.empty().winner_played_card
+
+    def test_cardround_tarot_when_void(self):
+        self.players[1].hand = Hand([Card(Seed.tarots, 5), Card(Seed.cups, 3)])
+        self.players[2].hand = Hand([Card(Seed.tarots, 6), Card(Seed.cups, 4)])
+        card_round = self.make_round([Card(Seed.spades, 2)])
+        self.assertTrue(card_round.put_card_into_play(PlayedCard.from_card(Card(Seed.tarots, 5), 1, self.players[1])))
+        self.assertFalse(card_round.put_card_into_play(PlayedCard.from_card(Card(Seed.cups, 4), 2, self.players[2])))
+        self.assertEqual(len(card_round.played_cards), 2)
+
+    def test_cardround_legal_cards(self):
+        player = Player("Bob", Hand([Card(Seed.spades, 3), Card(Seed.tarots, 7), Card(Seed.cups, 13)]))
+        self.assertEqual(self.make_round([]).legal_cards(player), player.hand.cards)
+        self.assertEqual(self.make_round([Card(Seed.spades, 2)]).legal_cards(player), [Card(Seed.spades, 3)])
+        self.assertEqual(self.make_round([Card(Seed.coins, 2)]).legal_cards(player), [Card(Seed.tarots, 7)])
+        player.hand.remove_card(Card(Seed.tarots, 7))
+        self.assertEqual(set(self.make_round([Card(Seed.coins, 2)]).legal_cards(player)), set(player.hand.cards))
+
+    def test_cardround_fool_lead(self):
+        card_round = self.make_round([Card(Seed.tarots, 0)])
+        self.assertIsNone(card_round.lead_seed)
+        card_round = self.make_round([Card(Seed.tarots, 0), Card(Seed.cups, 5)])
+        self.assertEqual(card_round.lead_seed, Seed.cups)
+
+    def test_cardround_legal_cards_match_put_card_into_play(self):
+        rng = random.Random(0)
+        for _ in range(300):
+            cards = Deck.standard().cards
+            rng.shuffle(cards)
+            lead = cards[:rng.randint(0, 2)]
+            player = Player("Bob", Hand(cards[10:10 + rng.randint(1, 12)]), Strategy())
+            legal = set(self.make_round(lead).legal_cards(player))
+            for card in player.hand.cards:
+                card_round = self.make_round(lead)
+                hand = Hand(player.hand.cards)
+                accepted = card_round.put_card_into_play(PlayedCard.from_card(card, len(lead), player))
+                player.hand = hand
+                self.assertEqual(accepted, card in legal)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+import unittest
+from tarots import Card, Game, Hand, Player, Seed, _CARDS
+
+try:
+    import numpy as np
+    from claim import ClaimEvaluator, ClaimStrategy, canonical_hand
+except ImportError: #the evaluator needs NumPy
+    np = None
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class TestClaim(unittest.TestCase):
+
+    def test_canonical_hand(self):
+        hand = Hand([Card(Seed.spades, 14), Card(Seed.spades, 3), Card(Seed.cups, 12), Card(Seed.tarots, 21)])
+        permuted = Hand([Card(Seed.clubs, 14), Card(Seed.clubs, 3), Card(Seed.coins, 12), Card(Seed.tarots, 21)])
+        canonical = canonical_hand(hand.mask)
+        self.assertEqual(canonical, canonical_hand(permuted.mask))
+        self.assertEqual(canonical.bit_count(), len(hand))
+        self.assertEqual(canonical_hand(canonical), canonical)
+        self.assertIn(Card(Seed.tarots, 21), Hand.from_mask(canonical))
+        other = Hand([Card(Seed.spades, 14), Card(Seed.spades, 2), Card(Seed.cups, 12), Card(Seed.tarots, 21)])
+        self.assertNotEqual(canonical, canonical_hand(other.mask))
+
+    def test_claim_estimate(self):
+        evaluator = ClaimEvaluator(playouts=600, batch_size=200, rng=1)
+        game = Game([Player("A"), Player("B"), Player("C")], 1)
+        game.setup_deck()
+        hand = game.players[1].hand
+        estimate = evaluator.estimate(hand, 1, 3)
+        self.assertEqual(estimate.playouts, 600)
+        self.assertGreater(estimate.error, 0)
+        self.assertEqual(evaluator.hits, 0)
+        swap = {Seed.spades: Seed.clubs, Seed.clubs: Seed.spades, Seed.coins: Seed.cups, Seed.cups: Seed.coins}
+        permuted = [Card(swap.get(card.seed, card.seed), card.number) for card in hand]
+        self.assertIs(evaluator.estimate(permuted, 1, 3), estimate)
+        self.assertEqual(evaluator.hits, 1)
+        self.assertIsNot(evaluator.estimate(hand, 0, 3), estimate)
+        with self.assertRaises(ValueError):
+            evaluator.estimate(list(hand)[:-1], 1, 3)
+        evaluator.clear()
+        self.assertFalse(evaluator.memo)
+
+    def test_claim_strong_hand(self):
+        evaluator = ClaimEvaluator(playouts=1000, rng=2)
+        tarots = sorted((card for card in _CARDS if card.seed == Seed.tarots), key=lambda card: card.number)
+        strong = tarots[-15:] + [Card(seed, number) for seed in (Seed.spades, Seed.cups) for number in range(10, 15)]
+        weak = [card for card in _CARDS if card.seed != Seed.tarots and card.number <= 7][:25]
+        baseline = evaluator.baseline(0, 3)
+        self.assertGreater(evaluator.estimate(strong, 0, 3).score, baseline.score)
+        self.assertLess(evaluator.estimate(weak, 0, 3).score, baseline.score)
+
+    def test_claim_time_budget(self):
+        evaluator = ClaimEvaluator(playouts=10**7, batch_size=100, time_budget=0.05, rng=3)
+        estimate = evaluator.baseline(2, 4)
+        self.assertGreaterEqual(estimate.playouts, 100)
+        self.assertLess(estimate.playouts, 10**7)
+        with self.assertRaises(ValueError):
+            ClaimEvaluator(playouts=0)
+
+    def test_claim_strategy(self):
+        evaluator = ClaimEvaluator(playouts=200, rng=4)
+        for num_players in (3, 4, 5):
+            players = [Player(f"P{i}", strategy=ClaimStrategy(evaluator, rng=i)) for i in range(num_players)]
+            game = Game(players, num_players)
+            game.setup_game()
+            game.play_game()
+            seat = game.players.index(game.asking_player)
+            start = evaluator.memo[num_players, seat, -1]
+            self.assertGreaterEqual(sum(game.scores.values()), 0)
+            self.assertTrue(any(estimate.score >= start.score for key, estimate in evaluator.memo.items() if key[:2] == (num_players, seat) and key[2] >= 0))
+
+if __name__ == '__main__':
+    unittest.main()
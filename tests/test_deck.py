@@ -1,3 +1,4 @@
+import random
 import unittest
 from tarots import Deck, Card, Seed, Hand  # Assuming these classes exist
 
@@ -99,5 +100,46 @@ class TestDeck(unittest.TestCase):
         total_cards = sum([len(hand.cards) for hand in hands]) + len(prize)
         self.assertEqual(total_cards, 78)
 
+    def test_deck_draw_moves_cursor(self):
+        first = self.deck.draw(3)
+        self.assertEqual(first, [Card(Seed.tarots, 0), Card(Seed.tarots, 1), Card(Seed.tarots, 2)])
+        self.assertEqual(len(self.deck), 75)
+        self.assertEqual(self.deck.draw_card(), Card(Seed.tarots, 3))
+        self.assertEqual(self.deck.cards[0], Card(Seed.tarots, 4))
+        self.assertEqual(len(self.deck.cards), 74)
+        self.assertEqual(len(self.deck.draw(100)), 74)
+        self.assertEqual(self.deck.draw(1), [])
+
+    def test_deck_deal_layout(self):
+        cards = self.deck.cards[:]
+        hands, prize = self.deck.deal(3)
+        self.assertEqual(set(prize.cards), set(cards[:3]))
+        expected = set(cards[3:8]) | set(cards[18:23]) | set(cards[33:38]) | set(cards[48:53]) | set(cards[63:68])
+        self.assertEqual(set(hands[0].cards), expected)
+        self.assertEqual(len(self.deck), 0)
+
+    def test_deck_deal_after_draw(self):
+        self.deck.draw(8)
+        hands, prize = self.deck.deal(4)
+        self.assertEqual(len(prize), 2)
+        self.assertEqual(sum(len(hand) for hand in hands) + len(prize), 70)
+
+    def test_deck_seeded_shuffle(self):
+        deck1 = Deck.standard(rng=7)
+        deck2 = Deck.standard(rng=7)
+        deck1.shuffle()
+        deck2.shuffle()
+        self.assertEqual(deck1.cards, deck2.cards)
+        self.assertNotEqual(deck1.cards, Deck.standard().cards)
+        self.assertIs(deck1.sorted.rng, deck1.rng)
+
+    def test_deck_shuffle_follows_global_seed(self):
+        random.seed(3)
+        self.deck.shuffle()
+        random.seed(3)
+        deck = Deck.standard()
+        deck.shuffle()
+        self.assertEqual(self.deck.cards, deck.cards)
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,230 @@
+import random
+import unittest
+from tarots import Decision, DecisionKind, Game, GameSummary, Match, drive_games, Player, Strategy, make_rng, spawn_seed
+
+class TestGame(unittest.TestCase):
+
+    def players(self):
+        return [Player("Alice"), Player("Bob"), Player("Charlie")]
+
+    def test_game_seeded_deal(self):
+        game1 = Game(self.players(), 11)
+        game2 = Game(self.players(), 11)
+        game1.setup_deck()
+        game2.setup_deck()
+        for player1, player2 in zip(game1.players, game2.players):
+            self.assertEqual(player1.hand.mask, player2.hand.mask)
+        self.assertEqual(game1.prize.mask, game2.prize.mask)
+        self.assertEqual(game1.seed, 11)
+
+    def test_game_shared_rng(self):
+        game = Game(self.players(), random.Random(5))
+        self.assertIsNone(game.seed)
+        game.shuffle_players()
+        names = [player.name for player in game.players]
+        players = self.players()
+        random.Random(5).shuffle(players)
+        self.assertEqual(names, [player.name for player in players])
+
+    def test_make_rng(self):
+        rng = random.Random(1)
+        self.assertIs(make_rng(rng), rng)
+        self.assertEqual(make_rng(9).random(), random.Random(9).random())
+        random.seed(4)
+        value = make_rng().random()
+        random.seed(4)
+        self.assertEqual(value, random.random())
+
+    def test_spawn_seed(self):
+        self.assertEqual(spawn_seed(1, 2), spawn_seed(1, 2))
+        self.assertNotEqual(spawn_seed(1, 2), spawn_seed(1, 3))
+        self.assertNotEqual(spawn_seed(1, 2), spawn_seed(2, 1))
+        self.assertNotEqual(spawn_seed(1, 2), spawn_seed(12))
+        self.assertLess(spawn_seed(1, 2), 1 << 64)
+
+    def test_match_game_seeds(self):
+        match = Match(self.players(), 1, rng=42)
+        self.assertEqual(match.seed, 42)
+        self.assertEqual(match.game_seed(3), spawn_seed(42, 3))
+        self.assertEqual(len({match.game_seed(number) for number in range(100)}), 100)
+        self.assertEqual(Match(self.players(), 1, random.Random(8)).seed, Match(self.players(), 1, random.Random(8)).seed)
+
+    def test_game_headless(self):
+        for num_players in (3, 4, 5):
+            players = [Player(f"P{i}", strategy=Strategy()) for i in range(num_players)]
+            game = Game(players, 5)
+            game.setup_game()
+            self.assertEqual(len({len(player.hand) for player in players}), 1)
+            game.play_game()
+            self.assertTrue(all(player.is_hand_empty for player in players))
+            self.assertEqual(sum(len(card_round.cards) for card_round in game.rounds), 78 - len(game.prize))
+
+    def test_match_headless(self):
+        players = [Player(f"P{i}", strategy=Strategy()) for i in range(3)]
+        match = Match(players, 2, rng=3)
+        match.play_match()
+        self.assertEqual(len(match.games), 6)
+
+    def test_match_scores(self):
+        players = [Player(f"P{i}", strategy=Strategy()) for i in range(4)]
+        match = Match(players, 1, rng=6)
+        match.play_match()
+        self.assertEqual(match.scores, {player.name: player.score for player in players})
+        self.assertEqual(sum(match.scores.values()), sum(player.score for player in players))
+
+    def test_match_parallel(self):
+        for num_players in (3, 5):
+            serial = Match([Player(f"P{i}", strategy=Strategy()) for i in range(num_players)], 2, rng=21)
+            serial.play_match()
+            parallel = Match([Player(f"P{i}", strategy=Strategy()) for i in range(num_players)], 2, rng=21)
+            parallel.play_match(processes=2)
+            self.assertEqual(parallel.scores, serial.scores)
+            self.assertEqual([player.name for player in parallel.players], [player.name for player in serial.players])
+            self.assertEqual([player.score for player in parallel.players], [player.score for player in serial.players])
+
+    def test_match_stream(self):
+        for num_players in (3, 4):
+            played = Match([Player(f"P{i}", strategy=Strategy()) for i in range(num_players)], 2, rng=33)
+            played.play_match()
+            streamed = Match([Player(f"P{i}", strategy=Strategy()) for i in range(num_players)], 2, rng=33)
+            summaries = list(streamed.stream())
+            self.assertEqual(streamed.games, [])
+            self.assertEqual(streamed.scores, played.scores)
+            self.assertEqual([player.name for player in streamed.players], [player.name for player in played.players])
+            for summary, game in zip(summaries, played.games):
+                self.assertIsInstance(summary, GameSummary)
+                self.assertEqual(summary.asking_player, game.asking_player.name)
+                self.assertEqual(summary.called_card, game.called_card)
+                for seat, name in enumerate(summary.players):
+                    player_id, points, debt, team = played.results.seat(summary.game_number, seat)
+                    self.assertEqual((points, debt), (summary.score_changes[name], summary.debts[name]))
+                self.assertEqual(summary.teams, tuple(tuple(player.name for player in team.players) for team in game.teams))
+
+    def test_match_stream_standings(self):
+        match = Match([Player(f"P{i}", strategy=Strategy()) for i in range(3)], 1, rng=4)
+        standings = {name: 0 for name in match.standings}
+        for summary in match.stream():
+            for name, points in summary.score_changes.items():
+                standings[name] += points
+            self.assertEqual(match.scores, standings)
+
+    def test_game_decisions(self):
+        players = [Player(f"P{i}", strategy=Strategy()) for i in range(4)]
+        played = Game(players, 12)
+        played.setup_game()
+        played.play_game()
+        expected = played.scores
+
+        game = Game([Player(f"P{i}", strategy=Strategy()) for i in range(4)], 12)
+        steps = game.decisions()
+        kinds = []
+        try:
+            decision = next(steps)
+            while True:
+                self.assertIsInstance(decision, Decision)
+                kinds.append(decision.kind)
+                decision = steps.send(game.answer(decision))
+        except StopIteration:
+            pass
+        self.assertEqual(game.scores, expected)
+        self.assertIs(kinds[0], DecisionKind.claim)
+        self.assertEqual(kinds.count(DecisionKind.discard), 2)
+        self.assertEqual(kinds.count(DecisionKind.play), 76)
+
+    def test_drive_games(self):
+        seeds = range(6)
+        expected = []
+        for seed in seeds:
+            game = Game([Player(f"P{i}", strategy=Strategy()) for i in range(3)], seed)
+            game.setup_game()
+            game.play_game()
+            expected.append(game.scores)
+        games = [Game([Player(f"P{i}", strategy=Strategy()) for i in range(3)], seed) for seed in seeds]
+        drive_games(games)
+        self.assertEqual([game.scores for game in games], expected)
+
+    def test_drive_games_policy(self):
+        batches = []
+        def policy(decisions):
+            batches.append(len(decisions))
+            return [True if decision.kind is DecisionKind.claim else decision.options[0] for decision in decisions]
+        games = [Game([Player(f"P{i}", strategy=Strategy()) for i in range(3)], seed) for seed in range(5)]
+        drive_games(games, policy)
+        self.assertEqual(batches[0], 5)
+        for game in games:
+            self.assertIs(game.asking_player, game.players[0])
+            self.assertEqual(sum(game.scores.values()), 0)
+
+    def test_game_apply_undo(self):
+        for num_players in (3, 4, 5):
+            game = Game([Player(f"P{i}", strategy=Strategy()) for i in range(num_players)], 8)
+            game.setup_game()
+            hands = [player.hand.mask for player in game.players]
+            won = [player.won_cards.mask for player in game.players]
+            moves = 0
+            while game.legal_moves():
+                player = game.to_move
+                card = game.legal_moves()[-1]
+                game.apply(card)
+                self.assertNotIn(card, player.hand)
+                moves += 1
+            self.assertEqual(moves, sum(bin(hand).count("1") for hand in hands))
+            self.assertEqual(len(game.rounds), moves // num_players)
+            self.assertEqual(sum(player.won_cards.value for player in game.players), 233)
+            for _ in range(moves):
+                game.undo()
+            self.assertEqual([player.hand.mask for player in game.players], hands)
+            self.assertEqual([player.won_cards.mask for player in game.players], won)
+            self.assertEqual(game.rounds, [])
+            self.assertRaises(IndexError, game.undo)
+
+    def test_game_apply_matches_play(self):
+        played = Game([Player(f"P{i}", strategy=Strategy()) for i in range(3)], 5)
+        played.setup_game()
+        applied = Game([Player(f"P{i}", strategy=Strategy()) for i in range(3)], 5)
+        applied.setup_game()
+        while not played.asking_player.is_hand_empty:
+            played.play_round()
+            for played_card in played.rounds[-1]:
+                applied.apply(played_card.card)
+            if applied.legal_moves(): #a move taken back leaves no trace
+                applied.apply(applied.legal_moves()[0])
+                applied.undo()
+        self.assertEqual([player.won_cards.mask for player in applied.players], [player.won_cards.mask for player in played.players])
+
+    def test_game_apply_illegal(self):
+        game = Game([Player(f"P{i}", strategy=Strategy()) for i in range(3)], 2)
+        game.setup_game()
+        game.apply(game.legal_moves()[0]) #the world: the second seat must answer with a tarot
+        illegal = [card for card in game.to_move.hand if card not in game.legal_moves()]
+        outside = [card for card in game.players[0].hand]
+        self.assertTrue(illegal)
+        self.assertRaises(ValueError, game.apply, illegal[0])
+        self.assertRaises(ValueError, game.apply, outside[0])
+
+    def test_game_zobrist(self):
+        for num_players in (3, 4, 5):
+            game = Game([Player(f"P{i}", strategy=Strategy()) for i in range(num_players)], 30)
+            game.setup_game()
+            start = game.zobrist
+            self.assertEqual(start, game.compute_zobrist())
+            keys = [start]
+            while game.legal_moves():
+                game.apply(game.legal_moves()[0])
+                self.assertEqual(game.zobrist, game.compute_zobrist())
+                keys.append(game.zobrist)
+            self.assertEqual(len(set(keys)), len(keys))
+            while keys:
+                self.assertEqual(game.zobrist, keys.pop())
+                if keys:
+                    game.undo()
+
+    def test_game_zobrist_play_round(self):
+        game = Game([Player(f"P{i}", strategy=Strategy()) for i in range(3)], 31)
+        game.setup_game()
+        while not game.asking_player.is_hand_empty:
+            game.play_round()
+            self.assertEqual(game.zobrist, game.compute_zobrist())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,51 @@
+import unittest
+from tarots import GameResults, Match, Player, Strategy, Card, Seed
+
+class TestGameResults(unittest.TestCase):
+
+    def players(self, num_players):
+        return [Player(f"P{i}", strategy=Strategy()) for i in range(num_players)]
+
+    def test_gameresults_empty_rows(self):
+        with GameResults(2) as results:
+            self.assertEqual(len(results), 2)
+            self.assertEqual(results.rows.shape, (2, GameResults.ROW_SIZE))
+            self.assertEqual(results.seat(1, 0), (-1, -1, -1, -1))
+            self.assertIsNone(results.called_card(0))
+            self.assertEqual(results.score_changes(0, ["P0"]), {})
+
+    def test_gameresults_shared(self):
+        results = GameResults(3, shared=True)
+        attached = GameResults(3, name=results.name)
+        attached.rows[2, GameResults.CALLED_CARD] = Card(Seed.cups, 14).index
+        attached.close()
+        results.unlink()
+        self.assertEqual(results.called_card(2), Card(Seed.cups, 14))
+        results.close()
+
+    def test_gameresults_match(self):
+        match = Match(self.players(4), 1, rng=13)
+        match.play_match()
+        names = ["P0", "P1", "P2", "P3"]
+        for game_number, game in enumerate(match.games):
+            results = match.results
+            self.assertEqual(results.called_card(game_number), game.called_card)
+            self.assertIs(game.players[results.asking_seat(game_number)], game.asking_player)
+            for seat, player in enumerate(game.players):
+                player_id, points, debt, team = results.seat(game_number, seat)
+                self.assertEqual(names[player_id], player.name)
+                self.assertEqual(debt, 63 if seat == results.asking_seat(game_number) else 57)
+                self.assertIn(player, game.teams[team].players)
+        total = {name: sum(match.results.score_changes(game_number, names)[name] for game_number in range(4)) for name in names}
+        self.assertEqual(total, match.scores)
+
+    def test_gameresults_parallel(self):
+        serial = Match(self.players(5), 1, rng=17)
+        serial.play_match()
+        parallel = Match(self.players(5), 1, rng=17)
+        parallel.play_match(processes=3)
+        self.assertIsNone(parallel.games or None)
+        self.assertEqual(parallel.results.rows.tolist(), serial.results.rows.tolist())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -83,5 +83,51 @@ class TestHand(unittest.TestCase):
         self.assertIn(Card(Seed.tarots, 1), combined_hand.cards)
         self.assertIn(Card(Seed.tarots, 2), combined_hand.cards)
 
+    def test_hand_mask(self):
+        self.assertEqual(self.hand.mask.bit_count(), 2)
+        self.assertEqual(Hand.from_mask(self.hand.mask).cards, self.hand.cards)
+        self.assertEqual(Hand.from_mask(0).cards, [])
+
+    def test_hand_order_kept_sorted(self):
+        hand = Hand([Card(Seed.cups, 2), Card(Seed.spades, 1), Card(Seed.tarots, 5), Card(Seed.cups, 1)])
+        hand.add_card(Card(Seed.coins, 12))
+        self.assertEqual(hand.cards, sorted(hand.cards, reverse=True))
+        self.assertEqual(hand[0], Card(Seed.tarots, 5))
+        self.assertEqual(hand[-1], Card(Seed.spades, 1))
+
+    def test_hand_seed_queries(self):
+        hand = Hand([Card(Seed.cups, 2), Card(Seed.cups, 1), Card(Seed.cups, 12), Card(Seed.spades, 3)])
+        self.assertTrue(hand.has_seed(Seed.cups))
+        self.assertFalse(hand.has_seed(Seed.coins))
+        self.assertTrue(hand.has_seeds([Seed.cups, Seed.spades]))
+        self.assertEqual(hand.cards_of_seed(Seed.cups).cards, [Card(Seed.cups, 12), Card(Seed.cups, 1), Card(Seed.cups, 2)])
+        self.assertEqual(hand.max_card_of_seed(Seed.cups), Card(Seed.cups, 12))
+        self.assertEqual(hand.min_card_of_seed(Seed.cups), Card(Seed.cups, 2))
+        self.assertEqual(hand.seed_mask(Seed.coins), 0)
+        with self.assertRaises(ValueError):
+            hand.max_card_of_seed(Seed.coins)
+
+    def test_hand_value_tracks_changes(self):
+        self.hand.add_card(Card(Seed.cups, 14))
+        self.assertEqual(self.hand.value, 12 + 13 + 13)
+        self.hand.add_card(Card(Seed.cups, 14))
+        self.assertEqual(self.hand.value, 12 + 13 + 13)
+        self.hand.remove_card(Card(Seed.tarots, 0))
+        self.assertEqual(self.hand.value, 13 + 13)
+        del self.hand[0]
+        self.assertEqual(self.hand.value, sum(card.value for card in self.hand))
+        self.hand.clear()
+        self.assertEqual(self.hand.value, 0)
+
+    def test_hand_value_of_union(self):
+        hand1 = Hand([Card(Seed.tarots, 0), Card(Seed.spades, 11)])
+        hand2 = Hand([Card(Seed.spades, 11), Card(Seed.coins, 14)])
+        self.assertEqual((hand1 + hand2).value, 12 + 4 + 13)
+        self.assertEqual(Hand.mask_value((hand1 + hand2).mask), 12 + 4 + 13)
+
+    def test_hand_remove_missing_card(self):
+        with self.assertRaises(ValueError):
+            self.hand.remove_card(Card(Seed.cups, 5))
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,72 @@
+import unittest
+from tarots import Game, Player, Strategy
+from ismcts import ISMCTSStrategy, SearchTree
+
+class TestISMCTS(unittest.TestCase):
+
+    def test_search_tree(self):
+        tree = SearchTree()
+        first = tree.add(0, 10, 0)
+        second = tree.add(0, 20, 0)
+        leaf = tree.add(second, 30, 1)
+        tree.visits[second] = 5
+        tree.reward[leaf] = 1.5
+        self.assertEqual(tree.child(0, 10), first)
+        self.assertEqual(tree.child(0, 20), second)
+        self.assertEqual(tree.child(0, 30), -1)
+        subtree = tree.subtree(second)
+        self.assertEqual(len(subtree), 2)
+        self.assertEqual(subtree.visits[0], 5)
+        self.assertEqual(subtree.reward[subtree.child(0, 30)], 1.5)
+        self.assertEqual(subtree.seat[subtree.child(0, 30)], 1)
+
+    def test_ismcts_plays_game(self):
+        bot = ISMCTSStrategy(time_budget=10, max_iterations=300, rng=1)
+        players = [Player("A", strategy=Strategy(1)), Player("Bot", strategy=bot), Player("C", strategy=Strategy(2))]
+        game = Game(players, 3)
+        game.setup_game()
+        checked = 0
+        while not game.asking_player.is_hand_empty:
+            tree, history = bot.tree, list(bot._history)
+            game.play_round()
+            if tree is None or bot._history == history: #no search this round: a single legal card
+                continue
+            #the new root is the node of the cards played since, with all its visits
+            node = 0
+            for rank in bot._history[len(history):]:
+                node = tree.child(node, rank)
+                if node < 0:
+                    break
+            self.assertEqual(bot.reused_visits, tree.visits[node] if node >= 0 else 0)
+            checked += 1
+        self.assertGreater(checked, 10) #including the middle of the deal
+        self.assertTrue(all(player.is_hand_empty for player in game.players))
+        self.assertEqual(bot.iterations, 300)
+        self.assertGreater(bot.iterations_per_second, 0)
+        self.assertLessEqual(len(bot.tree), 300*2)
+
+    def test_ismcts_new_deal(self):
+        bot = ISMCTSStrategy(time_budget=10, max_iterations=50, rng=2)
+        players = [Player("Bot", strategy=bot), Player("B", strategy=Strategy(1)), Player("C", strategy=Strategy(2))]
+        game = Game(players, 4)
+        game.setup_game()
+        game.play_round()
+        game.play_round()
+        game.reset(players, 5)
+        game.setup_game()
+        game.play_round()
+        self.assertEqual(bot.reused_visits, 0)
+
+    def test_ismcts_max_nodes(self):
+        bot = ISMCTSStrategy(time_budget=10, max_iterations=200, max_nodes=20, rng=3)
+        game = Game([Player("Bot", strategy=bot), Player("B", strategy=Strategy(1)), Player("C", strategy=Strategy(2))], 6)
+        game.setup_game()
+        game.play_round()
+        self.assertLessEqual(len(bot.tree), 20)
+        self.assertEqual(bot.iterations, 200)
+
+    def test_ismcts_errors(self):
+        self.assertRaises(ValueError, ISMCTSStrategy, time_budget=0)
+
+if __name__ == '__main__':
+    unittest.main()
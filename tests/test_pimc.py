@@ -0,0 +1,135 @@
+import pickle
+import random
+import time
+import unittest
+from tarots import Game, Player, Strategy, CARD_RANKS
+from pimc import PIMCStrategy, observe, rollout, sample_hands
+
+class TestPIMC(unittest.TestCase):
+
+    def game(self, seed, num_players=3):
+        game = Game([Player(f"P{i}", strategy=Strategy(seed + i)) for i in range(num_players)], seed)
+        game.setup_game()
+        return game
+
+    def test_observe(self):
+        game = self.game(1)
+        game.play_round()
+        game.apply(game.legal_moves()[0])
+        player = game.to_move
+        observation = observe(player, game)
+        self.assertEqual(observation.seat, 1)
+        self.assertEqual(observation.hand, player.hand.mask)
+        self.assertEqual(len(observation.trick), 1)
+        for played_card in game.rounds[0].played_cards:
+            self.assertFalse(observation.unseen >> CARD_RANKS[played_card.index] & 1)
+        self.assertFalse(observation.unseen & player.hand.mask)
+        self.assertEqual(observation.sizes, tuple(len(other.hand) for other in game.players))
+        hidden = sum(size for seat, size in enumerate(observation.sizes) if seat != 1)
+        self.assertGreaterEqual(observation.unseen.bit_count() + sum(mask.bit_count() for mask in observation.fixed), hidden)
+        if game.called_card is not None and game.asking_player is not player:
+            self.assertTrue(observation.fixed[game.players.index(game.asking_player)])
+
+    def test_sample_hands(self):
+        game = self.game(2, 4)
+        observation = observe(game.players[2], game)
+        rng = random.Random(0)
+        for _ in range(20):
+            hands = sample_hands(observation, rng)
+            self.assertEqual([hand.bit_count() for hand in hands], list(observation.sizes))
+            self.assertEqual(hands[2], game.players[2].hand.mask)
+            union = 0
+            for seat, hand in enumerate(hands):
+                self.assertFalse(union & hand)
+                self.assertEqual(hand & observation.fixed[seat], observation.fixed[seat])
+                union |= hand
+                if seat != 2:
+                    self.assertFalse(hand & ~(observation.unseen | observation.fixed[seat]))
+
+    def test_sample_hands_voids(self):
+        game = self.game(9)
+        while not any(game.players[seat].hand.mask and observe(game.players[0], game).excluded[seat] for seat in (1, 2)):
+            game.play_round()
+        observation = observe(game.players[0], game)
+        rng = random.Random(1)
+        for _ in range(20):
+            hands = sample_hands(observation, rng)
+            for seat in (1, 2):
+                self.assertFalse(hands[seat] & observation.excluded[seat] & ~observation.fixed[seat])
+
+    def test_rollout(self):
+        game = self.game(3)
+        hands = [player.hand.mask for player in game.players]
+        remaining = sum(player.hand.value for player in game.players)
+        self.assertEqual(rollout(hands.copy(), [True]*3, [], random.Random(1)), remaining)
+        mine = rollout(hands.copy(), [True, False, False], [], random.Random(1))
+        others = rollout(hands.copy(), [False, True, True], [], random.Random(1))
+        self.assertEqual(mine + others, remaining)
+
+    def test_pimc_plays_game(self):
+        bot = PIMCStrategy(samples=8, time_budget=None, rng=4)
+        game = Game([Player("Bot", strategy=bot), Player("B", strategy=Strategy(1)), Player("C", strategy=Strategy(2))], 5)
+        game.setup_game()
+        game.play_game()
+        self.assertTrue(all(player.is_hand_empty for player in game.players))
+        self.assertEqual(bot.last_samples, 8)
+
+    def test_pimc_evaluate(self):
+        game = self.game(6)
+        bot = PIMCStrategy(samples=16, time_budget=None, exact_cards=0, rng=1)
+        scores = bot.evaluate(game.to_move, game.legal_moves(), game)
+        self.assertEqual(set(scores), set(game.legal_moves()))
+        remaining = sum(player.hand.value for player in game.players)
+        self.assertTrue(all(0 <= score <= remaining for score in scores.values()))
+
+    def test_pimc_time_budget(self):
+        game = self.game(7)
+        bot = PIMCStrategy(samples=100000, time_budget=0.05, chunk_size=4, rng=1)
+        start = time.perf_counter()
+        bot.evaluate(game.to_move, game.legal_moves(), game)
+        self.assertLess(time.perf_counter() - start, 2)
+        self.assertGreater(bot.last_samples, 0)
+        self.assertLess(bot.last_samples, 100000)
+
+    def test_pimc_pool(self):
+        game = self.game(8)
+        bot = PIMCStrategy(samples=8, time_budget=None, workers=2, chunk_size=2, rng=1)
+        try:
+            scores = bot.evaluate(game.to_move, game.legal_moves(), game)
+            self.assertEqual(bot.last_samples, 8)
+            self.assertEqual(len(scores), len(game.legal_moves()))
+        finally:
+            bot.close()
+        copy = pickle.loads(pickle.dumps(bot))
+        self.assertEqual(copy.samples, 8)
+
+    def test_pimc_pool_same_deals(self):
+        game = self.game(10)
+        alone = PIMCStrategy(samples=8, time_budget=None, chunk_size=2, rng=3)
+        pooled = PIMCStrategy(samples=8, time_budget=None, workers=2, chunk_size=2, rng=3)
+        try: #the deals are drawn in this process, so the pool evaluates the same ones
+            self.assertEqual(pooled.evaluate(game.to_move, game.legal_moves(), game),
+                             alone.evaluate(game.to_move, game.legal_moves(), game))
+        finally:
+            pooled.close()
+
+    def test_pimc_pool_timeout(self):
+        game = self.game(9)
+        bot = PIMCStrategy(samples=400, time_budget=0.01, workers=2, chunk_size=40, exact_cards=0, rng=2)
+        try:
+            bot.evaluate(game.to_move, game.legal_moves(), game)
+            self.assertLess(bot.last_samples, 400)
+            stale = set(bot._running)
+            bot.evaluate(game.to_move, game.legal_moves(), game)
+            self.assertTrue(all(future.done() for future in stale)) #drained before the second decision started
+            self.assertGreater(bot.last_samples, 0)
+        finally:
+            bot.close()
+        self.assertFalse(bot._running)
+
+    def test_pimc_errors(self):
+        self.assertRaises(ValueError, PIMCStrategy, samples=0)
+        self.assertRaises(ValueError, PIMCStrategy, workers=0)
+
+if __name__ == '__main__':
+    unittest.main()
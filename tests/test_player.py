@@ -1,5 +1,6 @@
 import unittest
-from tarots import Player, Hand, Card, Seed  # Assuming these classes exist
+from unittest.mock import patch
+from tarots import Player, Hand, Card, Seed, Strategy, ConsoleStrategy  # Assuming these classes exist
 
 class TestPlayer(unittest.TestCase):
 
@@ -39,5 +40,26 @@ class TestPlayer(unittest.TestCase):
         self.player.clear_hand()
         self.assertEqual(len(self.player.hand.cards), 0)
 
+    def test_player_default_hand_not_shared(self):
+        player1, player2 = Player("Bob"), Player("Charlie")
+        player1.add_card(Card(Seed.cups, 3))
+        self.assertEqual(len(player2.hand), 0)
+
+    def test_player_console_strategy(self):
+        self.assertIsInstance(self.player.strategy, ConsoleStrategy)
+        with patch("builtins.input", return_value="2"), patch("builtins.print") as mock_print:
+            card = self.player.choose_own_card()
+        self.assertEqual(card, self.player.hand.cards[1])
+        mock_print.assert_any_call("Choose a card from your hand:")
+
+    def test_player_headless_strategy(self):
+        player = Player("Bob", Hand([Card(Seed.cups, 14), Card(Seed.cups, 2)]), Strategy(rng=1))
+        with patch("builtins.input") as mock_input, patch("builtins.print") as mock_print:
+            self.assertIn(player.choose_own_card(), player.hand.cards)
+            self.assertEqual(player.choose_own_card_for_prize(), Card(Seed.cups, 2)) #kings cannot be discarded
+            player.notify("ignored")
+        mock_input.assert_not_called()
+        mock_print.assert_not_called()
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,68 @@
+import itertools
+import random
+import time
+import unittest
+from collections import Counter
+from sampler import DealSampler
+
+class TestDealSampler(unittest.TestCase):
+
+    def brute_force(self, cards, sizes, excluded):
+        bits = [1 << bit for bit in range(cards.bit_length()) if cards >> bit & 1]
+        deals = []
+        for owners in itertools.product(range(len(sizes)), repeat=len(bits)):
+            deal = [0]*len(sizes)
+            for bit, owner in zip(bits, owners):
+                deal[owner] |= bit
+            if all(hand.bit_count() == size and not hand & mask for hand, size, mask in zip(deal, sizes, excluded)):
+                deals.append(tuple(deal))
+        return deals
+
+    def test_sampler_total(self):
+        rng = random.Random(0)
+        for _ in range(30):
+            cards = rng.getrandbits(9) | 1
+            count = cards.bit_count()
+            cut = sorted(rng.sample(range(count + 1), 2))
+            sizes = [cut[0], cut[1] - cut[0], count - cut[1]]
+            excluded = [rng.getrandbits(9) & rng.getrandbits(9) for _ in sizes]
+            deals = self.brute_force(cards, sizes, excluded)
+            if not deals:
+                self.assertRaises(ValueError, DealSampler, cards, sizes, excluded)
+                continue
+            self.assertEqual(DealSampler(cards, sizes, excluded).total, len(deals))
+
+    def test_sampler_uniform(self):
+        cards, sizes, excluded = 0b11111111, [3, 3, 2], [0b00000011, 0b00001100, 0b11000000]
+        deals = self.brute_force(cards, sizes, excluded)
+        sampler = DealSampler(cards, sizes, excluded)
+        self.assertEqual(sampler.total, len(deals))
+        draws = 200*len(deals)
+        counts = Counter(tuple(deal) for deal in sampler.sample_batch(draws, random.Random(1)))
+        self.assertEqual(set(counts), set(deals))
+        for deal in deals: #every deal within 30% of its expected 200 draws
+            self.assertLess(abs(counts[deal] - 200), 60)
+
+    def test_sampler_heavy_exclusions(self):
+        #5 players: four hidden hands of 12 and 3 discards, most players void in several seeds
+        rng = random.Random(2)
+        cards = (1 << 51) - 1
+        sizes = [12, 12, 12, 12, 3]
+        excluded = [(0x3FFF << 14*seat) & cards for seat in range(3)] + [0x1F, 0]
+        start = time.perf_counter()
+        sampler = DealSampler(cards, sizes, excluded)
+        deals = sampler.sample_batch(500, rng)
+        self.assertLess(time.perf_counter() - start, 10)
+        for deal in deals:
+            self.assertEqual([hand.bit_count() for hand in deal], sizes)
+            self.assertEqual(sum(deal), cards)
+            for hand, mask in zip(deal, excluded):
+                self.assertFalse(hand & mask)
+
+    def test_sampler_errors(self):
+        self.assertRaises(ValueError, DealSampler, 0b111, [1, 1], [0, 0])
+        self.assertRaises(ValueError, DealSampler, 0b11, [1, 1], [0b11, 0])
+        self.assertRaises(ValueError, DealSampler, 0b11, [1, 1], [0])
+
+if __name__ == '__main__':
+    unittest.main()
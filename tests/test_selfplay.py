@@ -0,0 +1,51 @@
+import unittest
+from tarots import SelfPlay, Match, Player, Strategy
+
+class TestSelfPlay(unittest.TestCase):
+
+    def players(self, num_players):
+        return [Player(f"P{i}", strategy=Strategy()) for i in range(num_players)]
+
+    def test_selfplay_report(self):
+        engine = SelfPlay(self.players(3), 1)
+        report = engine.play(10)
+        self.assertEqual(report["games"], 10)
+        self.assertEqual(engine.games_played, 10)
+        self.assertGreater(report["games_per_second"], 0)
+        self.assertEqual(set(report["scores"]), {"P0", "P1", "P2"})
+
+    def test_selfplay_matches_match(self):
+        for num_players in (3, 4, 5):
+            match_players = self.players(num_players)
+            Match(match_players, 2, rng=9).play_match()
+            engine = SelfPlay(self.players(num_players), 9)
+            engine.play(num_players)
+            engine.play(num_players)
+            self.assertEqual(engine.scores, {player.name: player.score for player in match_players})
+
+    def test_selfplay_reuses_state(self):
+        engine = SelfPlay(self.players(4), 2)
+        engine.play(1)
+        game, rounds = engine.game, list(engine.game.rounds)
+        engine.play(1)
+        self.assertIs(engine.game, game)
+        self.assertEqual([id(card_round) for card_round in engine.game.rounds], [id(card_round) for card_round in rounds])
+
+    def test_game_reset_new_players(self):
+        engine = SelfPlay(self.players(3), 3)
+        engine.play(2)
+        game = engine.game
+        cached = len(game._played_cards)
+        self.assertGreater(cached, 0)
+        game.reset(game.players[1:] + game.players[:1], 4) #the same players keep their played cards
+        self.assertEqual(len(game._played_cards), cached)
+        players = self.players(3)
+        game.reset(players, 5)
+        self.assertEqual(game._played_cards, {})
+        game.setup_game()
+        game.play_game()
+        self.assertGreater(len(game._played_cards), 0)
+        self.assertEqual({played.player for played in game._played_cards.values()} - set(players), set())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+import asyncio
+import socket
+import unittest
+from server import GameServer, SimulatedClient, load_test
+
+class TestServer(unittest.TestCase):
+
+    def test_server_inproc_table(self):
+        async def play():
+            server = GameServer(3, timeout=1.0, rng=1)
+            scores = await server.play_table([SimulatedClient(rng=seat) for seat in range(3)], ["A", "B", "C"])
+            return server, scores
+        server, scores = asyncio.run(play())
+        self.assertEqual(set(scores), {"A", "B", "C"})
+        self.assertEqual(sum(scores.values()), 0)
+        self.assertEqual(server.tables_played, 1)
+        self.assertEqual(server.fallbacks, 0)
+        self.assertGreater(len(server.latencies), 0)
+
+    def test_server_concurrent_tables(self):
+        report = asyncio.run(load_test(20, 4, rng=2))
+        self.assertEqual(report["tables"], 20)
+        self.assertEqual(report["fallbacks"], 0)
+        self.assertGreater(report["tables_per_core_second"], 0)
+
+    def test_server_timeout_fallback(self):
+        async def silent(request):
+            await asyncio.sleep(1)
+        async def play():
+            server = GameServer(3, timeout=0.001, rng=3)
+            scores = await server.play_table([silent, SimulatedClient(rng=1), SimulatedClient(rng=2)])
+            return server, scores
+        server, scores = asyncio.run(play())
+        self.assertEqual(sum(scores.values()), 0)
+        self.assertGreater(server.fallbacks, 0)
+
+    def test_server_tcp(self):
+        report = asyncio.run(load_test(3, 3, transport="tcp", rng=4))
+        self.assertEqual(report["tables"], 3)
+        self.assertEqual(report["fallbacks"], 0)
+
+    @unittest.skipUnless(hasattr(socket, "AF_UNIX"), "Unix sockets are not available")
+    def test_server_unix(self):
+        report = asyncio.run(load_test(3, 5, transport="unix", rng=5))
+        self.assertEqual(report["tables"], 3)
+
+    def test_server_bad_hello(self):
+        async def play():
+            server = GameServer(3, timeout=1.0, rng=6)
+            listener = await server.serve("127.0.0.1", 0)
+            port = listener.sockets[0].getsockname()[1]
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(b"not json\n")
+            await writer.drain()
+            closed = await asyncio.wait_for(reader.read(), 1.0) == b""
+            writer.close()
+            _, gone = await asyncio.open_connection("127.0.0.1", port) #joins, then leaves the lobby
+            gone.write(b'{"name": "Gone"}\n')
+            await gone.drain()
+            gone.close()
+            await gone.wait_closed()
+            await asyncio.sleep(0.05)
+            clients = [SimulatedClient(f"C{seat}", rng=seat) for seat in range(3)]
+            results = await asyncio.wait_for(asyncio.gather(*(client.connect("127.0.0.1", port) for client in clients)), 10.0)
+            listener.close()
+            await listener.wait_closed()
+            return server, closed, results
+        server, closed, results = asyncio.run(play())
+        self.assertTrue(closed)
+        self.assertEqual(set(results[0]), {"C0", "C1", "C2"})
+        self.assertEqual(server.fallbacks, 0)
+        self.assertEqual(server._lobby, [])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+import random
+import unittest
+from tarots import Game, Player, Strategy
+from solver import DoubleDummySolver
+
+class TestSolver(unittest.TestCase):
+
+    def endgame(self, num_players, seed, tricks_left, extra_cards=0):
+        game = Game([Player(f"P{i}", strategy=Strategy()) for i in range(num_players)], seed)
+        game.setup_game()
+        rng = random.Random(seed)
+        while len(game.players[0].hand.cards) > tricks_left or game.to_move is not game.players[0]:
+            game.apply(rng.choice(game.legal_moves()))
+        for _ in range(extra_cards):
+            game.apply(rng.choice(game.legal_moves()))
+        return game
+
+    def brute_force(self, game, asking):
+        moves = game.legal_moves()
+        if not moves:
+            return sum(player.won_cards.value for player in game.players if player in asking)
+        maximizing = game.to_move in asking
+        values = []
+        for card in moves:
+            game.apply(card)
+            values.append(self.brute_force(game, asking))
+            game.undo()
+        return max(values) if maximizing else min(values)
+
+    def test_solver_matches_brute_force(self):
+        for num_players, tricks_left in ((3, 4), (4, 3), (5, 2)):
+            for seed in range(4):
+                for extra_cards in (0, 1):
+                    game = self.endgame(num_players, seed, tricks_left, extra_cards)
+                    asking = game.find_team(game.asking_player).players
+                    already = sum(player.won_cards.value for player in game.players if player in asking)
+                    result = DoubleDummySolver.from_game(game).solve()
+                    self.assertEqual(already + result["asking"], self.brute_force(game, asking))
+                    remaining = sum(player.hand.value for player in game.players)
+                    if extra_cards:
+                        remaining += sum(played.card.value for played in game.current_round.played_cards)
+                    self.assertEqual(result["asking"] + result["opponents"], remaining)
+                    self.assertIn(result["best_card"], game.legal_moves())
+
+    def test_solver_best_card(self):
+        game = self.endgame(3, 9, 5)
+        asking = game.find_team(game.asking_player).players
+        value = sum(player.won_cards.value for player in asking) + DoubleDummySolver.from_game(game).solve()["asking"]
+        while game.legal_moves(): #following the best cards of both sides reaches the value
+            game.apply(DoubleDummySolver.from_game(game).solve()["best_card"])
+        self.assertEqual(sum(player.won_cards.value for player in asking), value)
+
+    def test_solver_endgame(self):
+        game = self.endgame(3, 1, 8)
+        solver = DoubleDummySolver.from_game(game)
+        result = solver.solve()
+        self.assertGreater(result["nodes"], 0)
+        self.assertGreater(len(solver.table), 0)
+        self.assertIn(result["best_card"], game.legal_moves())
+
+    def test_solver_errors(self):
+        self.assertRaises(ValueError, DoubleDummySolver, [[], []], [True])
+
+if __name__ == '__main__':
+    unittest.main()
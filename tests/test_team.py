@@ -31,5 +31,13 @@ class TestTeam(unittest.TestCase):
         self.team.remove_card(card)
         self.assertNotIn(card, self.team.won_cards.cards)
 
+    def test_team_value(self):
+        self.team.add_cards([Card(Seed.tarots, 21), Card(Seed.cups, 12)])
+        self.assertEqual(self.team.value, 13 + 7)
+        self.team.remove_card(Card(Seed.tarots, 21))
+        self.assertEqual(self.team.value, 7)
+        self.team.update_players_won_cards()
+        self.assertEqual(self.player1.value_won, 7)
+
 if __name__ == '__main__':
     unittest.main()
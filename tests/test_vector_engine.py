@@ -0,0 +1,99 @@
+import unittest
+from tarots import Card, CardRound, Hand, Seed, CARD_POINTS, _CARDS
+
+try:
+    import numpy as np
+    from vector_engine import VectorEngine
+except ImportError: #the engine needs NumPy
+    np = None
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class TestVectorEngine(unittest.TestCase):
+
+    def test_vector_engine_setup(self):
+        for num_players, hand_size in ((3, 25), (4, 19), (5, 15)):
+            engine = VectorEngine(num_players, 1)
+            engine.setup(200)
+            self.assertTrue((engine.hands.sum(axis=2) == hand_size).all())
+            self.assertFalse((engine.hands.sum(axis=1) > 1).any())
+            games = np.arange(200)
+            with_partner = engine.partner >= 0
+            self.assertFalse(engine.hands[games[with_partner], engine.partner[with_partner], engine.called[with_partner]].any())
+            self.assertTrue((engine.teams[games, engine.asking] == 0).all())
+            self.assertTrue((engine.teams[games[with_partner], engine.partner[with_partner]] == 0).all())
+            self.assertGreaterEqual(engine.called.max(), 0)
+
+    def test_vector_engine_rules(self):
+        for num_players in (3, 4, 5):
+            engine = VectorEngine(num_players, 2)
+            engine.play(50)
+            self.assertEqual(engine.score_changes.sum(), 0)
+            self.assertTrue((engine.won_points.sum(axis=1) == sum(CARD_POINTS)).all())
+            for game in range(50):
+                hands = [Hand([_CARDS[index] for index in np.flatnonzero(engine.start_hands[game, seat])]) for seat in range(num_players)]
+                won = [0]*num_players
+                for trick, winner in zip(engine.tricks[game], engine.trick_winners[game]):
+                    played: list[int] = []
+                    for seat, index in enumerate(trick.tolist()):
+                        lead = None
+                        for previous in played:
+                            if previous != 0:
+                                lead = _CARDS[previous].seed
+                                break
+                        legal = Hand.from_mask(CardRound.legal_mask(hands[seat].mask, lead))
+                        self.assertIn(_CARDS[index], legal)
+                        hands[seat].remove_card(_CARDS[index])
+                        played.append(index)
+                    self.assertEqual(CardRound.trick_winner(played), winner)
+                    won[winner] += sum(CARD_POINTS[index] for index in played)
+                asking = engine.asking[game]
+                self.assertEqual(engine.won_points[game].tolist()[asking] - won[asking], sum(CARD_POINTS) - sum(won))
+                teams = engine.teams[game].tolist()
+                for seat in range(num_players):
+                    if seat != asking:
+                        team_points = sum(points for other, points in enumerate(engine.won_points[game].tolist()) if teams[other] == teams[seat])
+                        self.assertEqual(engine.score_changes[game, seat], round((team_points - 57)/3))
+
+    def test_vector_engine_policy(self):
+        engine = VectorEngine(3, 3)
+        preferences = np.zeros(78)
+        preferences[Card(Seed.tarots, 21).index] = 1
+        engine.play(100, policy=preferences)
+        world = Card(Seed.tarots, 21).index
+        leads = engine.start_hands[:, 0, world]
+        self.assertTrue(leads.any())
+        self.assertTrue((engine.tricks[leads, 0, 0] == world).all())
+
+    def test_vector_engine_given_hand(self):
+        for num_players, hand_size in ((3, 25), (4, 19), (5, 15)):
+            engine = VectorEngine(num_players, 5)
+            hand = np.arange(10, 10 + hand_size)
+            engine.deal(100, 1, hand)
+            self.assertTrue((engine.hands[:, 1, hand]).all())
+            self.assertTrue((engine.hands[:, 1].sum(axis=1) == hand_size).all())
+            self.assertTrue((engine.hands.sum(axis=1) + engine.prize == 1).all())
+            engine.claim_prize(1)
+            self.assertTrue((engine.asking == 1).all())
+            with self.assertRaises(ValueError):
+                engine.deal(10, 0, hand[:-1])
+
+    def test_vector_engine_called_card(self):
+        engine = VectorEngine(5, 6)
+        king = Card(Seed.cups, 14).index
+        hand = np.arange(15)
+        engine.setup(100, 0, hand, 0, king)
+        self.assertTrue((engine.called == king).all())
+        self.assertTrue(engine.start_hands[~engine.prize[:, king], 0, king].all())
+        in_prize = engine.prize[:, king]
+        self.assertTrue((engine.partner[in_prize] == -1).all())
+        self.assertTrue((engine.partner[~in_prize] > 0).all())
+
+    def test_vector_engine_seeded(self):
+        first, second = VectorEngine(4, 7), VectorEngine(4, 7)
+        first.play(30)
+        second.play(30)
+        self.assertTrue((first.tricks == second.tricks).all())
+        self.assertGreater(first.games_per_second, 0)
+
+if __name__ == '__main__':
+    unittest.main()
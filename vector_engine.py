@@ -0,0 +1,430 @@
+from __future__ import annotations
+import time
+import numpy as np
+from tarots import Deck, Seed, CARD_POINTS, SEED_MASKS, TRICK_STRENGTH, FOOL_INDEX, _CARDS, _CARD_SEEDS, _RANK_BITS
+
+
+#lookup tables indexed by Card.index, as arrays. Seed rows follow Seed.value, the last row is "no lead seed yet"
+NUM_CARDS = len(_CARDS)
+NO_LEAD = len(Seed)
+CARD_POINTS_ARRAY = np.array(CARD_POINTS, dtype=np.int16)
+CARD_SEED_ARRAY = np.array([seed.value for seed in _CARD_SEEDS], dtype=np.int8)
+SEED_MASK_ARRAY = np.ones((NO_LEAD + 1, NUM_CARDS), dtype=bool)
+STRENGTH_ARRAY = np.zeros((NO_LEAD + 1, NUM_CARDS), dtype=np.int16)
+for _seed in Seed:
+    SEED_MASK_ARRAY[_seed.value] = [bool(SEED_MASKS[_seed] & _RANK_BITS[index]) for index in range(NUM_CARDS)]
+    STRENGTH_ARRAY[_seed.value] = TRICK_STRENGTH[_seed]
+SEED_MASK_COLUMNS = np.ascontiguousarray(SEED_MASK_ARRAY.T)
+TAROT_MASK = SEED_MASK_ARRAY[Seed.tarots.value]
+#the seeds are contiguous ranges of Card.index: the cards of a seed are the indices from its start to its end
+SEED_STARTS = np.array([np.flatnonzero(row)[0] for row in SEED_MASK_ARRAY], dtype=np.intp)
+SEED_ENDS = np.array([np.flatnonzero(row)[-1] + 1 for row in SEED_MASK_ARRAY], dtype=np.intp)
+TAROT_END = SEED_ENDS[Seed.tarots.value]
+CALLABLE_MASK = CARD_POINTS_ARRAY == 13 #the cards the asking player can call
+DISCARDABLE_MASK = ~CALLABLE_MASK | TAROT_MASK #the cards the asking player can discard after taking the prize
+MAGICIAN_INDEX = next(card.index for card in _CARDS if card.seed == Seed.tarots and card.number == 1)
+
+
+def make_generator(rng: np.random.Generator | int | None = None) -> np.random.Generator:
+    """
+    Return a NumPy generator: a generator is used as is, a seed or None builds a new one.
+    Args:
+        rng (np.random.Generator | int | None): The generator or seed.
+    Returns:
+        np.random.Generator: The generator.
+    Example:
+        >>> make_generator(42).integers(10) == make_generator(42).integers(10)
+        True
+    """
+
+    if isinstance(rng, np.random.Generator):
+        return rng
+    return np.random.default_rng(rng)
+
+
+class VectorEngine:
+    """
+    A lockstep engine that plays K games of Tarocchi at once on NumPy arrays instead of Game objects: the hands
+    are a [K, players, 78] boolean tensor indexed by Card.index and every step of the game (deal, prize claim,
+    card call, exchange, discards, each card of each trick, scoring) is applied to the K games together.
+    The rules are the ones of the object model: the layout of Deck.deal, the prize claimed by the first player
+    whose coin flip says so, the call of a card worth 13 and the exchange of Game.asking_player_card_request,
+    the discards of Player.choose_own_card_for_prize, the legal cards of CardRound.legal_mask, the trick winner
+    of CardRound.trick_winner and the points of Player.update_score. As in Game.play_round the first seat
+    leads every trick.
+    The decisions of the setup are uniformly random; the cards are played by a policy: uniformly random, or
+    table-driven, playing the legal card with the highest preference and breaking ties at random.
+    The engine draws from a NumPy generator, so it does not reproduce the deals of Game for the same seed.
+    Attributes:
+        num_players (int): The number of players of every game.
+        rng (np.random.Generator): The generator of the engine, used for every random choice.
+        hands (np.ndarray): The [K, players, 78] hands of the last batch, empty once the batch is played.
+        start_hands (np.ndarray): The [K, players, 78] hands of the last batch after the setup.
+        prize (np.ndarray): The [K, 78] prize of the last batch.
+        asking (np.ndarray): The seat of the asking player of each game.
+        called (np.ndarray): The index of the called card of each game, -1 if no card could be called.
+        partner (np.ndarray): The seat of the owner of the called card of each game, -1 if the asking player plays alone.
+        teams (np.ndarray): The [K, players] team of each seat, the team of the asking player is 0.
+        tricks (np.ndarray): The [K, tricks, players] indices of the cards played, in seat order.
+        trick_winners (np.ndarray): The [K, tricks] seat that took each trick.
+        won_points (np.ndarray): The [K, players] points of the cards won by each seat.
+        score_changes (np.ndarray): The [K, players] points made in the game by each seat.
+        games_played (int): The number of games played so far.
+        seconds (float): The time spent playing the games, in seconds.
+    Methods:
+        __init__(num_players: int, rng: np.random.Generator | int | None = None):
+            Initializes the engine with a number of players and a generator or seed.
+        __repr__():
+            Returns a string representation of the engine.
+        deal(num_games: int, seat: int | None = None, hand: np.ndarray | None = None):
+            Shuffle and deal K decks, optionally with a given hand at a seat.
+        claim_prize(asking: int | None = None):
+            Let the players of every game claim the prize, or give it to a seat.
+        call_card(called: int | None = None):
+            Let the asking players call a card, or a given card, take the prize and exchange a card with their partner.
+        discard():
+            Let the asking players discard as many cards as the prize had.
+        setup(num_games: int, seat: int | None = None, hand: np.ndarray | None = None, asking: int | None = None,
+              called: int | None = None):
+            Deal and set up K games.
+        legal_mask(seat: int, lead: np.ndarray) -> np.ndarray:
+            Get the legal cards of a seat in every game.
+        choose(mask: np.ndarray, preferences: np.ndarray | None = None) -> np.ndarray:
+            Choose a card among the cards of a mask in every game.
+        play_tricks(policy: np.ndarray | None = None):
+            Play every trick of the K games.
+        score():
+            Score the K games.
+        play(num_games: int, policy: np.ndarray | None = None) -> dict:
+            Play K complete games and report the throughput.
+        games_per_second() -> float:
+            Get the number of games played per second so far.
+    """
+
+    def __init__(self, num_players: int, rng: np.random.Generator | int | None = None):
+        if num_players < 3 or num_players > 5:
+            raise ValueError("Number of players must be between 3 and 5")
+        self.num_players = num_players
+        self.rng = make_generator(rng)
+        self.prize_size = 2 if num_players == 4 else 3
+        initial_draw = 4 if num_players == 4 else 5
+        prize_positions, hands_positions = Deck._deal_layout(num_players, NUM_CARDS, self.prize_size, initial_draw)
+        self._owners = np.empty(NUM_CARDS, dtype=np.intp) #seat of each deck position, num_players for the prize
+        self._owners[prize_positions] = num_players
+        for seat, positions in enumerate(hands_positions):
+            self._owners[positions] = seat
+        self.num_tricks = len(hands_positions[0])
+        self.games_played = 0
+        self.seconds = 0.0
+        self.hands = np.zeros((0, num_players, NUM_CARDS), dtype=bool)
+        self._counts = np.zeros((NUM_CARDS + 1, 0), dtype=np.int8)
+
+    def __repr__(self):
+        text = f"Players: {self.num_players}\n"
+        text += f"Games played: {self.games_played}\n"
+        text += f"Games per second: {self.games_per_second:.1f}\n"
+        return text
+
+    def deal(self, num_games: int, seat: int | None = None, hand: np.ndarray | None = None) -> None:
+        """
+        Shuffle K decks and deal them with the layout of Deck.deal. A hand can be given to a seat in every game:
+        only the other cards are shuffled, into the other hands and the prize.
+        Args:
+            num_games (int): The number of games K.
+            seat (int | None): The seat of the given hand, None to deal every card at random.
+            hand (np.ndarray | None): The indices of the cards of the given hand, as many as the seat is dealt.
+        Raises:
+            ValueError: If the hand does not have the size of the hands dealt.
+        """
+
+        if hand is None or seat is None:
+            order = self.rng.random((num_games, NUM_CARDS)).argsort(axis=1) #a random permutation of the cards per game
+        else:
+            cards = np.zeros(NUM_CARDS, dtype=bool)
+            cards[np.asarray(hand, dtype=np.intp)] = True
+            fixed = self._owners == seat
+            if cards.sum() != fixed.sum():
+                raise ValueError(f"Seat {seat} is dealt {fixed.sum()} cards, not {cards.sum()}")
+            rest = np.flatnonzero(~cards)
+            order = np.empty((num_games, NUM_CARDS), dtype=np.intp) #the card at every position of the deck
+            order[:, fixed] = np.flatnonzero(cards)
+            order[:, ~fixed] = rest[self.rng.random((num_games, len(rest))).argsort(axis=1)]
+        games = np.arange(num_games)[:, None]
+        #stored as [players + 1, 78, K], so that the cards of a seat are contiguous for every game: the last place is the prize
+        places = np.zeros((self.num_players + 1, NUM_CARDS, num_games), dtype=bool)
+        places[self._owners[None, :], order, games] = True
+        self._hands = places[:self.num_players]
+        self.hands = self._hands.transpose(2, 0, 1)
+        self.prize = places[self.num_players].T
+        self.won_points = np.zeros((num_games, self.num_players), dtype=np.int16)
+        return None
+
+    def claim_prize(self, asking: int | None = None) -> None:
+        """
+        Let the players claim the prize in seat order with a coin flip, as Strategy.choice_bool does. A deal
+        nobody claims is dealt again in Game.setup_game; the coin flips do not depend on the cards, so only
+        the flips of those games are drawn again.
+        Args:
+            asking (int | None): The seat that claims the prize in every game, None for the coin flips.
+        """
+
+        num_games = len(self.hands)
+        if asking is not None:
+            self.asking = np.full(num_games, asking, dtype=np.intp)
+            return None
+        asking = np.full(num_games, -1, dtype=np.intp)
+        pending = np.arange(num_games)
+        while len(pending):
+            flips = self.rng.random((len(pending), self.num_players)) < 0.5
+            claimed = flips.any(axis=1)
+            asking[pending[claimed]] = flips[claimed].argmax(axis=1)
+            pending = pending[~claimed]
+        self.asking = asking
+        return None
+
+    def call_card(self, called: int | None = None) -> None:
+        """
+        Let the asking players call a card worth 13 they do not hold, the magician only if nothing else is left,
+        then take the prize. If the card is in the prize or nothing can be called they play alone, otherwise
+        they give a card of their hand to the owner of the called card in exchange for it and play with them.
+        Args:
+            called (int | None): The index of the card called in every game, a card worth 13 no asking player
+                holds, None for a random call.
+        """
+
+        num_games = len(self.hands)
+        games = np.arange(num_games)
+        asking = self.asking
+        asking_hands = self.hands[games, asking]
+
+        if called is None:
+            available = CALLABLE_MASK & ~asking_hands
+            counts = available.sum(axis=1)
+            available[counts > 1, MAGICIAN_INDEX] = False
+            can_call = counts > 0
+            called = np.where(can_call, self.choose(available), -1)
+        else:
+            can_call = np.ones(num_games, dtype=bool)
+            called = np.full(num_games, called, dtype=np.intp)
+        alone = ~can_call | self.prize[games, np.maximum(called, 0)]
+
+        asking_hands |= self.prize #assign the prize
+        self.hands[games, asking] = asking_hands
+
+        partner = np.where(alone, -1, self.hands[games, :, np.maximum(called, 0)].argmax(axis=1))
+        with_partner = np.flatnonzero(~alone)
+        given = self.choose(asking_hands[with_partner])
+        self.hands[with_partner, asking[with_partner], given] = False
+        self.hands[with_partner, partner[with_partner], given] = True
+        self.hands[with_partner, partner[with_partner], called[with_partner]] = False
+        self.hands[with_partner, asking[with_partner], called[with_partner]] = True
+
+        seats = np.arange(self.num_players)[None, :]
+        in_asking_team = (seats == asking[:, None]) | (seats == partner[:, None])
+        if self.num_players == 4: #every opponent of a called partner plays alone
+            opponents = np.where(alone[:, None], 1, (~in_asking_team).cumsum(axis=1))
+        else:
+            opponents = 1
+        self.teams = np.where(in_asking_team, 0, opponents).astype(np.int8)
+        self.called = called
+        self.partner = partner
+        return None
+
+    def discard(self) -> None:
+        """
+        Let the asking players discard, one at a time, as many cards as the prize had into their won cards: the
+        cards worth 13 can only be discarded if they are tarots.
+        """
+
+        games = np.arange(len(self.hands))
+        for _ in range(self.prize_size):
+            asking_hands = self.hands[games, self.asking]
+            card = self.choose(asking_hands & DISCARDABLE_MASK)
+            self.hands[games, self.asking, card] = False
+            self.won_points[games, self.asking] += CARD_POINTS_ARRAY[card]
+        return None
+
+    def setup(self, num_games: int, seat: int | None = None, hand: np.ndarray | None = None,
+              asking: int | None = None, called: int | None = None) -> None:
+        """
+        Deal and set up K games, as Game.setup_game does.
+        Args:
+            num_games (int): The number of games K.
+            seat (int | None): The seat of a hand given in every game, see deal.
+            hand (np.ndarray | None): The indices of the cards of the given hand, see deal.
+            asking (int | None): The seat that claims the prize in every game, None for the coin flips.
+            called (int | None): The index of the card called in every game, see call_card.
+        """
+
+        self.deal(num_games, seat, hand)
+        self.claim_prize(asking)
+        self.call_card(called)
+        self.discard()
+        self.start_hands = self.hands.copy()
+        return None
+
+    def legal_mask(self, seat: int, lead: np.ndarray) -> np.ndarray:
+        """
+        Get the cards a seat can play in every game, as CardRound.legal_mask: the cards of the lead seed if
+        there are any, otherwise the tarots if there are any, otherwise the whole hand.
+        Args:
+            seat (int): The seat that has to play.
+            lead (np.ndarray): The lead seed of the trick of each game, as Seed.value, NO_LEAD if there is none.
+        Returns:
+            np.ndarray: The [K, 78] legal cards.
+        """
+
+        hands = self._hands[seat]
+        follow = hands & SEED_MASK_COLUMNS[:, lead]
+        allowed = np.where(follow.any(axis=0), lead, np.where(hands[TAROT_MASK].any(axis=0), Seed.tarots.value, NO_LEAD))
+        return (hands & SEED_MASK_COLUMNS[:, allowed]).T
+
+    def _count_up(self, columns: np.ndarray) -> np.ndarray:
+        """
+        Count the cards of every game up to each index, one vectorised addition per card: row i of the result
+        is the number of cards with an index lower than i, so the last row is the number of cards.
+        Args:
+            columns (np.ndarray): The [78, K] cards.
+        Returns:
+            np.ndarray: The [79, K] counts, in a buffer reused by the next call.
+        """
+
+        num_games = columns.shape[1]
+        counts = self._counts
+        if counts.shape[1] != num_games:
+            counts = self._counts = np.zeros((NUM_CARDS + 1, num_games), dtype=np.int8)
+        cards = columns.view(np.int8)
+        for index in range(NUM_CARDS): #much faster than cumsum along the first axis
+            np.add(counts[index], cards[index], out=counts[index + 1])
+        return counts
+
+    def choose(self, mask: np.ndarray, preferences: np.ndarray | None = None) -> np.ndarray:
+        """
+        Choose a card among the cards of a mask in every game: uniformly at random, or the card with the highest
+        preference, breaking ties at random.
+        Args:
+            mask (np.ndarray): The [K, 78] cards that can be chosen, at least one per game.
+            preferences (np.ndarray | None): The preference of each card, [78] or [K, 78], None for a random choice.
+        Returns:
+            np.ndarray: The index of the chosen card of each game.
+        """
+
+        columns = mask.T
+        if preferences is not None:
+            masked = np.where(columns, np.asarray(preferences).T.reshape(NUM_CARDS, -1), -np.inf)
+            columns = columns & (masked == masked.max(axis=0))
+        counts = self._count_up(columns)
+        picks = (self.rng.random(columns.shape[1])*counts[NUM_CARDS]).astype(np.int8) #the position among the candidates
+        return np.count_nonzero(counts[1:] <= picks, axis=0)
+
+    def _play_random_card(self, seat: int, lead: np.ndarray, games: np.ndarray) -> np.ndarray:
+        """
+        Choose a legal card of a seat at random in every game without building the legal mask: the seeds are
+        contiguous ranges of Card.index, so the counts of the hand give the legal cards of each game as a range.
+        Args:
+            seat (int): The seat that has to play.
+            lead (np.ndarray): The lead seed of the trick of each game, as Seed.value, NO_LEAD if there is none.
+            games (np.ndarray): The positions of the games, np.arange(K).
+        Returns:
+            np.ndarray: The index of the chosen card of each game.
+        """
+
+        counts = self._count_up(self._hands[seat])
+        following = counts[SEED_ENDS[lead], games] > counts[SEED_STARTS[lead], games]
+        allowed = np.where(following, lead, np.where(counts[TAROT_END] > 0, Seed.tarots.value, NO_LEAD))
+        before = counts[SEED_STARTS[allowed], games]
+        candidates = counts[SEED_ENDS[allowed], games] - before
+        picks = before + (self.rng.random(len(games))*candidates).astype(np.int8)
+        return np.count_nonzero(counts[1:] <= picks, axis=0)
+
+    def play_tricks(self, policy: np.ndarray | None = None) -> None:
+        """
+        Play every trick of the K games: each seat in turn plays a legal card chosen by the policy, the lead
+        seed is the seed of the first card that is not the fool and the card with the highest TRICK_STRENGTH
+        takes the trick and its points.
+        Args:
+            policy (np.ndarray | None): The preferences of the cards, [78] for every seat or [players, 78] per
+                seat, None to play at random.
+        """
+
+        num_games = len(self.hands)
+        games = np.arange(num_games)
+        num_players = self.num_players
+        if policy is not None:
+            policy = np.broadcast_to(np.asarray(policy, dtype=np.float64), (num_players, NUM_CARDS))
+        self.tricks = np.empty((num_games, self.num_tricks, num_players), dtype=np.int8)
+        self.trick_winners = np.empty((num_games, self.num_tricks), dtype=np.int8)
+
+        for trick in range(self.num_tricks):
+            lead = np.full(num_games, NO_LEAD, dtype=np.intp)
+            cards = self.tricks[:, trick]
+            for seat in range(num_players):
+                if policy is None:
+                    card = self._play_random_card(seat, lead, games)
+                else:
+                    card = self.choose(self.legal_mask(seat, lead), policy[seat])
+                self._hands[seat, card, games] = False
+                cards[:, seat] = card
+                lead = np.where((lead == NO_LEAD) & (card != FOOL_INDEX), CARD_SEED_ARRAY[card], lead)
+
+            indices = cards.astype(np.intp)
+            winner = STRENGTH_ARRAY[lead[:, None], indices].argmax(axis=1)
+            self.trick_winners[:, trick] = winner
+            self.won_points[games, winner] += CARD_POINTS_ARRAY[indices].sum(axis=1, dtype=np.int16)
+        return None
+
+    def score(self) -> None:
+        """
+        Score the K games as Game.update_score: the players of a team share their won cards, every player who
+        is not asking makes round((team points - 57)/3) and the asking player loses what the others made.
+        """
+
+        same_team = self.teams[:, :, None] == self.teams[:, None, :]
+        team_points = (same_team*self.won_points[:, None, :]).sum(axis=2)
+        changes = np.round((team_points - 19*3)/3).astype(np.int32)
+        games = np.arange(len(changes))
+        changes[games, self.asking] = 0
+        changes[games, self.asking] = -changes.sum(axis=1)
+        self.score_changes = changes
+        return None
+
+    def play(self, num_games: int, policy: np.ndarray | None = None) -> dict:
+        """
+        Play K complete games in lockstep.
+        Args:
+            num_games (int): The number of games K.
+            policy (np.ndarray | None): The preferences of the cards, see play_tricks.
+        Returns:
+            dict: The number of games played, the seconds taken, the games per second and the total points made
+                by each seat.
+        Example:
+            >>> engine = VectorEngine(3, 42)
+            >>> report = engine.play(10000)
+            >>> report["games"]
+            10000
+        """
+
+        start = time.perf_counter()
+        self.setup(num_games)
+        self.play_tricks(policy)
+        self.score()
+        seconds = time.perf_counter() - start
+        self.games_played += num_games
+        self.seconds += seconds
+
+        return {
+            "games": num_games,
+            "seconds": seconds,
+            "games_per_second": num_games/seconds if seconds else 0.0,
+            "scores": self.score_changes.sum(axis=0).tolist(),
+        }
+
+    @property
+    def games_per_second(self) -> float:
+        """
+        Get the number of games played per second so far.
+        Returns:
+            float: The games per second, 0 if no game was played.
+        """
+
+        return self.games_played/self.seconds if self.seconds else 0.0